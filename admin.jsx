@@ -0,0 +1,1238 @@
+/**
+ * Studio Portal for app.py, kept out of the visitor bundle: App loads this
+ * module with React.lazy the first time the portal is opened. Bundle the
+ * client.jsx entry with code splitting so it lands in a chunk of its own:
+ *
+ *   npx esbuild client.jsx --bundle --splitting --format=esm --loader:.py=jsx --outdir=build/app
+ */
+import React, { useState, useEffect, useRef, useMemo, useCallback } from 'react';
+import {
+  collection,
+  doc,
+  getDocs,
+  addDoc,
+  onSnapshot,
+  deleteDoc,
+  writeBatch,
+  runTransaction,
+  query,
+  where,
+  orderBy,
+  limit,
+  startAfter,
+  documentId
+} from 'firebase/firestore';
+import { ref as storageRef, uploadBytes, getDownloadURL, deleteObject } from 'firebase/storage';
+import { Trash2, LogOut, Image as ImageIcon, Sparkles, Loader2, Upload, Download } from 'lucide-react';
+import {
+  db,
+  storage,
+  appId,
+  recordMetric,
+  reportError,
+  getMetricSummaries,
+  getGeminiCacheStats,
+  newClientId,
+  createInlineWorker,
+  imageVariant,
+  PLACEHOLDER_WIDTH,
+  ResponsiveImage,
+  SanoraLogo,
+  profiled,
+  BLURB_BATCH_SIZE,
+  runTemplate,
+  runWithConcurrency,
+  useProjectSearch,
+  ProjectSearchBar,
+  dataRef,
+  dayKey,
+  sumStats,
+  addStats,
+  leadDays,
+  defaultProjects
+} from './app.py';
+
+// --- Image Uploads ---
+// Uploaded originals are decoded, resized and re-encoded off the main thread,
+// then stored as fixed-width variants alongside a blur-up placeholder.
+const UPLOAD_WIDTHS = [480, 960, 1600];
+const UPLOAD_QUALITY = 0.8;
+
+function imageWorkerMain() {
+  self.onmessage = async ({ data: { requestId, file, widths, placeholderWidth, quality } }) => {
+    try {
+      const bitmap = await createImageBitmap(file);
+      const draw = (width) => {
+        const height = Math.max(1, Math.round(bitmap.height * width / bitmap.width));
+        const canvas = new OffscreenCanvas(width, height);
+        const ctx = canvas.getContext('2d');
+        ctx.drawImage(bitmap, 0, 0, width, height);
+        return { canvas, ctx, width, height };
+      };
+
+      const variants = [];
+      for (const width of [...new Set(widths.map(w => Math.min(w, bitmap.width)))]) {
+        const { canvas, height } = draw(width);
+        let blob = await canvas.convertToBlob({ type: 'image/webp', quality });
+        if (blob.type !== 'image/webp') blob = await canvas.convertToBlob({ type: 'image/jpeg', quality });
+        variants.push({ width, height, blob });
+      }
+
+      const thumb = draw(placeholderWidth);
+      const pixels = thumb.ctx.getImageData(0, 0, thumb.width, thumb.height).data;
+      const totals = [0, 0, 0];
+      for (let i = 0; i < pixels.length; i += 4) {
+        totals[0] += pixels[i];
+        totals[1] += pixels[i + 1];
+        totals[2] += pixels[i + 2];
+      }
+      const count = pixels.length / 4;
+      const thumbBlob = await thumb.canvas.convertToBlob({ type: 'image/jpeg', quality: 0.6 });
+
+      self.postMessage({
+        requestId,
+        width: bitmap.width,
+        height: bitmap.height,
+        variants,
+        placeholderColor: '#' + totals.map(c => Math.round(c / count).toString(16).padStart(2, '0')).join(''),
+        placeholderImage: new FileReaderSync().readAsDataURL(thumbBlob)
+      });
+    } catch (err) {
+      self.postMessage({ requestId, error: err.message });
+    }
+  };
+}
+
+let imageWorker = null;
+const imageRequests = new Map();
+let imageRequestId = 0;
+
+function processImage(file) {
+  if (!imageWorker) {
+    imageWorker = createInlineWorker([], imageWorkerMain);
+    imageWorker.onmessage = ({ data }) => {
+      const { resolve, reject } = imageRequests.get(data.requestId);
+      imageRequests.delete(data.requestId);
+      data.error ? reject(new Error(data.error)) : resolve(data);
+    };
+    imageWorker.onerror = (event) => {
+      imageRequests.forEach(({ reject }) => reject(new Error(event.message || 'Image worker failed')));
+      imageRequests.clear();
+    };
+  }
+  return new Promise((resolve, reject) => {
+    imageRequests.set(++imageRequestId, { resolve, reject });
+    imageWorker.postMessage({ requestId: imageRequestId, file, widths: UPLOAD_WIDTHS, placeholderWidth: PLACEHOLDER_WIDTH, quality: UPLOAD_QUALITY });
+  });
+}
+
+/**
+ * Deletes the uploaded files behind a project's `variants`; images hosted
+ * outside the app's bucket, and files already gone, are skipped.
+ */
+function deleteProjectImages(variants) {
+  const bucket = storageRef(storage).bucket;
+  return Promise.all((Array.isArray(variants) ? variants : []).map(variant => {
+    const url = variant?.url;
+    if (typeof url !== 'string') return null;
+    let ref;
+    try {
+      ref = storageRef(storage, url);
+    } catch (err) { return null; } // not a Cloud Storage URL
+    if (ref.bucket !== bucket) return null;
+    return deleteObject(ref).catch(err => {
+      if (err.code !== 'storage/object-not-found') throw err;
+    });
+  }));
+}
+
+/**
+ * Resizes `file` into UPLOAD_WIDTHS variants and uploads them in parallel to
+ * Cloud Storage with long-lived cache headers. Resolves with the fields to
+ * store on the project document; if any variant fails, the ones already
+ * uploaded are deleted again.
+ */
+async function uploadProjectImage(file, onProgress) {
+  const processed = await processImage(file);
+  const uploadId = newClientId();
+  let done = 0;
+  onProgress?.({ done, total: processed.variants.length });
+
+  const uploads = await Promise.allSettled(processed.variants.map(async ({ width, height, blob }) => {
+    const extension = blob.type === 'image/webp' ? 'webp' : 'jpg';
+    const ref = storageRef(storage, `artifacts/${appId}/projects/${uploadId}/${width}.${extension}`);
+    await uploadBytes(ref, blob, { contentType: blob.type, cacheControl: 'public, max-age=31536000, immutable' });
+    const url = await getDownloadURL(ref);
+    onProgress?.({ done: ++done, total: processed.variants.length });
+    recordMetric('upload.variant_bytes', blob.size);
+    return { width, height, url };
+  }));
+  const variants = uploads.filter(u => u.status === 'fulfilled').map(u => u.value);
+  const failed = uploads.find(u => u.status === 'rejected');
+  if (failed) {
+    await deleteProjectImages(variants).catch(err => reportError(err, 'upload-cleanup'));
+    throw failed.reason;
+  }
+
+  recordMetric('upload.original_bytes', file.size);
+  return {
+    image: variants[variants.length - 1].url,
+    variants,
+    width: processed.width,
+    height: processed.height,
+    placeholderColor: processed.placeholderColor,
+    placeholderImage: processed.placeholderImage
+  };
+}
+
+/**
+ * Samples an image into a tiny blur-up thumbnail and its average color.
+ * Resolves with {} when the host doesn't allow cross-origin pixel reads.
+ */
+function extractPlaceholder(src) {
+  return new Promise((resolve) => {
+    const img = new Image();
+    img.crossOrigin = 'anonymous';
+    img.onload = () => {
+      try {
+        const canvas = document.createElement('canvas');
+        canvas.width = PLACEHOLDER_WIDTH;
+        canvas.height = Math.max(1, Math.round(PLACEHOLDER_WIDTH * img.naturalHeight / img.naturalWidth));
+        const ctx = canvas.getContext('2d');
+        ctx.drawImage(img, 0, 0, canvas.width, canvas.height);
+        const pixels = ctx.getImageData(0, 0, canvas.width, canvas.height).data;
+        const totals = [0, 0, 0];
+        for (let i = 0; i < pixels.length; i += 4) {
+          totals[0] += pixels[i];
+          totals[1] += pixels[i + 1];
+          totals[2] += pixels[i + 2];
+        }
+        const count = pixels.length / 4;
+        resolve({
+          placeholderColor: '#' + totals.map(c => Math.round(c / count).toString(16).padStart(2, '0')).join(''),
+          placeholderImage: canvas.toDataURL('image/jpeg', 0.6)
+        });
+      } catch (err) { resolve({}); }
+    };
+    img.onerror = () => resolve({});
+    img.src = imageVariant(src, 64) || src;
+  });
+}
+
+// --- Marketing Copy ---
+const BLURB_CONCURRENCY = 3;
+
+function parseBlurbs(text) {
+  try {
+    const items = JSON.parse(text.replace(/^```(?:json)?\s*|\s*```$/g, ''));
+    return Object.fromEntries((Array.isArray(items) ? items : [])
+      .filter(item => item?.id && typeof item.blurb === 'string' && item.blurb.trim())
+      .map(item => [String(item.id), item.blurb.trim()]));
+  } catch (err) { return {}; }
+}
+
+
+/**
+ * Generates blurbs for many projects with a few JSON-mode requests of up to
+ * BLURB_BATCH_SIZE projects, at most BLURB_CONCURRENCY in flight. Projects a
+ * batch fails to return are retried one by one. `onBatch` receives an
+ * { [projectId]: blurb } map as each batch lands; resolves with the projects
+ * that still have no blurb.
+ */
+async function generateBlurbs(projects, { onBatch } = {}) {
+  const batches = [];
+  for (let i = 0; i < projects.length; i += BLURB_BATCH_SIZE) batches.push(projects.slice(i, i + BLURB_BATCH_SIZE));
+
+  const missing = [];
+  await runWithConcurrency(batches, BLURB_CONCURRENCY, async (batch) => {
+    let blurbs = {};
+    try {
+      const text = await runTemplate('blurbBatch', batch);
+      blurbs = parseBlurbs(text || '');
+    } catch (err) { reportError(err, 'bulk-copy'); }
+    const found = Object.fromEntries(batch.filter(p => blurbs[p.id]).map(p => [p.id, blurbs[p.id]]));
+    if (Object.keys(found).length) onBatch?.(found);
+    missing.push(...batch.filter(p => !found[p.id]));
+  });
+
+  const failed = [];
+  await runWithConcurrency(missing, BLURB_CONCURRENCY, async (project) => {
+    try {
+      const blurb = await runTemplate('blurb', project);
+      if (!blurb) throw new Error('Empty blurb');
+      onBatch?.({ [project.id]: blurb });
+    } catch (err) {
+      reportError(err, 'bulk-copy');
+      failed.push(project);
+    }
+  });
+  return failed;
+}
+
+const isDefaultProject = (project) => defaultProjects.some(d => d.id === project.id);
+
+// --- Lead Analytics ---
+// The Studio Portal's side of the lead counters in app.py. Imports and deletes
+// of leads read what is stored first, so the counters follow the documents
+// that actually changed. Each lead is its own transaction, marked with
+// `lastLead` like a visitor's submission, because firestore.rules checks every
+// counter change against the one lead it names; they run LEAD_CONCURRENCY at a
+// time, over chunks of STATS_CHUNK for progress and retries.
+const STATS_CHUNK = 200;
+const LEAD_CONCURRENCY = 5;
+const STATS_HISTORY_DAYS = 84;
+const DAY_MS = 1000 * 60 * 60 * 24;
+
+/** Writes one lead, moving the counters from any lead it replaces to the new data. */
+function putLead({ id, data }) {
+  return runTransaction(db, async (tx) => {
+    const ref = dataRef('leads', id);
+    const stored = await tx.get(ref);
+    const days = leadDays(stored.exists() ? [stored.data()] : [], -1);
+    leadDays([data], 1, days);
+    tx.set(ref, data);
+    addStats(tx, days, { lastLead: id });
+  });
+}
+
+/** Deletes one lead, if it still exists, and takes it off the counters. */
+function removeLead(id) {
+  return runTransaction(db, async (tx) => {
+    const stored = await tx.get(dataRef('leads', id));
+    if (!stored.exists()) return;
+    tx.delete(stored.ref);
+    addStats(tx, leadDays([stored.data()], -1), { lastLead: id });
+  });
+}
+
+const putLeads = (entries) => runWithConcurrency(entries, LEAD_CONCURRENCY, putLead);
+const removeLeads = (ids) => runWithConcurrency(ids, LEAD_CONCURRENCY, removeLead);
+
+/**
+ * Live totals and daily rollups for the last STATS_HISTORY_DAYS days, read
+ * from at most STATS_SHARDS * (1 + STATS_HISTORY_DAYS) summary documents.
+ */
+function useLeadStats(user) {
+  const [totals, setTotals] = useState(null);
+  const [days, setDays] = useState([]);
+
+  useEffect(() => {
+    if (!user) return;
+    const stats = collection(db, 'artifacts', appId, 'public', 'data', 'leadStats');
+    const daily = query(
+      collection(db, 'artifacts', appId, 'public', 'data', 'leadStatsDaily'),
+      where('date', '>=', dayKey(Date.now() - (STATS_HISTORY_DAYS - 1) * DAY_MS))
+    );
+    const unsubscribeTotals = onSnapshot(stats, (s) => {
+      if (!s.metadata.fromCache) recordMetric('firestore.reads.leadStats', s.docChanges().length);
+      setTotals(s.docs.reduce((sum, d) => sumStats(sum, d.data()), {}));
+    }, err => reportError(err, 'snapshot:leadStats'));
+    const unsubscribeDays = onSnapshot(daily, (s) => {
+      if (!s.metadata.fromCache) recordMetric('firestore.reads.leadStatsDaily', s.docChanges().length);
+      const byDate = new Map();
+      s.docs.forEach(d => {
+        const { date } = d.data();
+        byDate.set(date, sumStats(byDate.get(date) ?? { date }, d.data()));
+      });
+      setDays([...byDate.values()]);
+    }, err => reportError(err, 'snapshot:leadStatsDaily'));
+    return () => {
+      unsubscribeTotals();
+      unsubscribeDays();
+    };
+  }, [user]);
+
+  return { totals, days };
+}
+
+// --- Leads Pagination ---
+export const LEADS_PAGE_SIZE = 50;
+
+/**
+ * Live-subscribes to one page of leads, newest first, or to a prefix search
+ * on a lowercased `nameLower`/`emailLower` field. Pages are walked with
+ * startAfter cursors; only the visible page is ever listened to.
+ */
+function useLeadsPage(user, { field, term }) {
+  const filterKey = `${field}:${term}`;
+  const [cursorState, setCursorState] = useState({ key: filterKey, stack: [null] });
+  const [page, setPage] = useState({ leads: [], last: null, hasNext: false, loading: true });
+  const stack = cursorState.key === filterKey ? cursorState.stack : [null];
+  const cursor = stack[stack.length - 1];
+
+  useEffect(() => {
+    if (!user) return;
+    const constraints = term
+      ? [where(field, '>=', term), where(field, '<=', term + '\uf8ff'), orderBy(field)]
+      : [orderBy('timestamp', 'desc')];
+    const q = query(
+      collection(db, 'artifacts', appId, 'public', 'data', 'leads'),
+      ...constraints,
+      ...(cursor ? [startAfter(cursor)] : []),
+      limit(LEADS_PAGE_SIZE + 1)
+    );
+    setPage(prev => ({ ...prev, loading: true }));
+    return onSnapshot(q, (s) => {
+      if (!s.metadata.fromCache) recordMetric('firestore.reads.leads', s.docChanges().length);
+      const docs = s.docs.slice(0, LEADS_PAGE_SIZE);
+      setPage({
+        leads: docs.map(d => ({ id: d.id, ...d.data() })),
+        last: docs[docs.length - 1] ?? null,
+        hasNext: s.docs.length > LEADS_PAGE_SIZE,
+        loading: false
+      });
+    }, err => reportError(err, 'snapshot:leads'));
+  }, [user, field, term, cursor]);
+
+  return {
+    ...page,
+    pageIndex: stack.length - 1,
+    next: () => page.hasNext && setCursorState({ key: filterKey, stack: [...stack, page.last] }),
+    prev: () => stack.length > 1 && setCursorState({ key: filterKey, stack: stack.slice(0, -1) })
+  };
+}
+
+// --- Bulk Admin Operations ---
+// Multi-select deletes and file import/export for the Studio Portal. Writes go
+// out as writeBatch chunks of FIRESTORE_BATCH_LIMIT, BULK_CONCURRENCY at a
+// time. Imported rows keep their exported id or get one hashed from their
+// natural key, and duplicates within a file are matched on that same identity,
+// so re-running an import overwrites instead of duplicating. A localStorage
+// checkpoint skips the batches that already committed.
+const FIRESTORE_BATCH_LIMIT = 500;
+const BULK_CONCURRENCY = 4;
+const IMPORT_ERROR_SAMPLE = 5;
+
+async function sha256Hex(text) {
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+  return [...new Uint8Array(digest)].map(b => b.toString(16).padStart(2, '0')).join('');
+}
+
+const asText = (value) => String(value).trim();
+const asNumber = (value) => {
+  const number = Number(value);
+  if (!Number.isFinite(number)) throw new Error('not a number');
+  return number;
+};
+const asUrl = (value) => new URL(asText(value)).href;
+const asEmail = (value) => {
+  if (!/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(asText(value))) throw new Error('not an email address');
+  return asText(value);
+};
+const asJson = (value) => typeof value === 'string' ? JSON.parse(value) : value;
+const asBoolean = (value) => {
+  if (typeof value === 'boolean') return value;
+  const text = asText(value).toLowerCase();
+  if (['true', '1', 'yes'].includes(text)) return true;
+  if (['false', '0', 'no'].includes(text)) return false;
+  throw new Error('not a boolean');
+};
+
+// Field parsers per importable collection; anything not listed here is dropped
+const BULK_SCHEMAS = {
+  projects: {
+    fields: { name: asText, location: asText, image: asUrl, blurb: asText, variants: asJson, width: asNumber, height: asNumber, placeholderColor: asText, placeholderImage: asText, createdAt: asNumber },
+    required: ['name', 'location', 'image'],
+    key: (row) => `${row.name.toLowerCase()}|${row.location.toLowerCase()}`,
+    derive: (row) => ({ createdAt: row.createdAt ?? Date.now() })
+  },
+  leads: {
+    fields: { name: asText, email: asEmail, phone: asText, message: asText, usedConcept: asBoolean, timestamp: asNumber },
+    required: ['name', 'email'],
+    key: (row) => row.email.toLowerCase(),
+    derive: (row) => ({ nameLower: row.name.toLowerCase(), emailLower: row.email.toLowerCase(), timestamp: row.timestamp ?? Date.now() })
+  }
+};
+
+/** Parses one raw row against its schema; throws with the offending field. */
+function normalizeRow(schema, raw) {
+  const row = {};
+  for (const [field, parse] of Object.entries(schema.fields)) {
+    if (raw[field] == null || raw[field] === '') continue;
+    try {
+      row[field] = parse(raw[field]);
+    } catch (err) { throw new Error(`${field}: ${err.message}`); }
+  }
+  const missing = schema.required.filter(field => !row[field]);
+  if (missing.length) throw new Error(`missing ${missing.join(', ')}`);
+  return { ...row, ...schema.derive(row) };
+}
+
+const isDocId = (id) => typeof id === 'string' && id.trim() !== '' && !id.includes('/');
+
+async function* readChunks(file) {
+  const reader = file.stream().pipeThrough(new TextDecoderStream()).getReader();
+  try {
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) return;
+      yield value;
+    }
+  } finally { reader.releaseLock(); }
+}
+
+/** Streams CSV rows as objects keyed by the header row; quoted fields may span chunks and lines. */
+async function* parseCsv(chunks) {
+  let header = null, record = [], field = '', quoted = false, closed = false;
+  const records = [];
+  const endRecord = () => {
+    record.push(field);
+    if (record.length > 1 || record[0]) records.push(record);
+    record = [];
+    field = '';
+  };
+  const drain = () => records.splice(0).flatMap(values => {
+    if (header) return [Object.fromEntries(header.map((name, i) => [name, values[i] ?? '']))];
+    header = values.map(name => name.trim());
+    return [];
+  });
+
+  for await (const chunk of chunks) {
+    for (const c of chunk) {
+      if (quoted) {
+        if (c === '"') { quoted = false; closed = true; } else field += c;
+        continue;
+      }
+      if (c === '"') {
+        if (closed) field += '"'; // "" inside a quoted field
+        quoted = true;
+      } else if (c === ',') {
+        record.push(field);
+        field = '';
+      } else if (c === '\n') endRecord();
+      else if (c !== '\r') field += c;
+      closed = false;
+    }
+    yield* drain();
+  }
+  if (field || record.length) endRecord();
+  yield* drain();
+}
+
+/** Streams the top-level objects of a JSON array or of newline-delimited JSON. */
+async function* parseJsonObjects(chunks) {
+  let buffer = '', depth = 0, inString = false, escaped = false;
+  for await (const chunk of chunks) {
+    const objects = [];
+    for (const c of chunk) {
+      if (!depth) {
+        if (c === '{') { depth = 1; buffer = c; }
+        continue;
+      }
+      buffer += c;
+      if (inString) {
+        if (escaped) escaped = false;
+        else if (c === '\\') escaped = true;
+        else if (c === '"') inString = false;
+      } else if (c === '"') inString = true;
+      else if (c === '{' || c === '[') depth++;
+      else if ((c === '}' || c === ']') && !--depth) objects.push(JSON.parse(buffer));
+    }
+    yield* objects;
+  }
+}
+
+const readRows = (file) => (/\.csv$/i.test(file.name) ? parseCsv : parseJsonObjects)(readChunks(file));
+
+const importCheckpointKey = (col, file) => `sanora-import:${appId}:${col}:${file.name}:${file.size}:${file.lastModified}`;
+
+function readCheckpoint(key) {
+  try {
+    return Number(localStorage.getItem(key)) || 0;
+  } catch (err) { return 0; }
+}
+
+function writeCheckpoint(key, batches) {
+  try {
+    if (batches) localStorage.setItem(key, String(batches)); else localStorage.removeItem(key);
+  } catch (err) { /* resuming just starts over */ }
+}
+
+/**
+ * Streams a CSV, JSON-array or NDJSON `file` into `col`, validating and
+ * deduping rows as they are read. `onProgress` receives running counts of
+ * rows read, written, invalid and duplicate. Rejects once the first failed
+ * batch settles; importing the same file again resumes after the last
+ * contiguous batch that committed.
+ */
+async function importRows(col, file, { onProgress } = {}) {
+  const schema = BULK_SCHEMAS[col];
+  const batchSize = col === 'leads' ? STATS_CHUNK : FIRESTORE_BATCH_LIMIT;
+  const checkpoint = importCheckpointKey(col, file);
+  const resumeFrom = readCheckpoint(checkpoint);
+  const progress = { read: 0, written: 0, invalid: 0, duplicates: 0, errors: [] };
+  const seen = new Set();
+  const landed = new Set();
+  const inFlight = new Set();
+  let pending = [], nextBatch = 0, watermark = resumeFrom, failure = null;
+  const report = () => onProgress?.({ ...progress, resumed: resumeFrom > 0 });
+
+  const commit = async (index, entries) => {
+    if (col === 'leads') {
+      await putLeads(entries);
+    } else {
+      const batch = writeBatch(db);
+      entries.forEach(({ id, data }) => batch.set(doc(db, 'artifacts', appId, 'public', 'data', col, id), data));
+      await batch.commit();
+    }
+    recordMetric('bulk.import.rows', entries.length, { col });
+    landed.add(index);
+    while (landed.has(watermark)) landed.delete(watermark++);
+    writeCheckpoint(checkpoint, watermark);
+    progress.written += entries.length;
+    report();
+  };
+
+  const flush = async () => {
+    const index = nextBatch++;
+    const entries = pending;
+    pending = [];
+    if (index < resumeFrom) {
+      progress.written += entries.length;
+      return;
+    }
+    const task = commit(index, entries)
+      .catch(err => { if (!failure) failure = err; })
+      .finally(() => inFlight.delete(task));
+    inFlight.add(task);
+    if (inFlight.size >= BULK_CONCURRENCY) await Promise.race(inFlight);
+  };
+
+  try {
+    for await (const raw of readRows(file)) {
+      if (failure) break;
+      progress.read++;
+      try {
+        const data = normalizeRow(schema, raw);
+        // The natural key only stands in for rows without an exported id
+        const hasId = isDocId(raw.id);
+        const key = hasId ? `id:${raw.id.trim()}` : schema.key(data);
+        if (seen.has(key)) {
+          progress.duplicates++;
+          continue;
+        }
+        seen.add(key);
+        const id = hasId ? raw.id.trim() : `import-${(await sha256Hex(`${col}|${key}`)).slice(0, 24)}`;
+        pending.push({ id, data });
+      } catch (err) {
+        progress.invalid++;
+        if (progress.errors.length < IMPORT_ERROR_SAMPLE) progress.errors.push(`Row ${progress.read}: ${err.message}`);
+        continue;
+      }
+      if (pending.length === batchSize) await flush();
+    }
+    if (pending.length && !failure) await flush();
+  } finally {
+    await Promise.all(inFlight);
+  }
+  if (failure) throw failure;
+  writeCheckpoint(checkpoint, 0);
+  report();
+  return progress;
+}
+
+/** Deletes `ids` from `col` in writeBatch chunks (counted transactions for leads); resolves with the ids whose chunk failed. */
+async function deleteDocs(col, ids, { onProgress } = {}) {
+  const size = col === 'leads' ? STATS_CHUNK : FIRESTORE_BATCH_LIMIT;
+  const chunks = [];
+  for (let i = 0; i < ids.length; i += size) chunks.push(ids.slice(i, i + size));
+
+  const failed = [];
+  let done = 0;
+  await runWithConcurrency(chunks, BULK_CONCURRENCY, async (chunk) => {
+    try {
+      if (col === 'leads') {
+        await removeLeads(chunk);
+      } else {
+        const batch = writeBatch(db);
+        chunk.forEach(id => batch.delete(doc(db, 'artifacts', appId, 'public', 'data', col, id)));
+        await batch.commit();
+      }
+      recordMetric('bulk.delete.docs', chunk.length, { col });
+      onProgress?.(done += chunk.length);
+    } catch (err) {
+      reportError(err, 'bulk-delete');
+      failed.push(...chunk);
+    }
+  });
+  return failed;
+}
+
+const csvCell = (value) => {
+  const text = value == null ? '' : typeof value === 'object' ? JSON.stringify(value) : String(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+/**
+ * Downloads `col` as CSV or a JSON array. Documents are paged by id,
+ * FIRESTORE_BATCH_LIMIT at a time, and serialized straight into Blob parts so
+ * only one page is held as objects. Resolves with the number exported.
+ */
+async function exportCollection(col, format, { onProgress } = {}) {
+  const columns = ['id', ...Object.keys(BULK_SCHEMAS[col].fields)];
+  const parts = format === 'csv' ? [columns.join(',') + '\n'] : ['['];
+  let last = null, count = 0;
+  for (;;) {
+    const page = await getDocs(query(
+      collection(db, 'artifacts', appId, 'public', 'data', col),
+      orderBy(documentId()),
+      ...(last ? [startAfter(last)] : []),
+      limit(FIRESTORE_BATCH_LIMIT)
+    ));
+    recordMetric(`firestore.reads.${col}`, page.size);
+    page.docs.forEach(d => {
+      const row = { id: d.id, ...d.data() };
+      parts.push(format === 'csv'
+        ? columns.map(c => csvCell(row[c])).join(',') + '\n'
+        : (count ? ',\n' : '\n') + JSON.stringify(Object.fromEntries(columns.filter(c => row[c] !== undefined).map(c => [c, row[c]]))));
+      count++;
+    });
+    onProgress?.(count);
+    if (page.size < FIRESTORE_BATCH_LIMIT) break;
+    last = page.docs[page.docs.length - 1];
+  }
+  if (format !== 'csv') parts.push('\n]\n');
+
+  const url = URL.createObjectURL(new Blob(parts, { type: format === 'csv' ? 'text/csv' : 'application/json' }));
+  Object.assign(document.createElement('a'), { href: url, download: `${col}-${new Date().toISOString().slice(0, 10)}.${format}` }).click();
+  setTimeout(() => URL.revokeObjectURL(url), 0);
+  return count;
+}
+
+// --- Studio Portal ---
+export default function AdminDashboard({ user, projects, services, onExit }) {
+  const [activeTab, setActiveTab] = useState('projects');
+  const [isAdding, setIsAdding] = useState(false);
+  const [blurbs, setBlurbs] = useState({});
+  const [bulkCopy, setBulkCopy] = useState(null);
+  const [projectQuery, setProjectQuery] = useState('');
+  const [projectFacet, setProjectFacet] = useState(null);
+  const [selected, setSelected] = useState(() => new Set());
+  const [bulkDelete, setBulkDelete] = useState(null);
+  const gridSearch = useProjectSearch(projects, projectQuery, projectFacet);
+
+  // Read through a ref so the callbacks handed to memoized cards stay stable across snapshots
+  const projectsRef = useRef(projects);
+  projectsRef.current = projects;
+
+  // Keeps generated copy on screen and writes it back to the stored projects
+  const saveBlurbs = useCallback(async (generated) => {
+    setBlurbs(prev => ({ ...prev, ...generated }));
+    if (!user) return;
+    const stored = projectsRef.current.filter(p => generated[p.id] && !isDefaultProject(p));
+    if (!stored.length) return;
+    try {
+      const batch = writeBatch(db);
+      stored.forEach(p => batch.update(doc(db, 'artifacts', appId, 'public', 'data', 'projects', p.id), { blurb: generated[p.id] }));
+      await batch.commit();
+    } catch (err) { reportError(err, 'admin:save-copy'); }
+  }, [user]);
+
+  const saveBlurb = useCallback((id, blurb) => saveBlurbs({ [id]: blurb }), [saveBlurbs]);
+
+  const generateAllCopy = async () => {
+    setBulkCopy({ done: 0, total: projects.length, failed: 0 });
+    const failed = await generateBlurbs(projects, {
+      onBatch: (generated) => {
+        setBulkCopy(prev => ({ ...prev, done: prev.done + Object.keys(generated).length }));
+        saveBlurbs(generated);
+      }
+    });
+    setBulkCopy(prev => ({ ...prev, failed: failed.length, finished: true }));
+  };
+
+  const deleteItem = useCallback(async (col, id) => {
+    if (!user) return;
+    try {
+      if (col === 'leads') await removeLead(id); // keeps the lead counters in step
+      else await deleteDoc(doc(db, 'artifacts', appId, 'public', 'data', col, id));
+    } catch (err) {
+      reportError(err, 'admin:delete');
+      return;
+    }
+    if (col === 'projects') {
+      const project = projectsRef.current.find(p => p.id === id);
+      deleteProjectImages(project?.variants).catch(err => reportError(err, 'admin:delete-images'));
+    }
+  }, [user]);
+
+  const deleteProject = useCallback((id) => deleteItem('projects', id), [deleteItem]);
+
+  const toggleSelected = useCallback((id) => setSelected(prev => {
+    const next = new Set(prev);
+    if (!next.delete(id)) next.add(id);
+    return next;
+  }), []);
+
+  const shown = gridSearch.projects.filter(p => !isDefaultProject(p));
+  const allShownSelected = shown.length > 0 && shown.every(p => selected.has(p.id));
+  const selectShown = () => setSelected(allShownSelected ? new Set() : new Set(shown.map(p => p.id)));
+
+  // Failed chunks stay selected so the delete can simply be retried
+  const deleteSelected = async () => {
+    if (!user) return;
+    const ids = [...selected];
+    setBulkDelete({ done: 0, total: ids.length });
+    const variants = new Map(projectsRef.current.map(p => [p.id, p.variants]));
+    const failed = await deleteDocs('projects', ids, { onProgress: (done) => setBulkDelete(prev => ({ ...prev, done })) });
+    const deleted = ids.filter(id => !failed.includes(id));
+    deleteProjectImages(deleted.flatMap(id => Array.isArray(variants.get(id)) ? variants.get(id) : []))
+      .catch(err => reportError(err, 'admin:delete-images'));
+    setSelected(new Set(failed));
+    setBulkDelete(null);
+  };
+  const deleteLead = useCallback((id) => deleteItem('leads', id), [deleteItem]);
+  const closeModal = useCallback(() => setIsAdding(false), []);
+
+  return (
+    <div className="min-h-screen bg-[#F9F7F2] flex">
+      <aside className="w-72 bg-white p-10 border-r border-slate-100 hidden lg:flex flex-col">
+        <SanoraLogo className="mb-20" />
+        <nav className="space-y-4 flex-1">
+          {['projects', 'services', 'leads', 'metrics'].map(t => (
+            <button key={t} onClick={() => setActiveTab(t)} className={`w-full text-left p-4 rounded-2xl text-xs font-bold uppercase tracking-widest transition-all ${activeTab === t ? 'bg-[#84A98C] text-white shadow-lg shadow-[#84A98C]/20' : 'text-slate-400 hover:bg-slate-50'}`}>
+              {t}
+            </button>
+          ))}
+        </nav>
+        <AICacheStats />
+        <button onClick={onExit} className="flex items-center gap-3 text-slate-400 hover:text-red-500 font-bold uppercase text-[10px] tracking-widest">
+          <LogOut size={14} /> Close Portal
+        </button>
+      </aside>
+
+      <main className="flex-1 p-12 overflow-y-auto h-screen">
+        <div className="flex justify-between items-center mb-12">
+          <h1 className="text-3xl font-light text-slate-900 tracking-tight uppercase tracking-[0.2em]">{activeTab}</h1>
+          {activeTab === 'leads' && <BulkTransfer user={user} col="leads" />}
+          {activeTab === 'projects' && (
+            <div className="flex items-center gap-4">
+              <BulkTransfer user={user} col="projects" />
+              {bulkCopy && (
+                <span className="text-[10px] font-bold uppercase tracking-widest text-slate-400">
+                  {bulkCopy.done}/{bulkCopy.total} written{bulkCopy.failed ? ` · ${bulkCopy.failed} failed` : ''}
+                </span>
+              )}
+              <button onClick={generateAllCopy} disabled={bulkCopy && !bulkCopy.finished} className="border border-[#C5A059] text-[#C5A059] px-8 py-3 rounded-full text-[10px] font-bold uppercase tracking-widest flex items-center gap-2 hover:bg-[#C5A059] hover:text-white transition-all disabled:opacity-50">
+                {bulkCopy && !bulkCopy.finished ? <Loader2 className="animate-spin" size={12} /> : <Sparkles size={12} />}
+                Generate copy for all
+              </button>
+              <button onClick={() => setIsAdding(true)} className="bg-[#C5A059] text-white px-8 py-3 rounded-full text-[10px] font-bold uppercase tracking-widest">
+                Add Record
+              </button>
+            </div>
+          )}
+        </div>
+
+        {activeTab === 'projects' && (
+          <div className="mb-8 space-y-4">
+            <ProjectSearchBar search={gridSearch} query={projectQuery} onQuery={setProjectQuery} facet={projectFacet} onFacet={setProjectFacet} />
+            <div className="flex items-center gap-6 text-[10px] font-bold uppercase tracking-widest text-slate-400">
+              <button onClick={selectShown} disabled={!shown.length} className="hover:text-[#84A98C] disabled:opacity-30">
+                {allShownSelected ? 'Clear selection' : `Select ${shown.length} shown`}
+              </button>
+              {selected.size > 0 && (
+                <button onClick={deleteSelected} disabled={!!bulkDelete} className="flex items-center gap-2 text-red-500 disabled:opacity-50">
+                  {bulkDelete ? <Loader2 className="animate-spin" size={12} /> : <Trash2 size={12} />}
+                  {bulkDelete ? `Deleting ${bulkDelete.done}/${bulkDelete.total}` : `Delete ${selected.size} selected`}
+                </button>
+              )}
+            </div>
+          </div>
+        )}
+
+        {activeTab === 'projects' && (
+          <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">
+            {gridSearch.projects.map(p => (
+              <AdminProjectCard key={p.id} project={p} suggestion={blurbs[p.id] ?? p.blurb} selected={selected.has(p.id)} onSelect={isDefaultProject(p) ? null : toggleSelected} onSuggestion={saveBlurb} onDelete={deleteProject} />
+            ))}
+          </div>
+        )}
+
+        {activeTab === 'leads' && <LeadAnalytics user={user} />}
+        {activeTab === 'leads' && <LeadsPanel user={user} onDelete={deleteLead} />}
+
+        {activeTab === 'metrics' && <MetricsPanel />}
+
+        {isAdding && <AddProjectModal user={user} onClose={closeModal} />}
+      </main>
+    </div>
+  );
+}
+
+// Typing into the form only re-renders the modal, not the project grid behind it
+const AddProjectModal = profiled('admin-modal', function AddProjectModal({ user, onClose }) {
+  const [formData, setFormData] = useState({});
+  const [imageFile, setImageFile] = useState(null);
+  const [upload, setUpload] = useState(null);
+
+  const handleAddProject = async (e) => {
+    e.preventDefault();
+    if (!user) return;
+    if (imageFile) setUpload({ done: 0, total: UPLOAD_WIDTHS.length });
+    let visual = null;
+    try {
+      visual = imageFile
+        ? await uploadProjectImage(imageFile, setUpload)
+        : await extractPlaceholder(formData.image);
+      await addDoc(collection(db, 'artifacts', appId, 'public', 'data', 'projects'), { ...formData, ...visual, createdAt: Date.now() });
+      onClose();
+    } catch (err) {
+      reportError(err, 'admin:add-project');
+      // The project was never stored, so nothing references the upload
+      if (imageFile && visual) deleteProjectImages(visual.variants).catch(err => reportError(err, 'upload-cleanup'));
+    } finally { setUpload(null); }
+  };
+
+  return (
+    <div className="fixed inset-0 bg-slate-950/60 backdrop-blur-sm z-[100] flex items-center justify-center p-6">
+      <div className="bg-white w-full max-w-md rounded-[3rem] p-12">
+        <h2 className="text-2xl font-light mb-8 text-slate-900 tracking-tight uppercase tracking-widest">New Entry</h2>
+        <form onSubmit={handleAddProject} className="space-y-6">
+          <input required type="text" placeholder="Project Title" onChange={e => setFormData({...formData, name: e.target.value})} className="w-full bg-[#F9F7F2] p-4 rounded-2xl outline-none" />
+          <input required type="text" placeholder="Region/City" onChange={e => setFormData({...formData, location: e.target.value})} className="w-full bg-[#F9F7F2] p-4 rounded-2xl outline-none" />
+          <input required={!imageFile} disabled={!!imageFile} type="url" placeholder="Visual URL" onChange={e => setFormData({...formData, image: e.target.value})} className="w-full bg-[#F9F7F2] p-4 rounded-2xl outline-none disabled:opacity-40" />
+          <label className="w-full bg-[#F9F7F2] p-4 rounded-2xl flex items-center gap-3 text-sm text-slate-400 cursor-pointer">
+            <ImageIcon size={16} className="text-[#84A98C]" />
+            <span className="truncate">{imageFile ? imageFile.name : 'or upload an image'}</span>
+            <input type="file" accept="image/*" onChange={e => setImageFile(e.target.files[0] || null)} className="hidden" />
+          </label>
+          <div className="flex gap-4 pt-4">
+            <button type="button" onClick={onClose} className="flex-1 p-4 bg-slate-100 rounded-2xl font-bold text-[10px] uppercase">Cancel</button>
+            <button type="submit" disabled={!!upload} className="flex-1 p-4 bg-[#84A98C] text-white rounded-2xl font-bold text-[10px] uppercase disabled:opacity-50">
+              {upload ? `Uploading ${upload.done}/${upload.total}` : 'Publish'}
+            </button>
+          </div>
+        </form>
+      </div>
+    </div>
+  );
+});
+
+const AdminProjectCard = profiled('admin-card', function AdminProjectCard({ project: p, suggestion, selected, onSelect, onSuggestion, onDelete }) {
+  return (
+    <div className={`bg-white rounded-[2rem] overflow-hidden border shadow-sm group ${selected ? 'border-[#84A98C]' : 'border-slate-100'}`}>
+      <div className="h-56 overflow-hidden relative">
+        {onSelect && <input type="checkbox" checked={selected} onChange={() => onSelect(p.id)} aria-label={`Select ${p.name}`} className="absolute top-5 left-5 z-10 w-5 h-5 accent-[#84A98C]" />}
+        <ResponsiveImage src={p.image} variants={p.variants} sizes="(min-width: 1024px) 25vw, (min-width: 768px) 40vw, 100vw" placeholderColor={p.placeholderColor} placeholderImage={p.placeholderImage} className="w-full h-full object-cover transition-opacity duration-700" alt={p.name} />
+      </div>
+      <div className="p-8">
+        <div className="flex justify-between items-center mb-4">
+          <div>
+              <h4 className="font-bold text-slate-900">{p.name}</h4>
+              <p className="text-[10px] font-bold text-[#84A98C] tracking-widest uppercase">{p.location}</p>
+          </div>
+          <button onClick={() => onDelete(p.id)} className="text-slate-200 hover:text-red-500"><Trash2 size={18} /></button>
+        </div>
+        <AIAssistant project={p} suggestion={suggestion} onSuggestion={(blurb) => onSuggestion(p.id, blurb)} />
+      </div>
+    </div>
+  );
+});
+
+// Only the visible page of leads is subscribed while the tab is open
+const LEAD_ROW_HEIGHT = 76;
+const LEADS_VIEWPORT_HEIGHT = 608;
+const LEADS_OVERSCAN = 4;
+
+function LeadsPanel({ user, onDelete }) {
+  const [field, setField] = useState('nameLower');
+  const [input, setInput] = useState('');
+  const [term, setTerm] = useState('');
+  const [scrollTop, setScrollTop] = useState(0);
+  const [selected, setSelected] = useState(() => new Set());
+  const [deleting, setDeleting] = useState(false);
+  const scrollRef = useRef(null);
+  const page = useLeadsPage(user, { field, term });
+
+  useEffect(() => {
+    const timer = setTimeout(() => setTerm(input.trim().toLowerCase()), 300);
+    return () => clearTimeout(timer);
+  }, [input]);
+
+  useEffect(() => {
+    scrollRef.current?.scrollTo(0, 0);
+    setScrollTop(0);
+    setSelected(new Set());
+  }, [page.pageIndex, field, term]);
+
+  // Selection is scoped to the visible page
+  const allSelected = page.leads.length > 0 && page.leads.every(l => selected.has(l.id));
+  const toggleAll = () => setSelected(allSelected ? new Set() : new Set(page.leads.map(l => l.id)));
+  const toggle = (id) => setSelected(prev => {
+    const next = new Set(prev);
+    if (!next.delete(id)) next.add(id);
+    return next;
+  });
+
+  const deleteSelected = async () => {
+    if (!user) return;
+    setDeleting(true);
+    setSelected(new Set(await deleteDocs('leads', [...selected])));
+    setDeleting(false);
+  };
+
+  // Windowed body: render only the rows inside the viewport plus a small overscan
+  const first = Math.max(0, Math.floor(scrollTop / LEAD_ROW_HEIGHT) - LEADS_OVERSCAN);
+  const visible = page.leads.slice(first, first + Math.ceil(LEADS_VIEWPORT_HEIGHT / LEAD_ROW_HEIGHT) + LEADS_OVERSCAN * 2);
+  const after = page.leads.length - first - visible.length;
+
+  return (
+    <div className="space-y-6">
+      <div className="flex gap-4">
+        <input value={input} onChange={e => setInput(e.target.value)} placeholder="Search leads..." className="flex-1 bg-white p-4 rounded-2xl outline-none border border-slate-100 text-sm" />
+        {[['nameLower', 'Name'], ['emailLower', 'Email']].map(([key, label]) => (
+          <button key={key} onClick={() => setField(key)} className={`px-6 rounded-2xl text-[10px] font-bold uppercase tracking-widest transition-all ${field === key ? 'bg-[#84A98C] text-white' : 'bg-white text-slate-400 border border-slate-100'}`}>
+            {label}
+          </button>
+        ))}
+        {selected.size > 0 && (
+          <button onClick={deleteSelected} disabled={deleting} className="px-6 rounded-2xl text-[10px] font-bold uppercase tracking-widest bg-red-500 text-white flex items-center gap-2 disabled:opacity-50">
+            {deleting ? <Loader2 className="animate-spin" size={12} /> : <Trash2 size={12} />} Delete {selected.size}
+          </button>
+        )}
+      </div>
+      <div className="bg-white rounded-[2rem] shadow-sm border border-slate-100 overflow-hidden">
+        <div ref={scrollRef} onScroll={e => setScrollTop(e.currentTarget.scrollTop)} className="overflow-y-auto" style={{ maxHeight: LEADS_VIEWPORT_HEIGHT }}>
+          <table className="w-full text-left">
+            <thead className="bg-[#F9F7F2] sticky top-0">
+              <tr>
+                <th className="pl-6 w-10"><input type="checkbox" checked={allSelected} onChange={toggleAll} aria-label="Select page" className="accent-[#84A98C]" /></th>
+                <th className="p-6 text-[10px] font-bold uppercase tracking-widest text-slate-400">Client</th>
+                <th className="p-6 text-[10px] font-bold uppercase tracking-widest text-slate-400">Contact</th>
+                <th className="p-6 text-[10px] font-bold uppercase tracking-widest text-slate-400 text-right">Action</th>
+              </tr>
+            </thead>
+            <tbody>
+              {first > 0 && <tr style={{ height: first * LEAD_ROW_HEIGHT }} />}
+              {visible.map(l => (
+                <tr key={l.id} className="border-t border-slate-50" style={{ height: LEAD_ROW_HEIGHT }}>
+                  <td className="pl-6"><input type="checkbox" checked={selected.has(l.id)} onChange={() => toggle(l.id)} aria-label={`Select ${l.name}`} className="accent-[#84A98C]" /></td>
+                  <td className="px-6 font-bold text-slate-900">{l.name}</td>
+                  <td className="px-6 text-sm text-slate-500">{l.email} / {l.phone}</td>
+                  <td className="px-6 text-right"><button onClick={() => onDelete(l.id)} className="text-red-500"><Trash2 size={16} /></button></td>
+                </tr>
+              ))}
+              {after > 0 && <tr style={{ height: after * LEAD_ROW_HEIGHT }} />}
+            </tbody>
+          </table>
+        </div>
+        <div className="flex justify-between items-center p-6 border-t border-slate-50 text-[10px] font-bold uppercase tracking-widest text-slate-400">
+          <button onClick={page.prev} disabled={page.pageIndex === 0} className="hover:text-[#84A98C] disabled:opacity-30">Previous</button>
+          <span className="flex items-center gap-2">
+            {page.loading && <Loader2 className="animate-spin" size={12} />} Page {page.pageIndex + 1}
+          </span>
+          <button onClick={page.next} disabled={!page.hasNext} className="hover:text-[#84A98C] disabled:opacity-30">Next</button>
+        </div>
+      </div>
+    </div>
+  )
+}
+
+// Totals, daily and weekly volume and conversion from the precomputed lead stats, whatever the size of `leads`
+function LeadAnalytics({ user }) {
+  const { totals, days } = useLeadStats(user);
+  const series = useMemo(() => {
+    const byDate = new Map(days.map(d => [d.date, d]));
+    const now = Date.now();
+    return Array.from({ length: STATS_HISTORY_DAYS }, (_, i) => {
+      const date = dayKey(now - (STATS_HISTORY_DAYS - 1 - i) * DAY_MS);
+      const day = byDate.get(date);
+      return { date, leads: day?.leads || 0, visits: day?.visits || 0 };
+    });
+  }, [days]);
+
+  const daily = series.slice(-30);
+  const weekly = Array.from({ length: STATS_HISTORY_DAYS / 7 }, (_, w) => series.slice(w * 7, w * 7 + 7))
+    .map(week => ({ date: week[0].date, leads: week.reduce((sum, d) => sum + d.leads, 0) }));
+  const total = (list, field) => list.reduce((sum, d) => sum + d[field], 0);
+  const rate = (part, whole) => whole ? `${(part / whole * 100).toFixed(1)}%` : '—';
+
+  const cards = [
+    ['Total leads', totals?.leads ?? 0],
+    ['Last 30 days', total(daily, 'leads')],
+    ['Conversion, 30 days', rate(total(daily, 'leads'), total(daily, 'visits'))],
+    ['Concept-assisted', rate(totals?.withConcept ?? 0, totals?.leads ?? 0)]
+  ];
+
+  return (
+    <div className="space-y-6 mb-8">
+      <div className="grid grid-cols-2 lg:grid-cols-4 gap-6">
+        {cards.map(([label, value]) => (
+          <div key={label} className="bg-white rounded-[2rem] p-8 border border-slate-100 shadow-sm">
+            <p className="text-[10px] font-bold uppercase tracking-widest text-slate-400 mb-3">{label}</p>
+            <p className="text-3xl font-light text-slate-900">{totals ? value : <Loader2 className="animate-spin text-slate-300" size={20} />}</p>
+          </div>
+        ))}
+      </div>
+      <div className="grid lg:grid-cols-2 gap-6">
+        <LeadBars title="Leads per day" points={daily} />
+        <LeadBars title="Leads per week" points={weekly} />
+      </div>
+    </div>
+  )
+}
+
+function LeadBars({ title, points }) {
+  const max = Math.max(1, ...points.map(p => p.leads));
+  return (
+    <div className="bg-white rounded-[2rem] p-8 border border-slate-100 shadow-sm">
+      <p className="text-[10px] font-bold uppercase tracking-widest text-slate-400 mb-6">{title}</p>
+      <div className="flex items-end gap-1 h-32">
+        {points.map(p => (
+          <div key={p.date} title={`${p.date}: ${p.leads}`} className="flex-1 bg-[#84A98C] rounded-t-sm min-h-[2px] opacity-80 hover:opacity-100" style={{ height: `${p.leads / max * 100}%` }} />
+        ))}
+      </div>
+    </div>
+  )
+}
+
+// Import/export controls for one collection; a failed import keeps its file so it can be resumed
+function BulkTransfer({ user, col }) {
+  const [status, setStatus] = useState(null);
+  const fileRef = useRef(null);
+  const busy = status && !status.finished;
+
+  const runImport = async (file) => {
+    if (!user || !file) return;
+    setStatus({ label: 'Importing', read: 0, written: 0 });
+    try {
+      const result = await importRows(col, file, { onProgress: (p) => setStatus({ label: 'Importing', ...p }) });
+      setStatus({ label: 'Imported', ...result, finished: true });
+    } catch (err) {
+      reportError(err, 'bulk-import');
+      setStatus(prev => ({ ...prev, label: 'Import failed', retry: file, finished: true }));
+    }
+  };
+
+  const runExport = async (format) => {
+    if (!user) return;
+    setStatus({ label: 'Exporting', written: 0 });
+    try {
+      const written = await exportCollection(col, format, { onProgress: (n) => setStatus({ label: 'Exporting', written: n }) });
+      setStatus({ label: 'Exported', written, finished: true });
+    } catch (err) {
+      reportError(err, 'bulk-export');
+      setStatus(prev => ({ ...prev, label: 'Export failed', finished: true }));
+    }
+  };
+
+  const buttonClass = "border border-slate-200 text-slate-500 px-5 py-3 rounded-full text-[10px] font-bold uppercase tracking-widest flex items-center gap-2 hover:border-[#84A98C] hover:text-[#84A98C] transition-all disabled:opacity-50";
+
+  return (
+    <div className="flex items-center gap-3">
+      {status && (
+        <span title={status.errors?.join('\n')} className="text-[10px] font-bold uppercase tracking-widest text-slate-400">
+          {status.label} {status.written}{status.read ? `/${status.read}` : ''}
+          {status.invalid ? ` · ${status.invalid} invalid` : ''}{status.duplicates ? ` · ${status.duplicates} dupes` : ''}
+        </span>
+      )}
+      {status?.retry && (
+        <button onClick={() => runImport(status.retry)} className="text-[10px] font-bold uppercase tracking-widest text-[#C5A059]">Resume</button>
+      )}
+      <button onClick={() => fileRef.current.click()} disabled={busy} className={buttonClass}>
+        {busy ? <Loader2 className="animate-spin" size={12} /> : <Upload size={12} />} Import
+      </button>
+      <input ref={fileRef} type="file" accept=".csv,.json,.ndjson,.jsonl" onChange={e => { runImport(e.target.files[0]); e.target.value = ''; }} className="hidden" />
+      {['csv', 'json'].map(format => (
+        <button key={format} onClick={() => runExport(format)} disabled={busy} className={buttonClass}>
+          <Download size={12} /> {format}
+        </button>
+      ))}
+    </div>
+  )
+}
+
+// Live percentiles of everything recorded through recordMetric in this session
+function MetricsPanel() {
+  const [summaries, setSummaries] = useState(getMetricSummaries);
+
+  useEffect(() => {
+    const timer = setInterval(() => setSummaries(getMetricSummaries()), 2000);
+    return () => clearInterval(timer);
+  }, []);
+
+  const format = (v) => Number.isInteger(v) ? v : v.toFixed(v < 1 ? 3 : 0);
+
+  return (
+    <div className="bg-white rounded-[2rem] shadow-sm border border-slate-100 overflow-hidden">
+      <table className="w-full text-left">
+        <thead className="bg-[#F9F7F2]">
+          <tr>
+            {['Metric', 'Count', 'Total', 'p50', 'p90', 'p99'].map(h => (
+              <th key={h} className="p-6 text-[10px] font-bold uppercase tracking-widest text-slate-400">{h}</th>
+            ))}
+          </tr>
+        </thead>
+        <tbody>
+          {summaries.map(m => (
+            <tr key={m.name} className="border-t border-slate-50 text-sm text-slate-500">
+              <td className="p-6 font-bold text-slate-900">{m.name}</td>
+              <td className="p-6">{m.count}</td>
+              <td className="p-6">{format(m.total)}</td>
+              <td className="p-6">{format(m.p50)}</td>
+              <td className="p-6">{format(m.p90)}</td>
+              <td className="p-6">{format(m.p99)}</td>
+            </tr>
+          ))}
+          {!summaries.length && (
+            <tr><td colSpan={6} className="p-6 text-sm text-slate-400 italic">No metrics recorded yet.</td></tr>
+          )}
+        </tbody>
+      </table>
+    </div>
+  )
+}
+
+// Gemini cache savings for the Studio Portal sidebar
+function AICacheStats() {
+    const [stats, setStats] = useState(getGeminiCacheStats);
+
+    useEffect(() => {
+        const timer = setInterval(() => setStats(getGeminiCacheStats()), 2000);
+        return () => clearInterval(timer);
+    }, []);
+
+    return (
+        <div className="mb-8 p-4 rounded-2xl bg-[#F9F7F2] text-[9px] font-bold uppercase tracking-widest text-slate-400 space-y-1">
+            <p className="text-[#C5A059] flex items-center gap-2"><Sparkles size={10} /> AI Cache</p>
+            <p>{stats.hits} hits / {stats.misses} misses</p>
+            <p>{Math.round(stats.hitRate * 100)}% saved · {stats.size} stored</p>
+        </div>
+    )
+}
+
+// AI Assistant for Admin to generate descriptions
+function AIAssistant({ project, suggestion, onSuggestion }) {
+    const [loading, setLoading] = useState(false);
+
+    const generateBlurb = async () => {
+        setLoading(true);
+        try {
+            const res = await runTemplate('blurb', project);
+            if (res) onSuggestion(res);
+        } catch (err) {
+            reportError(err, 'admin:suggest-copy');
+        } finally {
+            setLoading(false);
+        }
+    }
+
+    return (
+        <div className="mt-4 pt-4 border-t border-slate-50">
+            <button 
+                onClick={generateBlurb}
+                disabled={loading}
+                className="text-[9px] font-bold uppercase tracking-[0.2em] text-[#C5A059] flex items-center gap-2 hover:text-[#84A98C] transition-colors"
+            >
+                {loading ? <Loader2 className="animate-spin" size={10} /> : <Sparkles size={10} />}
+                ✨ Suggest Marketing Copy
+            </button>
+            {suggestion && (
+                <p className="mt-3 text-[11px] text-slate-400 italic leading-relaxed animate-in fade-in duration-500">
+                    "{suggestion}"
+                </p>
+            )}
+        </div>
+    )
+}
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef, useMemo, useCallback, useSyncExternalStore, memo, Profiler, lazy, Suspense } from 'react';
 import { initializeApp } from 'firebase/app';
 import { 
   getAuth, 
@@ -7,13 +7,20 @@ import {
   onAuthStateChanged 
 } from 'firebase/auth';
 import { 
-  getFirestore, 
+  initializeFirestore,
+  persistentLocalCache,
+  memoryLocalCache,
+  persistentMultipleTabManager,
   collection, 
   doc, 
-  addDoc, 
   onSnapshot, 
-  deleteDoc 
+  writeBatch,
+  query,
+  where,
+  limit,
+  increment
 } from 'firebase/firestore';
+import { getStorage } from 'firebase/storage';
 import { 
   Menu, 
   X, 
@@ -23,9 +30,6 @@ import {
   Users, 
   Settings, 
   Plus, 
-  Trash2, 
-  LogOut,
-  Image as ImageIcon,
   CheckCircle,
   ArrowRight,
   Leaf,
@@ -39,14 +43,134 @@ import {
 const firebaseConfig = JSON.parse(__firebase_config);
 const app = initializeApp(firebaseConfig);
 const auth = getAuth(app);
-const db = getFirestore(app);
-const appId = typeof __app_id !== 'undefined' ? __app_id : 'sanora-interior-organic';
-const apiKey = ""; // Provided by environment
+// IndexedDB-backed cache shared across tabs; snapshots can be served locally before the network answers.
+// Pre-rendering runs without a browser, so it falls back to an in-memory cache.
+const isBrowser = typeof window !== 'undefined';
+export const db = initializeFirestore(app, {
+  localCache: isBrowser ? persistentLocalCache({ tabManager: persistentMultipleTabManager() }) : memoryLocalCache()
+});
+export const storage = getStorage(app);
+export const appId = typeof __app_id !== 'undefined' ? __app_id : 'sanora-interior-organic';
+// gemini-proxy.mjs holds the API key; requests go there, never to Google directly
+const geminiProxy = typeof __gemini_proxy !== 'undefined' ? __gemini_proxy : '/api/gemini';
+const metricsEndpoint = typeof __metrics_endpoint !== 'undefined' ? __metrics_endpoint : null;
+
+// --- Performance Metrics ---
+// recordMetric() keeps a rolling window of samples per metric for the Studio
+// Portal and forwards every event to the active sink: a no-op by default, a
+// sendBeacon batcher when __metrics_endpoint is provided, or an in-memory sink
+// for tests.
+const METRIC_SAMPLE_LIMIT = 500;
+const BEACON_BATCH_SIZE = 50;
+const BEACON_INTERVAL = 10000;
+
+export const noopSink = { record: () => {}, flush: () => {} };
+
+export function createMemorySink() {
+  const events = [];
+  return { events, record: (event) => events.push(event), flush: () => {} };
+}
+
+export function createBeaconSink(endpoint) {
+  let queue = [];
+  const flush = () => {
+    if (!queue.length) return;
+    const body = JSON.stringify(queue);
+    queue = [];
+    if (!navigator.sendBeacon?.(endpoint, body)) {
+      fetch(endpoint, { method: 'POST', body, keepalive: true }).catch(() => {});
+    }
+  };
+  if (isBrowser) {
+    setInterval(flush, BEACON_INTERVAL);
+    document.addEventListener('visibilitychange', () => document.visibilityState === 'hidden' && flush());
+  }
+  return {
+    record: (event) => {
+      queue.push(event);
+      if (queue.length >= BEACON_BATCH_SIZE) flush();
+    },
+    flush
+  };
+}
+
+let metricsSink = metricsEndpoint && isBrowser ? createBeaconSink(metricsEndpoint) : noopSink;
+const metricSamples = new Map();
+
+/** Replaces the metrics sink and returns the one it replaced. */
+export function setMetricsSink(sink) {
+  const previous = metricsSink;
+  metricsSink = sink || noopSink;
+  return previous;
+}
+
+export function recordMetric(name, value = 1, tags = {}) {
+  const samples = metricSamples.get(name) ?? [];
+  samples.push(value);
+  if (samples.length > METRIC_SAMPLE_LIMIT) samples.shift();
+  metricSamples.set(name, samples);
+  metricsSink.record({ name, value, tags, at: Date.now() });
+}
+
+export const percentile = (sorted, p) => sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))];
+
+export function getMetricSummaries() {
+  return [...metricSamples].map(([name, samples]) => {
+    const sorted = [...samples].sort((a, b) => a - b);
+    return {
+      name,
+      count: samples.length,
+      total: samples.reduce((sum, v) => sum + v, 0),
+      p50: percentile(sorted, 0.5),
+      p90: percentile(sorted, 0.9),
+      p99: percentile(sorted, 0.99)
+    };
+  }).sort((a, b) => a.name.localeCompare(b.name));
+}
+
+export function reportError(err, context) {
+  console.error(err);
+  recordMetric('error', 1, { context, message: err?.message });
+}
+
+// LCP is final at the first interaction; CLS and INP (approximated by the
+// slowest interaction) are reported when the page is hidden.
+function observeWebVitals() {
+  if (!isBrowser || typeof PerformanceObserver === 'undefined') return;
+  let lcp = 0;
+  let cls = 0;
+  let inp = 0;
+  const observe = (type, onEntry, options = {}) => {
+    try {
+      new PerformanceObserver(list => list.getEntries().forEach(onEntry)).observe({ type, buffered: true, ...options });
+    } catch (err) { /* entry type not supported by this browser */ }
+  };
+  observe('largest-contentful-paint', entry => { lcp = entry.startTime; });
+  observe('layout-shift', entry => { if (!entry.hadRecentInput) cls += entry.value; });
+  observe('event', entry => { if (entry.interactionId) inp = Math.max(inp, entry.duration); }, { durationThreshold: 40 });
+
+  let lcpReported = false;
+  const reportLcp = () => {
+    if (lcpReported || !lcp) return;
+    lcpReported = true;
+    recordMetric('web_vitals.lcp_ms', lcp);
+  };
+  ['keydown', 'pointerdown'].forEach(type => addEventListener(type, reportLcp, { once: true, capture: true }));
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState !== 'hidden') return;
+    reportLcp();
+    recordMetric('web_vitals.cls', cls);
+    if (inp) recordMetric('web_vitals.inp_ms', inp);
+    metricsSink.flush();
+  });
+}
+
+observeWebVitals();
 
 /**
  * SANORA LOGO: 
  */
-const SanoraLogo = ({ className = "h-12", dark = false }) => (
+export const SanoraLogo = ({ className = "h-12", dark = false }) => (
   <div className={`flex items-center gap-4 ${className} group cursor-pointer`}>
     <div className="relative w-12 h-12 flex items-center justify-center">
       <div className="absolute inset-0 bg-[#C4A484] rounded-xl rotate-3 opacity-20 group-hover:rotate-6 transition-transform"></div>
@@ -67,40 +191,1226 @@ const SanoraLogo = ({ className = "h-12", dark = false }) => (
   </div>
 );
 
+// --- Responsive Images ---
+const IMAGE_WIDTHS = [400, 640, 960, 1280, 1600, 2000];
+export const PLACEHOLDER_WIDTH = 16;
+
+// Width-specific URL for hosts that resize on the fly; null when the source can't be resized.
+export function imageVariant(src, width) {
+  try {
+    const url = new URL(src);
+    if (url.hostname !== 'images.unsplash.com') return null;
+    url.searchParams.set('w', width);
+    return url.toString();
+  } catch (err) { return null; }
+}
+
+// Uploaded projects carry their own stored variants; otherwise derive them from the host.
+const buildSrcSet = (src, variants) => variants?.length
+  ? variants.map(v => `${v.url} ${v.width}w`).join(', ')
+  : IMAGE_WIDTHS
+    .map(w => imageVariant(src, w) && `${imageVariant(src, w)} ${w}w`)
+    .filter(Boolean)
+    .join(', ');
+
+/**
+ * Fills its (already sized) parent with a srcset-backed image. Below-the-fold
+ * images are only requested once they approach the viewport; until then the
+ * stored blur-up thumbnail or average color holds the space, and a <noscript>
+ * lazy <img> keeps the image in pre-rendered HTML for crawlers.
+ */
+export function ResponsiveImage({ src, variants, alt = '', sizes = '100vw', priority = false, placeholderColor, placeholderImage, className = '' }) {
+  const ref = useRef(null);
+  const [visible, setVisible] = useState(priority);
+  const [loaded, setLoaded] = useState(false);
+  const srcSet = buildSrcSet(src, variants);
+
+  useEffect(() => {
+    if (visible) return;
+    if (typeof IntersectionObserver === 'undefined') return setVisible(true);
+    const observer = new IntersectionObserver(([entry]) => {
+      if (entry.isIntersecting) {
+        setVisible(true);
+        observer.disconnect();
+      }
+    }, { rootMargin: '300px' });
+    observer.observe(ref.current);
+    return () => observer.disconnect();
+  }, [visible]);
+
+  return (
+    <div ref={ref} className="relative w-full h-full overflow-hidden" style={{ backgroundColor: placeholderColor }}>
+      {placeholderImage && !loaded && (
+        <img src={placeholderImage} alt="" aria-hidden="true" className="absolute inset-0 w-full h-full object-cover blur-xl scale-110" />
+      )}
+      {!visible && (
+        <noscript>
+          <img src={src} srcSet={srcSet || undefined} sizes={srcSet ? sizes : undefined} alt={alt} loading="lazy" decoding="async" className={className} />
+        </noscript>
+      )}
+      {visible && (
+        <img
+          src={src}
+          srcSet={srcSet || undefined}
+          sizes={srcSet ? sizes : undefined}
+          alt={alt}
+          loading={priority ? 'eager' : 'lazy'}
+          fetchpriority={priority ? 'high' : undefined}
+          decoding="async"
+          onLoad={() => setLoaded(true)}
+          className={`${className} ${priority || loaded ? 'opacity-100' : 'opacity-0'}`}
+        />
+      )}
+    </div>
+  );
+}
+
+// Builds a dedicated worker from self-contained function sources; throws where
+// workers are unavailable (pre-render) or blocked by CSP.
+export function createInlineWorker(sources, main) {
+  const source = `${sources.map(fn => `const ${fn.name} = ${fn};`).join('\n')}\n(${main})();`;
+  return new Worker(URL.createObjectURL(new Blob([source], { type: 'text/javascript' })));
+}
+
+const GALLERY_SIZES = ['(min-width: 768px) 58vw, 100vw', '(min-width: 768px) 42vw, 100vw', '(min-width: 768px) 33vw, 100vw'];
+
 // --- Gemini API Helper ---
-async function callGemini(prompt, systemPrompt) {
-  let retries = 0;
-  const maxRetries = 5;
-  
-  while (retries < maxRetries) {
+const GEMINI_MODEL = 'gemini-2.5-flash-preview-09-2025';
+
+// --- Gemini Response Cache ---
+// Responses are keyed on (model, systemPrompt, normalized prompt), expire after
+// CACHE_TTL, are evicted least-recently-used past CACHE_MAX_ENTRIES and survive
+// reloads through localStorage. Identical concurrent calls share one request.
+// This is the visitor's own copy; the proxy keeps the cache shared by everyone.
+const CACHE_TTL = 1000 * 60 * 30;
+const CACHE_MAX_ENTRIES = 100;
+const CACHE_STORAGE_KEY = `sanora-gemini-cache:${appId}`;
+
+const geminiCache = {
+  entries: new Map(),
+  inFlight: new Map(),
+  stats: { hits: 0, misses: 0, coalesced: 0 }
+};
+
+const normalizePrompt = (text = '') => text.trim().replace(/\s+/g, ' ');
+const cacheKey = (model, prompt, systemPrompt, generationConfig) =>
+  JSON.stringify([model, normalizePrompt(systemPrompt), normalizePrompt(prompt), generationConfig ?? null]);
+
+function loadGeminiCache() {
+  try {
+    const stored = JSON.parse(localStorage.getItem(CACHE_STORAGE_KEY) || '[]');
+    const now = Date.now();
+    stored.filter(([, entry]) => entry.expires > now).forEach(([key, entry]) => geminiCache.entries.set(key, entry));
+  } catch (err) { /* storage unavailable or corrupt; start empty */ }
+}
+
+function persistGeminiCache() {
+  try {
+    localStorage.setItem(CACHE_STORAGE_KEY, JSON.stringify([...geminiCache.entries]));
+  } catch (err) { /* quota exceeded or storage disabled; keep in memory only */ }
+}
+
+function readCache(key) {
+  const entry = geminiCache.entries.get(key);
+  if (!entry) return undefined;
+  geminiCache.entries.delete(key);
+  if (entry.expires <= Date.now()) {
+    persistGeminiCache();
+    return undefined;
+  }
+  geminiCache.entries.set(key, entry); // re-insert to mark as most recently used
+  return entry.value;
+}
+
+function writeCache(key, value) {
+  geminiCache.entries.delete(key);
+  geminiCache.entries.set(key, { value, expires: Date.now() + CACHE_TTL });
+  while (geminiCache.entries.size > CACHE_MAX_ENTRIES) {
+    geminiCache.entries.delete(geminiCache.entries.keys().next().value);
+  }
+  persistGeminiCache();
+}
+
+function countCache(kind) {
+  geminiCache.stats[kind]++;
+  recordMetric(`gemini.cache.${kind}`);
+}
+
+export function getGeminiCacheStats() {
+  const { hits, misses, coalesced } = geminiCache.stats;
+  const total = hits + misses;
+  return { hits, misses, coalesced, size: geminiCache.entries.size, hitRate: total ? hits / total : 0 };
+}
+
+export function clearGeminiCache() {
+  geminiCache.entries.clear();
+  persistGeminiCache();
+}
+
+loadGeminiCache();
+
+// --- Gemini Request Queue ---
+// Every attempt waits for one of GEMINI_MAX_CONCURRENCY slots, and a successful
+// one keeps it until its response body has been read, so a burst of clicks
+// queues instead of streaming in parallel into the quota. The proxy's worker
+// pool and per-user token buckets answer overload with 503/429, which the
+// retry policy below backs off from. Background (speculative) requests queue
+// behind foreground ones and never take the last slot.
+const GEMINI_MAX_CONCURRENCY = 2;
+const BACKGROUND_RESERVE = 1;
+
+const geminiQueue = { active: 0, waiting: [] };
+
+function drainGeminiQueue() {
+  let next;
+  while ((next = geminiQueue.waiting.find(w => !w.background) ?? geminiQueue.waiting[0])
+    && geminiQueue.active < GEMINI_MAX_CONCURRENCY - (next.background ? BACKGROUND_RESERVE : 0)) {
+    geminiQueue.active++;
+    geminiQueue.waiting = geminiQueue.waiting.filter(w => w !== next);
+    next.grant();
+  }
+}
+
+/** Resolves with an idempotent release() callback once a slot is available. */
+function acquireGeminiSlot(signal, { background = false } = {}) {
+  const queued = performance.now();
+  return new Promise((resolve, reject) => {
+    if (signal?.aborted) return reject(signal.reason);
+    const onAbort = () => {
+      geminiQueue.waiting = geminiQueue.waiting.filter(w => w !== waiter);
+      reject(signal.reason);
+    };
+    const waiter = {
+      background,
+      grant: () => {
+        signal?.removeEventListener('abort', onAbort);
+        recordMetric('gemini.queue_wait_ms', performance.now() - queued);
+        let released = false;
+        resolve(() => {
+          if (released) return;
+          released = true;
+          geminiQueue.active--;
+          drainGeminiQueue();
+        });
+      }
+    };
+    signal?.addEventListener('abort', onAbort, { once: true });
+    geminiQueue.waiting.push(waiter);
+    drainGeminiQueue();
+  });
+}
+
+// --- Gemini Retry Policy ---
+// 408/429/5xx and network failures are retried with full-jitter backoff (or the
+// server's Retry-After), bounded by a per-attempt timeout and an overall
+// deadline that starts when the first attempt leaves the queue, so a long
+// queue never times a request out. Other 4xx responses fail immediately. A circuit breaker shared by
+// every caller opens after BREAKER_THRESHOLD consecutive requests (not
+// attempts) have exhausted their retries, and fails fast while it is open.
+const RETRY_POLICY = {
+  maxAttempts: 5,
+  baseDelay: 500,
+  maxDelay: 8000,
+  attemptTimeout: 20000,
+  deadline: 45000
+};
+const BREAKER_THRESHOLD = 5;
+const BREAKER_COOLDOWN = 30000;
+
+const circuitBreaker = { state: 'closed', failures: 0, openedAt: 0 };
+
+// Swappable so the retry policy can be exercised against a mock transport.
+let geminiFetch = (...args) => fetch(...args);
+
+export function setGeminiFetch(fn) {
+  geminiFetch = fn || ((...args) => fetch(...args));
+}
+
+export function getCircuitBreakerState() {
+  return { ...circuitBreaker };
+}
+
+export function resetCircuitBreaker() {
+  Object.assign(circuitBreaker, { state: 'closed', failures: 0, openedAt: 0 });
+}
+
+const geminiError = (message, { status = null, retryable = false, retryAfter = null, cause } = {}) =>
+  Object.assign(new Error(message), { status, retryable, retryAfter, cause });
+
+const isRetryableStatus = (status) => status === 408 || status === 429 || status >= 500;
+
+function parseRetryAfter(header) {
+  if (!header) return null;
+  const seconds = Number(header);
+  if (Number.isFinite(seconds)) return Math.max(0, seconds * 1000);
+  const date = Date.parse(header);
+  return Number.isNaN(date) ? null : Math.max(0, date - Date.now());
+}
+
+const backoffDelay = (attempt) =>
+  Math.random() * Math.min(RETRY_POLICY.maxDelay, RETRY_POLICY.baseDelay * 2 ** (attempt - 1));
+
+export const sleep = (ms, signal) => new Promise((resolve, reject) => {
+  if (signal?.aborted) return reject(signal.reason);
+  const timer = setTimeout(() => {
+    signal?.removeEventListener('abort', onAbort);
+    resolve();
+  }, ms);
+  const onAbort = () => { clearTimeout(timer); reject(signal.reason); };
+  signal?.addEventListener('abort', onAbort, { once: true });
+});
+
+function acquireCircuit() {
+  if (circuitBreaker.state === 'closed') return;
+  if (circuitBreaker.state === 'open' && Date.now() - circuitBreaker.openedAt >= BREAKER_COOLDOWN) {
+    circuitBreaker.state = 'half-open'; // let a single probe through
+    return;
+  }
+  throw geminiError('Gemini is temporarily unavailable. Please try again shortly.');
+}
+
+function recordSuccess() {
+  Object.assign(circuitBreaker, { state: 'closed', failures: 0 });
+}
+
+function recordFailure() {
+  circuitBreaker.failures++;
+  if (circuitBreaker.state === 'half-open' || circuitBreaker.failures >= BREAKER_THRESHOLD) {
+    Object.assign(circuitBreaker, { state: 'open', openedAt: Date.now() });
+  }
+}
+
+const geminiUrl = (method, query = '') => `${geminiProxy}/${GEMINI_MODEL}:${method}${query && `?${query}`}`;
+
+// The proxy rate-limits per user, so every request carries the visitor's ID
+// token. App signs every visitor in (anonymously if need be), so calls made
+// before that finishes wait for it.
+async function geminiAuthorization() {
+  const user = auth.currentUser ?? await new Promise(resolve => {
+    const unsubscribe = onAuthStateChanged(auth, (next) => {
+      if (next) { unsubscribe(); resolve(next); }
+    });
+  });
+  return `Bearer ${await user.getIdToken()}`;
+}
+
+const geminiBody = (prompt, systemPrompt, generationConfig) => ({
+  contents: [{ parts: [{ text: prompt }] }],
+  systemInstruction: { parts: [{ text: systemPrompt }] },
+  ...(generationConfig && { generationConfig })
+});
+
+/**
+ * Returns `response` with a body that holds the queue slot until it has been
+ * read to the end, errored or been cancelled, or `signal` aborts.
+ */
+function holdGeminiSlot(response, release, signal) {
+  if (!response.body) {
+    release();
+    return response;
+  }
+  signal?.addEventListener('abort', release, { once: true });
+  const reader = response.body.getReader();
+  const body = new ReadableStream({
+    async pull(controller) {
+      try {
+        const { value, done } = await reader.read();
+        if (done) {
+          release();
+          controller.close();
+        } else {
+          controller.enqueue(value);
+        }
+      } catch (err) {
+        release();
+        controller.error(err);
+      }
+    },
+    cancel(reason) {
+      release();
+      return reader.cancel(reason);
+    }
+  });
+  return new Response(body, { status: response.status, statusText: response.statusText, headers: response.headers });
+}
+
+/**
+ * POSTs to the Gemini proxy under RETRY_POLICY and the circuit breaker and
+ * resolves with the first successful Response, which keeps its queue slot
+ * until the body is consumed. Aborting `signal` cancels the current attempt,
+ * any pending backoff and, once resolved, the response body. `background`
+ * requests use the low-priority queue lane and fetch priority.
+ */
+async function fetchGemini(url, body, { signal, background } = {}) {
+  let deadline = null;
+  let lastError;
+  let attempt;
+
+  for (attempt = 1; attempt <= RETRY_POLICY.maxAttempts; attempt++) {
+    const authorization = await geminiAuthorization();
+    const release = await acquireGeminiSlot(signal, { background });
+    deadline ??= Date.now() + RETRY_POLICY.deadline;
+    if (Date.now() >= deadline) { // a retry that queued past the deadline
+      release();
+      attempt--;
+      break;
+    }
+    try {
+      acquireCircuit();
+    } catch (err) {
+      release();
+      throw err;
+    }
+    const controller = new AbortController();
+    const onAbort = () => controller.abort(signal.reason);
+    signal?.addEventListener('abort', onAbort, { once: true });
+    const timeout = setTimeout(() => controller.abort(), Math.min(RETRY_POLICY.attemptTimeout, deadline - Date.now()));
+    let ok = false;
+
     try {
-      const response = await fetch(`https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-09-2025:generateContent?key=${apiKey}`, {
+      const response = await geminiFetch(url, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          contents: [{ parts: [{ text: prompt }] }],
-          systemInstruction: { parts: [{ text: systemPrompt }] }
-        })
+        headers: { 'Content-Type': 'application/json', Authorization: authorization },
+        body: JSON.stringify(body),
+        signal: controller.signal,
+        ...(background && { priority: 'low' })
+      });
+      if (response.ok) {
+        ok = true;
+        recordSuccess();
+        recordMetric('gemini.retries', attempt - 1);
+        return holdGeminiSlot(response, release, signal);
+      }
+      response.body?.cancel().catch(() => {});
+      lastError = geminiError(`Gemini request failed (${response.status})`, {
+        status: response.status,
+        retryable: isRetryableStatus(response.status),
+        retryAfter: parseRetryAfter(response.headers.get('Retry-After'))
       });
-      
-      if (!response.ok) throw new Error('API failed');
-      const data = await response.json();
-      return data.candidates?.[0]?.content?.parts?.[0]?.text;
     } catch (err) {
-      retries++;
-      await new Promise(r => setTimeout(r, Math.pow(2, retries) * 1000));
+      if (signal?.aborted) {
+        if (circuitBreaker.state === 'half-open') circuitBreaker.state = 'open'; // probe abandoned, allow the next one
+        throw err;
+      }
+      lastError = geminiError(controller.signal.aborted ? 'Gemini request timed out' : 'Gemini network error', { retryable: true, cause: err });
+    } finally {
+      clearTimeout(timeout);
+      if (!ok) { // a returned response stays abortable and holds its slot
+        signal?.removeEventListener('abort', onAbort);
+        release();
+      }
     }
+
+    if (!lastError.retryable) {
+      recordSuccess(); // the endpoint answered; the request itself is at fault
+      recordMetric('gemini.retries', attempt - 1);
+      throw lastError;
+    }
+    if (circuitBreaker.state === 'half-open') break; // the probe failed; reopen without retrying
+    if (attempt === RETRY_POLICY.maxAttempts) break;
+    const delay = lastError.retryAfter ?? backoffDelay(attempt);
+    if (Date.now() + delay >= deadline) break;
+    await sleep(delay, signal);
   }
-  throw new Error('Failed to generate content after retries.');
+  recordFailure();
+  recordMetric('gemini.retries', attempt - 1);
+  throw lastError;
+}
+
+async function requestGemini(prompt, systemPrompt, { signal, generationConfig } = {}) {
+  const response = await fetchGemini(geminiUrl('generateContent'), geminiBody(prompt, systemPrompt, generationConfig), { signal });
+  const data = await response.json();
+  return data.candidates?.[0]?.content?.parts?.[0]?.text;
 }
 
+// --- Gemini Streaming ---
+// Time-to-first-token samples (ms) for streamed generations, newest last.
+const geminiStreamStats = { samples: [] };
+
+export function getGeminiStreamStats() {
+  const sorted = [...geminiStreamStats.samples].sort((a, b) => a - b);
+  return {
+    count: sorted.length,
+    last: geminiStreamStats.samples[geminiStreamStats.samples.length - 1] ?? null,
+    median: sorted.length ? sorted[Math.floor(sorted.length / 2)] : null
+  };
+}
+
+const parseSseEvent = (event) => event
+  .split(/\r?\n/)
+  .filter(line => line.startsWith('data:'))
+  .map(line => {
+    try {
+      return JSON.parse(line.slice(5)).candidates?.[0]?.content?.parts?.map(p => p.text || '').join('') || '';
+    } catch (err) { return ''; }
+  })
+  .join('');
+
+/**
+ * Streams a generation from streamGenerateContent (SSE), yielding text chunks
+ * as they arrive. Aborting `signal` cancels the underlying request.
+ */
+async function* streamGemini(prompt, systemPrompt, { signal, onFirstToken, generationConfig, background } = {}) {
+  const started = performance.now();
+  const key = cacheKey(GEMINI_MODEL, prompt, systemPrompt, generationConfig);
+  const cached = readCache(key);
+  if (cached !== undefined) {
+    countCache('hits');
+    onFirstToken?.(performance.now() - started);
+    yield cached;
+    return;
+  }
+  countCache('misses');
+
+  const response = await fetchGemini(geminiUrl('streamGenerateContent', 'alt=sse'), geminiBody(prompt, systemPrompt, generationConfig), { signal, background });
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let text = '';
+  let finished = false;
+  const emit = (chunk) => {
+    if (!text) {
+      const ttft = performance.now() - started;
+      geminiStreamStats.samples = [...geminiStreamStats.samples.slice(-49), ttft];
+      recordMetric('gemini.ttft_ms', ttft);
+      onFirstToken?.(ttft);
+    }
+    text += chunk;
+  };
+
+  try {
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const events = buffer.split(/\r?\n\r?\n/);
+      buffer = events.pop();
+      for (const event of events) {
+        const chunk = parseSseEvent(event);
+        if (chunk) { emit(chunk); yield chunk; }
+      }
+    }
+    const tail = parseSseEvent(buffer + decoder.decode());
+    if (tail) { emit(tail); yield tail; }
+    finished = true;
+  } finally {
+    if (!finished) reader.cancel().catch(() => {});
+  }
+  recordMetric('gemini.response_ms', performance.now() - started, { stream: true });
+  if (text) writeCache(key, text);
+}
+
+async function callGemini(prompt, systemPrompt, { generationConfig } = {}) {
+  const key = cacheKey(GEMINI_MODEL, prompt, systemPrompt, generationConfig);
+  const cached = readCache(key);
+  if (cached !== undefined) {
+    countCache('hits');
+    return cached;
+  }
+  if (geminiCache.inFlight.has(key)) {
+    countCache('coalesced');
+    return geminiCache.inFlight.get(key);
+  }
+
+  const pending = (async () => {
+    countCache('misses');
+    const started = performance.now();
+    const text = await requestGemini(prompt, systemPrompt, { generationConfig });
+    recordMetric('gemini.response_ms', performance.now() - started);
+    if (text) writeCache(key, text);
+    return text;
+  })().finally(() => geminiCache.inFlight.delete(key));
+  geminiCache.inFlight.set(key, pending);
+  return pending;
+}
+
+// --- Prompt Templates ---
+// Each template's system instruction, output schema and token cap are compiled
+// once at load; callers only supply the per-request input. Thinking is
+// disabled so the whole maxOutputTokens budget goes to the answer.
+export const BLURB_BATCH_SIZE = 10;
+const BLURB_MAX_TOKENS = 160;
+
+const CONCEPT_SYSTEM = "You are SANORA's lead interior architect. From the user's brief, draft a sophisticated design concept: a poetic name for the space, a 3-sentence description of the atmosphere, suggested materials (wood types, antique finishes) and one biophilic color accent (like wasabi, olive, or sage) with its hex value. Keep it professional and architectural.";
+
+const CONCEPT_SCHEMA = {
+  type: 'OBJECT',
+  properties: {
+    name: { type: 'STRING' },
+    atmosphere: { type: 'STRING' },
+    materials: { type: 'ARRAY', items: { type: 'STRING' } },
+    accentColor: { type: 'STRING' },
+    accentHex: { type: 'STRING' }
+  },
+  required: ['name', 'atmosphere', 'materials', 'accentColor', 'accentHex'],
+  propertyOrdering: ['name', 'atmosphere', 'materials', 'accentColor', 'accentHex']
+};
+
+const PROMPT_TEMPLATES = compileTemplates({
+  concept: {
+    system: CONCEPT_SYSTEM,
+    prompt: (brief) => brief,
+    maxOutputTokens: 512,
+    schema: CONCEPT_SCHEMA
+  },
+  conceptDraft: {
+    system: `${CONCEPT_SYSTEM} Be brief: one sentence of atmosphere and at most three materials.`,
+    prompt: (brief) => brief,
+    maxOutputTokens: 192,
+    schema: CONCEPT_SCHEMA
+  },
+  blurb: {
+    system: "You are a professional architectural copywriter. Write exactly two sentences. Be elegant and sophisticated.",
+    prompt: (project) =>
+      `Write a short, luxury-focused marketing blurb for a project named "${project.name}" located in "${project.location}". Focus on organic materials and high-end design.`,
+    maxOutputTokens: BLURB_MAX_TOKENS
+  },
+  blurbBatch: {
+    system: "You are a professional architectural copywriter. Write exactly two sentences per project. Be elegant and sophisticated.",
+    prompt: (projects) =>
+      `Write a short, luxury-focused marketing blurb for each project below. Focus on organic materials and high-end design. Return one {"id", "blurb"} object per project, using the given ids.\n\n${JSON.stringify(projects.map(({ id, name, location }) => ({ id, name, location })))}`,
+    maxOutputTokens: BLURB_BATCH_SIZE * BLURB_MAX_TOKENS,
+    schema: {
+      type: 'ARRAY',
+      items: {
+        type: 'OBJECT',
+        properties: { id: { type: 'STRING' }, blurb: { type: 'STRING' } },
+        required: ['id', 'blurb']
+      }
+    }
+  }
+});
+
+function compileTemplates(definitions) {
+  return Object.fromEntries(Object.entries(definitions).map(([name, { system, prompt, maxOutputTokens, schema }]) => [name, Object.freeze({
+    system,
+    prompt,
+    generationConfig: Object.freeze({
+      maxOutputTokens,
+      thinkingConfig: { thinkingBudget: 0 },
+      ...(schema && { responseMimeType: 'application/json', responseSchema: schema })
+    })
+  })]));
+}
+
+// Rendered prompts are memoized per input object; store documents keep their
+// identity between snapshots, so repeat clicks reuse the same string.
+const renderedPrompts = new WeakMap();
+
+function renderPrompt(name, input) {
+  const template = PROMPT_TEMPLATES[name];
+  if (typeof input !== 'object' || input === null) return template.prompt(input);
+  const rendered = renderedPrompts.get(input) ?? {};
+  rendered[name] ??= template.prompt(input);
+  renderedPrompts.set(input, rendered);
+  return rendered[name];
+}
+
+export function runTemplate(name, input, options = {}) {
+  const { system, generationConfig } = PROMPT_TEMPLATES[name];
+  return callGemini(renderPrompt(name, input), system, { ...options, generationConfig });
+}
+
+export function streamTemplate(name, input, options = {}) {
+  const { system, generationConfig } = PROMPT_TEMPLATES[name];
+  return streamGemini(renderPrompt(name, input), system, { ...options, generationConfig });
+}
+
+const unescapeJsonString = (raw) => {
+  try {
+    return JSON.parse(`"${raw.replace(/\\$/, '')}"`);
+  } catch (err) { return raw; }
+};
+
+/**
+ * Reads a concept from the JSON text streamed so far. Until the object is
+ * complete, fields are recovered individually so they can render as they arrive.
+ */
+export function readConcept(text) {
+  try {
+    return { materials: [], ...JSON.parse(text), complete: true };
+  } catch (err) { /* still streaming */ }
+  const field = (key) => {
+    const match = text.match(new RegExp(`"${key}"\\s*:\\s*"((?:[^"\\\\]|\\\\.)*)`));
+    return match ? unescapeJsonString(match[1]) : undefined;
+  };
+  const list = text.match(/"materials"\s*:\s*\[([^\]]*)/);
+  return {
+    name: field('name'),
+    atmosphere: field('atmosphere'),
+    materials: list ? [...list[1].matchAll(/"((?:[^"\\]|\\.)*)"/g)].map(m => unescapeJsonString(m[1])) : [],
+    accentColor: field('accentColor'),
+    accentHex: field('accentHex'),
+    complete: false
+  };
+}
+
+// --- Concept Prefetch ---
+// Opt-in via __concept_prefetch. Once the brief has been idle for idleMs, a
+// short conceptDraft is requested in the background; clicking Generate with
+// the same brief shows it at once. Drafts are cancelled as soon as the brief
+// changes, and each tab session gets at most maxPerSession of them. The
+// concept.prefetch.* metrics count drafts sent, used, wasted and skipped.
+const PREFETCH_POLICY = {
+  enabled: typeof __concept_prefetch !== 'undefined' && !!__concept_prefetch,
+  idleMs: 1200,
+  minLength: 12,
+  maxPerSession: 5
+};
+const PREFETCH_BUDGET_KEY = `sanora-concept-prefetch:${appId}`;
+
+function takePrefetchBudget() {
+  try {
+    const used = Number(sessionStorage.getItem(PREFETCH_BUDGET_KEY)) || 0;
+    if (used >= PREFETCH_POLICY.maxPerSession) return false;
+    sessionStorage.setItem(PREFETCH_BUDGET_KEY, String(used + 1));
+    return true;
+  } catch (err) { return false; } // no way to enforce the budget, so don't speculate
+}
+
+/** Starts a background draft for `brief`; returns { brief, controller, promise } or null when over budget. */
+function startConceptDraft(brief) {
+  if (!takePrefetchBudget()) {
+    recordMetric('concept.prefetch.skipped');
+    return null;
+  }
+  recordMetric('concept.prefetch.sent');
+  const controller = new AbortController();
+  const promise = (async () => {
+    let text = '';
+    for await (const chunk of streamTemplate('conceptDraft', brief, { signal: controller.signal, background: true })) text += chunk;
+    return text;
+  })().catch(err => {
+    if (err.name !== 'AbortError') reportError(err, 'concept-prefetch');
+    return '';
+  });
+  return { brief, controller, promise };
+}
+
+function discardConceptDraft(draft) {
+  if (!draft) return;
+  draft.controller.abort();
+  recordMetric('concept.prefetch.wasted');
+}
+
+/** Runs `worker` over `items`, at most `limit` at a time. */
+export async function runWithConcurrency(items, limit, worker) {
+  let next = 0;
+  const runners = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (next < items.length) await worker(items[next++]);
+  });
+  await Promise.all(runners);
+}
+
+// --- Static Pre-render ---
+// prerender.jsx renders <App /> to HTML from exported projects/services and
+// inlines the same data with prerenderScript(), so the client hydrates against
+// identical store state before any snapshot arrives. The data is read once at
+// module evaluation: globalThis.__SANORA_PRERENDER__ must be set before this
+// module is imported, both in the build and by the inlined script on the page.
+const PRERENDER_GLOBAL = '__SANORA_PRERENDER__';
+const prerendered = globalThis[PRERENDER_GLOBAL] || {};
+
+export function prerenderScript({ projects = [], services = [] }) {
+  const json = JSON.stringify({ projects, services }).replace(/</g, '\\u003c');
+  return `<script>window.${PRERENDER_GLOBAL} = ${json};</script>`;
+}
+
+// --- Collection Subscription Store ---
+// One shared onSnapshot listener per collection, retained while any mounted
+// component needs it. docChanges() are applied to a keyed map so unchanged
+// documents keep their object identity across snapshots. Public collections
+// are also mirrored to localStorage so the first frame renders the last known
+// data (stale-while-revalidate) before auth and the first snapshot arrive.
+const collectionStores = new Map();
+const PERSISTED_COLLECTIONS = ['projects', 'services'];
+
+const collectionCacheKey = (name) => `sanora-collection:${appId}:${name}`;
+
+function readCollectionCache(name) {
+  try {
+    const cached = JSON.parse(localStorage.getItem(collectionCacheKey(name)));
+    return Array.isArray(cached) ? cached : null;
+  } catch (err) { return null; }
+}
+
+function writeCollectionCache(name, docs) {
+  try {
+    localStorage.setItem(collectionCacheKey(name), JSON.stringify(docs));
+  } catch (err) { /* storage full or disabled; live data still renders */ }
+}
+
+function createCollectionStore(name) {
+  const persist = PERSISTED_COLLECTIONS.includes(name);
+  const seeded = Array.isArray(prerendered[name]) ? prerendered[name] : null;
+  const cached = (persist ? readCollectionCache(name) : null) ?? seeded;
+  const docs = new Map(cached?.map(d => [d.id, d]));
+  const listeners = new Set();
+  // Hydration must match the pre-rendered HTML, so React reads serverState until it has hydrated
+  const serverState = seeded ? { docs: seeded, loaded: true } : { docs: [], loaded: false };
+  let state = cached ? { docs: cached, loaded: true } : serverState;
+  let live = false;
+  let retainers = 0;
+  let unsubscribe = null;
+
+  const apply = (s) => {
+    const changes = s.docChanges();
+    if (!s.metadata.fromCache && changes.length) recordMetric(`firestore.reads.${name}`, changes.length);
+    if (live && !changes.length) return;
+    const previous = live ? null : new Map(docs); // reconcile the locally cached copy
+    if (!live) docs.clear();
+    live = true;
+    changes.forEach(change => {
+      if (change.type === 'removed') return docs.delete(change.doc.id);
+      const next = { id: change.doc.id, ...change.doc.data() };
+      const stale = previous?.get(next.id);
+      docs.set(next.id, stale && JSON.stringify(stale) === JSON.stringify(next) ? stale : next);
+    });
+    state = { docs: s.docs.map(d => docs.get(d.id)), loaded: true };
+    recordMetric(`firestore.snapshot_docs.${name}`, state.docs.length);
+    if (persist) writeCollectionCache(name, state.docs);
+    listeners.forEach(listener => listener());
+  };
+
+  return {
+    getSnapshot: () => state,
+    getServerSnapshot: () => serverState,
+    subscribe: (listener) => {
+      listeners.add(listener);
+      return () => listeners.delete(listener);
+    },
+    retain: () => {
+      if (retainers++ === 0) {
+        unsubscribe = onSnapshot(collection(db, 'artifacts', appId, 'public', 'data', name), apply, err => reportError(err, `snapshot:${name}`));
+      }
+      return () => {
+        if (--retainers === 0) {
+          unsubscribe();
+          unsubscribe = null;
+          live = false;
+        }
+      };
+    }
+  };
+}
+
+function getCollectionStore(name) {
+  if (!collectionStores.has(name)) collectionStores.set(name, createCollectionStore(name));
+  return collectionStores.get(name);
+}
+
+// Selectors must be stable references so memoized results survive re-renders.
+const selectDocs = (state) => state.docs;
+const selectProjects = (state) => state.loaded && !state.docs.length ? defaultProjects : state.docs;
+const selectServices = (state) => state.loaded && !state.docs.length ? defaultServices : state.docs;
+
+/**
+ * Subscribes the calling component to a collection under
+ * artifacts/{appId}/public/data once `user` is signed in.
+ */
+function useCollection(name, user, selector = selectDocs) {
+  const store = getCollectionStore(name);
+  const state = useSyncExternalStore(store.subscribe, store.getSnapshot, store.getServerSnapshot);
+
+  useEffect(() => {
+    if (!user) return;
+    return store.retain();
+  }, [store, user]);
+
+  return useMemo(() => selector(state), [state, selector]);
+}
+
+// --- Project Search ---
+// An inverted index over project name, location and blurb with
+// prefix matching and city/region facet counts. It lives in a Web Worker built
+// from createSearchIndex's source, so it must not reference anything outside
+// its own body; without Worker support, or once the worker fails, the same
+// index runs in-thread.
+function createSearchIndex() {
+  const postings = new Map();
+  const docs = new Map();
+  let sortedTokens = null;
+
+  const tokenize = (text) => String(text || '')
+    .toLowerCase()
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .split(/[^a-z0-9]+/)
+    .filter(Boolean);
+
+  const facetsOf = (location) => {
+    const [city, region] = String(location || '').split(',').map(part => part.trim());
+    return { city: city || null, region: region || null };
+  };
+
+  function remove(id) {
+    const entry = docs.get(id);
+    if (!entry) return;
+    entry.tokens.forEach(token => {
+      const ids = postings.get(token);
+      ids.delete(id);
+      if (!ids.size) {
+        postings.delete(token);
+        sortedTokens = null;
+      }
+    });
+    docs.delete(id);
+  }
+
+  function upsert(doc) {
+    remove(doc.id);
+    const tokens = new Set([doc.name, doc.location, doc.blurb].flatMap(tokenize));
+    tokens.forEach(token => {
+      if (!postings.has(token)) {
+        postings.set(token, new Set());
+        sortedTokens = null;
+      }
+      postings.get(token).add(doc.id);
+    });
+    docs.set(doc.id, { tokens, ...facetsOf(doc.location) });
+  }
+
+  function prefixMatches(prefix) {
+    sortedTokens ??= [...postings.keys()].sort();
+    let lo = 0;
+    let hi = sortedTokens.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (sortedTokens[mid] < prefix) lo = mid + 1;
+      else hi = mid;
+    }
+    const ids = new Set();
+    for (let i = lo; i < sortedTokens.length && sortedTokens[i].startsWith(prefix); i++) {
+      postings.get(sortedTokens[i]).forEach(id => ids.add(id));
+    }
+    return ids;
+  }
+
+  function search(query, facet) {
+    const started = performance.now();
+    let matches = null;
+    for (const term of tokenize(query)) {
+      const ids = prefixMatches(term);
+      matches = matches ? new Set([...matches].filter(id => ids.has(id))) : ids;
+      if (!matches.size) break;
+    }
+    matches ??= new Set(docs.keys());
+    const facets = { city: {}, region: {} };
+    matches.forEach(id => {
+      const entry = docs.get(id);
+      ['city', 'region'].forEach(field => {
+        if (entry[field]) facets[field][entry[field]] = (facets[field][entry[field]] || 0) + 1;
+      });
+    });
+    const ids = facet ? [...matches].filter(id => docs.get(id)[facet.field] === facet.value) : [...matches];
+    return { ids, facets, elapsed: performance.now() - started };
+  }
+
+  return { upsert, remove, search };
+}
+
+function searchWorkerMain() {
+  const index = createSearchIndex();
+  self.onmessage = ({ data }) => {
+    if (data.type === 'upsert') data.docs.forEach(index.upsert);
+    else if (data.type === 'remove') data.ids.forEach(index.remove);
+    else if (data.type === 'search') self.postMessage({ requestId: data.requestId, ...index.search(data.query, data.facet) });
+  };
+}
+
+function createSearchClient() {
+  const indexed = new Map();
+  const pending = new Map();
+  let requestId = 0;
+  let worker = null;
+  let local = null;
+
+  // Rejects the searches in flight and rebuilds the index in-thread from the last synced projects
+  const fallBack = (err) => {
+    if (!worker) return;
+    reportError(err, 'search-worker');
+    worker.terminate();
+    worker = null;
+    local = createSearchIndex();
+    indexed.forEach(local.upsert);
+    pending.forEach(({ reject }) => reject(err));
+    pending.clear();
+  };
+
+  try {
+    worker = createInlineWorker([createSearchIndex], searchWorkerMain);
+    worker.onmessage = ({ data }) => {
+      pending.get(data.requestId)?.resolve(data);
+      pending.delete(data.requestId);
+    };
+    worker.onerror = (event) => fallBack(event.error || new Error(event.message || 'Search worker failed'));
+    worker.onmessageerror = () => fallBack(new Error('Search worker sent an unreadable message'));
+  } catch (err) {
+    local = createSearchIndex(); // no Worker (pre-render) or blocked by CSP
+  }
+
+  const send = (message) => {
+    if (worker) return worker.postMessage(message);
+    if (message.type === 'upsert') message.docs.forEach(local.upsert);
+    else message.ids.forEach(local.remove);
+  };
+
+  return {
+    // Diffs by object identity, so only documents the store actually replaced are re-indexed
+    sync(projects) {
+      const seen = new Set(projects.map(p => p.id));
+      const removed = [...indexed.keys()].filter(id => !seen.has(id));
+      const changed = projects.filter(p => indexed.get(p.id) !== p);
+      removed.forEach(id => indexed.delete(id));
+      changed.forEach(p => indexed.set(p.id, p));
+      if (removed.length) send({ type: 'remove', ids: removed });
+      if (changed.length) {
+        send({ type: 'upsert', docs: changed.map(({ id, name, location, blurb }) => ({ id, name, location, blurb })) });
+      }
+    },
+    search(query, facet) {
+      if (!worker) return Promise.resolve(local.search(query, facet));
+      return new Promise((resolve, reject) => {
+        pending.set(++requestId, { resolve, reject });
+        worker.postMessage({ type: 'search', requestId, query, facet });
+      });
+    }
+  };
+}
+
+let projectSearch = null;
+
+/**
+ * Filters `projects` through the shared search index. Returns the matching
+ * projects in their original order plus facet counts for the current query.
+ */
+export function useProjectSearch(projects, query, facet) {
+  const [result, setResult] = useState(null);
+  projectSearch ??= isBrowser ? createSearchClient() : null;
+
+  useEffect(() => {
+    if (!projectSearch) return;
+    let current = true;
+    projectSearch.sync(projects);
+    // A search the worker dropped is asked again of the in-thread index it fell back to
+    projectSearch.search(query, facet).catch(() => projectSearch.search(query, facet)).then(r => {
+      if (!current) return;
+      setResult(r);
+      recordMetric('search.query_ms', r.elapsed);
+    });
+    return () => { current = false; };
+  }, [projects, query, facet]);
+
+  return useMemo(() => {
+    if (!result || (!query.trim() && !facet)) return { projects, facets: result?.facets, elapsed: result?.elapsed };
+    const ids = new Set(result.ids);
+    return { projects: projects.filter(p => ids.has(p.id)), facets: result.facets, elapsed: result.elapsed };
+  }, [projects, result, query, facet]);
+}
+
+// --- Lead Analytics ---
+// Lead counts are aggregated at write time, so the Studio Portal reads a few
+// summary documents instead of scanning `leads`. All-time totals are spread
+// over STATS_SHARDS documents in `leadStats` to avoid a hot document, and so
+// is each per-day rollup, as `leadStatsDaily/{YYYY-MM-DD}_{shard}` (UTC) with
+// a `date` field; a write lands on the same shard index in both. Leads
+// increment the counters in the same batch that creates them, tagging each
+// counter with the lead id (`lastLead`) so firestore.rules can check that the
+// lead is new and counted once. Each browser session counts one visit for the
+// conversion rate. firestore.rules also pins the shard ids to STATS_SHARDS.
+// The Studio Portal's side of the counters lives in admin.jsx.
+const STATS_SHARDS = 8;
+const VISIT_SESSION_KEY = `sanora-visit:${appId}`;
+const CONCEPT_SESSION_KEY = `sanora-concept-used:${appId}`;
+
+export const dayKey = (ms) => new Date(ms).toISOString().slice(0, 10);
+
+// Adds the numeric counters of one shard document into `sum`
+export const sumStats = (sum, data) => {
+  Object.entries(data).forEach(([field, n]) => {
+    if (typeof n === 'number') sum[field] = (sum[field] || 0) + n;
+  });
+  return sum;
+};
+
+export const dataRef = (col, id) => doc(db, 'artifacts', appId, 'public', 'data', col, id);
+
+const asIncrements = (counts) =>
+  Object.fromEntries(Object.entries(counts).filter(([, n]) => n).map(([field, n]) => [field, increment(n)]));
+
+/**
+ * Adds `days` (date -> counts, a null date counting towards the totals only)
+ * to one random total shard, and to the same shard of each day, through a
+ * batch or transaction, with `marker` fields set alongside.
+ */
+export function addStats(writer, days, marker = {}) {
+  const shard = String(Math.floor(Math.random() * STATS_SHARDS));
+  const totals = {};
+  days.forEach((counts, date) => {
+    sumStats(totals, counts);
+    const fields = asIncrements(counts);
+    if (date && Object.keys(fields).length) {
+      writer.set(dataRef('leadStatsDaily', `${date}_${shard}`), { ...fields, ...marker, date }, { merge: true });
+    }
+  });
+  const fields = asIncrements(totals);
+  if (Object.keys(fields).length) writer.set(dataRef('leadStats', shard), { ...fields, ...marker }, { merge: true });
+}
+
+/** Adds `sign` times the counts of `leads` to `days` (see addStats) and returns it. */
+export function leadDays(leads, sign = 1, days = new Map()) {
+  leads.forEach(lead => {
+    const date = Number.isFinite(lead.timestamp) ? dayKey(lead.timestamp) : null;
+    const day = days.get(date) ?? { leads: 0, withConcept: 0 };
+    day.leads += sign;
+    if (lead.usedConcept) day.withConcept += sign;
+    days.set(date, day);
+  });
+  return days;
+}
+
+// null when session storage is unavailable
+function sessionFlag(key) {
+  try {
+    return !!sessionStorage.getItem(key);
+  } catch (err) { return null; }
+}
+
+function setSessionFlag(key) {
+  try {
+    sessionStorage.setItem(key, '1');
+  } catch (err) { /* flag is best-effort */ }
+}
+
+const markConceptUsed = () => setSessionFlag(CONCEPT_SESSION_KEY);
+
+/** Counts this browser session as one visit, once. */
+function recordVisit() {
+  if (sessionFlag(VISIT_SESSION_KEY) !== false) return; // already counted, or no way to tell
+  setSessionFlag(VISIT_SESSION_KEY);
+  const batch = writeBatch(db);
+  addStats(batch, new Map([[dayKey(Date.now()), { visits: 1 }]]));
+  batch.commit().catch(err => reportError(err, 'lead-stats'));
+}
+
+// --- Lead Outbox ---
+// Submissions are queued in localStorage under a client-generated id and
+// flushed once auth and connectivity allow. The id doubles as the document id,
+// and each lead is committed on its own. firestore.rules refuses a counter
+// increment for a lead that already exists, so a retry of a lead that already
+// landed is refused as a whole and dropped: retried flushes and repeated
+// submits neither duplicate leads nor double-count stats. Transient failures are
+// retried with jittered backoff; entries the server refuses on the first try,
+// or that keep failing, are moved to a local quarantine so they never block
+// the leads queued behind them. Tabs share the outbox and take turns flushing
+// it under a Web Lock, so two tabs never commit the same entry at once.
+const OUTBOX_STORAGE_KEY = `sanora-lead-outbox:${appId}`;
+const QUARANTINE_STORAGE_KEY = `sanora-lead-quarantine:${appId}`;
+const OUTBOX_CONCURRENCY = 4;
+const OUTBOX_RETRY = { baseDelay: 2000, maxDelay: 60000, maxAttempts: 6 };
+const QUARANTINE_LIMIT = 50;
+// Firestore error codes that no amount of retrying will fix
+const PERMANENT_WRITE_ERRORS = ['permission-denied', 'invalid-argument', 'already-exists', 'failed-precondition', 'out-of-range'];
+let outboxFlush = null;
+const outboxRetry = { timer: null, failures: 0 };
+
+export const newClientId = () => crypto.randomUUID?.() ?? `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 12)}`;
+
+export function readOutbox() {
+  try {
+    return JSON.parse(localStorage.getItem(OUTBOX_STORAGE_KEY) || '[]');
+  } catch (err) { return []; }
+}
+
+const writeOutbox = (entries) => localStorage.setItem(OUTBOX_STORAGE_KEY, JSON.stringify(entries));
+
+/** Durably queues a lead; throws if local storage is unavailable. */
+export function enqueueLead(id, data) {
+  writeOutbox([...readOutbox().filter(entry => entry.id !== id), { id, data }]);
+  flushLeadOutbox();
+}
+
+/** Stores a new lead and its stats increments in one batch; the rules refuse it if the lead already exists. */
+function commitLead({ id, data }) {
+  const batch = writeBatch(db);
+  batch.set(doc(db, 'artifacts', appId, 'public', 'data', 'leads', id), data);
+  addStats(batch, leadDays([data]), { lastLead: id });
+  return batch.commit();
+}
+
+// Re-reads storage so entries queued by other tabs or forms meanwhile survive; `update` null removes the entry
+const settleOutboxEntry = (id, update) =>
+  writeOutbox(readOutbox().flatMap(entry => entry.id !== id ? [entry] : update ? [{ ...entry, ...update }] : []));
+
+function quarantineLead(entry, err) {
+  reportError(err, 'lead-outbox');
+  recordMetric('lead_outbox.quarantined');
+  try {
+    const kept = JSON.parse(localStorage.getItem(QUARANTINE_STORAGE_KEY) || '[]');
+    const record = { ...entry, error: err.code || err.message, quarantinedAt: Date.now() };
+    localStorage.setItem(QUARANTINE_STORAGE_KEY, JSON.stringify([...kept, record].slice(-QUARANTINE_LIMIT)));
+  } catch (storageErr) { /* nothing more we can keep */ }
+}
+
+// Browsers without the Web Locks API flush each tab independently
+const withOutboxLock = (work) => navigator.locks?.request(OUTBOX_STORAGE_KEY, work) ?? work();
+
+export function flushLeadOutbox() {
+  if (outboxFlush) return outboxFlush;
+  if (!auth.currentUser || !navigator.onLine) return Promise.resolve();
+  clearTimeout(outboxRetry.timer);
+  outboxFlush = (async () => {
+    let retry = false;
+    try {
+      await withOutboxLock(async () => {
+        const tried = new Set();
+        let entries;
+        while ((entries = readOutbox().filter(entry => !tried.has(entry.id))).length) {
+          entries.forEach(entry => tried.add(entry.id));
+          await runWithConcurrency(entries, OUTBOX_CONCURRENCY, async (entry) => {
+            try {
+              await commitLead(entry);
+              settleOutboxEntry(entry.id, null);
+            } catch (err) {
+              const attempts = (entry.attempts || 0) + 1;
+              if (err.code === 'permission-denied' && entry.attempts) {
+                // An earlier attempt whose reply was lost already stored it
+                settleOutboxEntry(entry.id, null);
+                recordMetric('lead_outbox.replayed');
+              } else if (PERMANENT_WRITE_ERRORS.includes(err.code) || attempts >= OUTBOX_RETRY.maxAttempts) {
+                settleOutboxEntry(entry.id, null);
+                quarantineLead({ ...entry, attempts }, err);
+              } else {
+                settleOutboxEntry(entry.id, { attempts });
+                retry = true;
+              }
+            }
+          });
+        }
+      });
+    } catch (err) {
+      reportError(err, 'lead-outbox');
+      retry = true;
+    } finally {
+      outboxFlush = null;
+    }
+    if (!retry) {
+      outboxRetry.failures = 0;
+      return;
+    }
+    const delay = Math.random() * Math.min(OUTBOX_RETRY.maxDelay, OUTBOX_RETRY.baseDelay * 2 ** outboxRetry.failures++);
+    outboxRetry.timer = setTimeout(flushLeadOutbox, delay);
+  })();
+  return outboxFlush;
+}
+
+// The Studio Portal is its own chunk, fetched the first time it is opened
+const AdminDashboard = lazy(() => import('./admin.jsx'));
+
 export default function App() {
   const [user, setUser] = useState(null);
   const [view, setView] = useState('home'); 
-  const [projects, setProjects] = useState([]);
-  const [services, setServices] = useState([]);
-  const [leads, setLeads] = useState([]);
-  const [isMenuOpen, setIsMenuOpen] = useState(false);
 
   useEffect(() => {
     const initAuth = async () => {
@@ -110,174 +1420,276 @@ export default function App() {
         } else {
           await signInAnonymously(auth);
         }
-      } catch (err) { console.error(err); }
+      } catch (err) { reportError(err, 'auth'); }
     };
     initAuth();
     const unsubscribe = onAuthStateChanged(auth, setUser);
     return () => unsubscribe();
   }, []);
 
+  const projects = useCollection('projects', user, selectProjects);
+  const services = useCollection('services', user, selectServices);
+  const openPortal = useCallback(() => setView('admin'), []);
+  const closePortal = useCallback(() => setView('home'), []);
+
+  // Deliver queued consultation requests once signed in, and again whenever we come back online
   useEffect(() => {
     if (!user) return;
-    const qProjects = collection(db, 'artifacts', appId, 'public', 'data', 'projects');
-    const unsubP = onSnapshot(qProjects, (s) => setProjects(s.docs.map(d => ({id: d.id, ...d.data()})).length ? s.docs.map(d => ({id: d.id, ...d.data()})) : defaultProjects), err => console.error(err));
-    
-    const qServices = collection(db, 'artifacts', appId, 'public', 'data', 'services');
-    const unsubS = onSnapshot(qServices, (s) => setServices(s.docs.map(d => ({id: d.id, ...d.data()})).length ? s.docs.map(d => ({id: d.id, ...d.data()})) : defaultServices), err => console.error(err));
-
-    const qLeads = collection(db, 'artifacts', appId, 'public', 'data', 'leads');
-    const unsubL = onSnapshot(qLeads, (s) => setLeads(s.docs.map(d => ({id: d.id, ...d.data()}))), err => console.error(err));
-
-    return () => { unsubP(); unsubS(); unsubL(); };
+    recordVisit();
+    flushLeadOutbox();
+    window.addEventListener('online', flushLeadOutbox);
+    return () => window.removeEventListener('online', flushLeadOutbox);
   }, [user]);
 
-  if (view === 'admin') return <AdminDashboard user={user} projects={projects} services={services} leads={leads} onExit={() => setView('home')} />;
+  if (view === 'admin') return (
+    <Suspense fallback={<div className="min-h-screen bg-[#F9F7F2] flex items-center justify-center"><Loader2 className="animate-spin text-[#84A98C]" size={24} /></div>}>
+      <AdminDashboard user={user} projects={projects} services={services} onExit={closePortal} />
+    </Suspense>
+  );
 
+  // Each section is memoized on stable props, so a snapshot or local state change only re-renders its own subtree
   return (
     <div className="min-h-screen bg-white text-slate-800 font-sans">
-      {/* Navigation */}
-      <nav className="fixed w-full bg-white/90 backdrop-blur-md z-50 border-b border-slate-100 h-24">
-        <div className="max-w-7xl mx-auto px-6 h-full flex justify-between items-center">
-          <SanoraLogo />
-          
-          <div className="hidden md:flex items-center gap-12">
-            {['Projects', 'Services', 'Contact'].map((item) => (
-              <a key={item} href={`#${item.toLowerCase()}`} className="text-xs font-bold uppercase tracking-widest text-slate-500 hover:text-[#84A98C] transition-colors">{item}</a>
-            ))}
-            <button onClick={() => setView('admin')} className="bg-[#C5A059] text-white px-8 py-3 rounded-full text-xs font-bold uppercase tracking-widest hover:bg-[#84A98C] transition-all">
-              Studio Portal
-            </button>
-          </div>
+      <SiteNav onOpenPortal={openPortal} />
+      <HeroSection />
+      <ServicesSection services={services} />
+      <ConceptSection />
+      <GallerySection projects={projects} />
+      <ContactSection />
+      <SiteFooter onOpenPortal={openPortal} />
+    </div>
+  );
+}
 
-          <button className="md:hidden" onClick={() => setIsMenuOpen(!isMenuOpen)}>
-            {isMenuOpen ? <X size={28} /> : <Menu size={28} />}
-          </button>
-        </div>
-      </nav>
-
-      {/* Hero Section */}
-      <section className="relative h-screen flex items-center pt-24">
-        <div className="absolute inset-0 z-0 overflow-hidden">
-          <img 
-            src="https://images.unsplash.com/photo-1615874959474-d609969a20ed?auto=format&fit=crop&q=80&w=2000" 
-            className="w-full h-full object-cover" 
-            alt="Organic Interior"
-          />
-          <div className="absolute inset-0 bg-white/40"></div>
-          <div className="absolute -bottom-24 -left-24 w-96 h-96 bg-[#84A98C]/10 rounded-full blur-[100px]"></div>
-        </div>
+// Set __profile_renders to record a render.<section> metric (commit count and
+// duration) for every section commit, visible in the Studio Portal metrics tab.
+// React only calls onRender in development builds and in its profiling build,
+// so a production bundle records nothing unless react-dom is aliased to
+// react-dom/profiling.
+let profileRenders = typeof __profile_renders !== 'undefined' && !!__profile_renders;
+
+/** Turns section profiling on or off; call before the first render, as it changes the tree. */
+export function setRenderProfiling(enabled) {
+  profileRenders = !!enabled;
+}
+
+const recordRenderCommit = (id, phase, actualDuration) => recordMetric(`render.${id}`, actualDuration, { phase });
+
+/**
+ * memo() for a profiled component. The Profiler sits inside the memo boundary,
+ * so a commit is only recorded when the component itself re-rendered.
+ */
+export function profiled(id, Component) {
+  const Probe = (props) => profileRenders
+    ? <Profiler id={id} onRender={recordRenderCommit}><Component {...props} /></Profiler>
+    : <Component {...props} />;
+  Probe.displayName = Component.name;
+  return memo(Probe);
+}
+
+const SiteNav = profiled('nav', function SiteNav({ onOpenPortal }) {
+  const [isMenuOpen, setIsMenuOpen] = useState(false);
+
+  return (
+    <nav className="fixed w-full bg-white/90 backdrop-blur-md z-50 border-b border-slate-100 h-24">
+      <div className="max-w-7xl mx-auto px-6 h-full flex justify-between items-center">
+        <SanoraLogo />
         
-        <div className="relative z-10 max-w-7xl mx-auto px-6 w-full">
-          <div className="max-w-3xl">
-            <span className="inline-block text-[#C5A059] font-bold text-xs uppercase tracking-[0.5em] mb-6">SANORA DESIGN STUDIO</span>
-            <h1 className="text-6xl md:text-8xl font-light text-slate-900 leading-[1.1] mb-8">
-              Bespoke <br /> 
-              <span className="font-serif italic text-[#84A98C]">Organic Luxury.</span>
-            </h1>
-            <p className="text-lg text-slate-600 mb-10 max-w-lg leading-relaxed border-l-2 border-[#C5A059] pl-6">
-              Interweaving natural oak finishes with antique brass and fresh yellow-green hues to create SANORA living sanctuaries.
-            </p>
-            <div className="flex gap-4">
-              <a href="#contact" className="bg-[#84A98C] text-white px-10 py-5 rounded-full font-bold uppercase tracking-widest text-xs flex items-center gap-3 hover:bg-[#C5A059] transition-all">
-                Book Consultation <ArrowRight size={16} />
-              </a>
-            </div>
-          </div>
-        </div>
-      </section>
-
-      {/* Services Grid */}
-      <section id="services" className="py-32 bg-[#F9F7F2]">
-        <div className="max-w-7xl mx-auto px-6 grid md:grid-cols-3 gap-16">
-          <div className="md:col-span-1">
-            <h2 className="text-4xl font-light text-slate-900 mb-6 tracking-tight leading-tight">SANORA Crafts the <span className="font-serif italic text-[#C5A059]">Soul</span> of Home.</h2>
-            <div className="w-16 h-1 bg-[#84A98C] mb-8"></div>
-            <p className="text-slate-500 text-sm leading-relaxed mb-8">Our signature methodology focuses on the tactile experience of wood, the warmth of antique finishes, and the energy of biophilic color palettes.</p>
-            <div className="p-8 bg-white rounded-3xl border border-slate-100 shadow-sm">
-              <Leaf className="text-[#84A98C] mb-4" />
-              <p className="text-xs font-bold text-slate-400 uppercase tracking-widest">Biophilic Standard</p>
-              <p className="text-slate-700 font-medium mt-1">Sustainability integrated into every grain of wood.</p>
-            </div>
-          </div>
-          
-          <div className="md:col-span-2 grid sm:grid-cols-2 gap-8">
-            {services.map((s) => (
-              <div key={s.id} className="bg-white p-10 rounded-[2.5rem] shadow-sm hover:shadow-xl transition-all group border border-slate-100">
-                <div className="w-12 h-12 rounded-2xl bg-[#84A98C]/10 flex items-center justify-center text-[#84A98C] mb-8 group-hover:bg-[#84A98C] group-hover:text-white transition-all">
-                  <Compass size={24} />
-                </div>
-                <h3 className="text-2xl font-bold mb-4 text-slate-900 tracking-tight">{s.title}</h3>
-                <p className="text-slate-500 text-sm leading-relaxed">{s.description}</p>
-              </div>
-            ))}
-          </div>
+        <div className="hidden md:flex items-center gap-12">
+          {['Projects', 'Services', 'Contact'].map((item) => (
+            <a key={item} href={`#${item.toLowerCase()}`} className="text-xs font-bold uppercase tracking-widest text-slate-500 hover:text-[#84A98C] transition-colors">{item}</a>
+          ))}
+          <button onClick={onOpenPortal} className="bg-[#C5A059] text-white px-8 py-3 rounded-full text-xs font-bold uppercase tracking-widest hover:bg-[#84A98C] transition-all">
+            Studio Portal
+          </button>
         </div>
-      </section>
 
-      {/* AI Concept Section (New Integration) */}
-      <section className="py-32 bg-white">
-        <div className="max-w-4xl mx-auto px-6 text-center">
-            <div className="inline-flex items-center gap-2 px-4 py-2 rounded-full bg-[#84A98C]/10 text-[#84A98C] text-[10px] font-bold uppercase tracking-widest mb-6">
-                <Sparkles size={14} /> New AI Concept Engine
-            </div>
-            <h2 className="text-5xl font-light text-slate-900 mb-8 leading-tight">Can't describe your vision? <br/><span className="italic font-serif">Let us architect it.</span></h2>
-            <p className="text-slate-500 mb-12 leading-relaxed">Type a few words about your dream room—mood, materials, or even a feeling—and SANORA's Vision Architect will draft a professional interior concept for you.</p>
-            <AIConceptGenerator />
+        <button className="md:hidden" onClick={() => setIsMenuOpen(!isMenuOpen)}>
+          {isMenuOpen ? <X size={28} /> : <Menu size={28} />}
+        </button>
+      </div>
+    </nav>
+  );
+});
+
+const HeroSection = profiled('hero', function HeroSection() {
+  return (
+    <section className="relative h-screen flex items-center pt-24">
+      <div className="absolute inset-0 z-0 overflow-hidden">
+        <ResponsiveImage 
+          src="https://images.unsplash.com/photo-1615874959474-d609969a20ed?auto=format&fit=crop&q=80&w=2000" 
+          className="w-full h-full object-cover transition-opacity duration-700" 
+          alt="Organic Interior"
+          placeholderColor="#E8E2D6"
+          priority
+        />
+        <div className="absolute inset-0 bg-white/40"></div>
+        <div className="absolute -bottom-24 -left-24 w-96 h-96 bg-[#84A98C]/10 rounded-full blur-[100px]"></div>
+      </div>
+      
+      <div className="relative z-10 max-w-7xl mx-auto px-6 w-full">
+        <div className="max-w-3xl">
+          <span className="inline-block text-[#C5A059] font-bold text-xs uppercase tracking-[0.5em] mb-6">SANORA DESIGN STUDIO</span>
+          <h1 className="text-6xl md:text-8xl font-light text-slate-900 leading-[1.1] mb-8">
+            Bespoke <br /> 
+            <span className="font-serif italic text-[#84A98C]">Organic Luxury.</span>
+          </h1>
+          <p className="text-lg text-slate-600 mb-10 max-w-lg leading-relaxed border-l-2 border-[#C5A059] pl-6">
+            Interweaving natural oak finishes with antique brass and fresh yellow-green hues to create SANORA living sanctuaries.
+          </p>
+          <div className="flex gap-4">
+            <a href="#contact" className="bg-[#84A98C] text-white px-10 py-5 rounded-full font-bold uppercase tracking-widest text-xs flex items-center gap-3 hover:bg-[#C5A059] transition-all">
+              Book Consultation <ArrowRight size={16} />
+            </a>
+          </div>
         </div>
-      </section>
+      </div>
+    </section>
+  );
+});
 
-      {/* Portfolio Gallery */}
-      <section id="projects" className="py-32 bg-[#F9F7F2]">
-        <div className="max-w-7xl mx-auto px-6 mb-20 text-center">
-          <h2 className="text-5xl font-light text-slate-900 tracking-tight">Curation of <span className="font-serif italic">Natural Spaces</span></h2>
+const ServicesSection = profiled('services', function ServicesSection({ services }) {
+  return (
+    <section id="services" className="py-32 bg-[#F9F7F2]">
+      <div className="max-w-7xl mx-auto px-6 grid md:grid-cols-3 gap-16">
+        <div className="md:col-span-1">
+          <h2 className="text-4xl font-light text-slate-900 mb-6 tracking-tight leading-tight">SANORA Crafts the <span className="font-serif italic text-[#C5A059]">Soul</span> of Home.</h2>
+          <div className="w-16 h-1 bg-[#84A98C] mb-8"></div>
+          <p className="text-slate-500 text-sm leading-relaxed mb-8">Our signature methodology focuses on the tactile experience of wood, the warmth of antique finishes, and the energy of biophilic color palettes.</p>
+          <div className="p-8 bg-white rounded-3xl border border-slate-100 shadow-sm">
+            <Leaf className="text-[#84A98C] mb-4" />
+            <p className="text-xs font-bold text-slate-400 uppercase tracking-widest">Biophilic Standard</p>
+            <p className="text-slate-700 font-medium mt-1">Sustainability integrated into every grain of wood.</p>
+          </div>
         </div>
         
-        <div className="max-w-[1600px] mx-auto px-6 grid grid-cols-1 md:grid-cols-12 gap-6">
-          {projects.map((p, i) => (
-            <div key={p.id} className={`relative group overflow-hidden rounded-[2rem] bg-slate-100 ${i === 0 ? 'md:col-span-7 aspect-video' : i === 1 ? 'md:col-span-5 aspect-[4/5]' : 'md:col-span-4 aspect-square'}`}>
-              <img src={p.image} className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-1000" alt={p.name} />
-              <div className="absolute inset-0 bg-gradient-to-t from-slate-900/60 to-transparent flex flex-col justify-end p-10 opacity-0 group-hover:opacity-100 transition-opacity">
-                <span className="text-[#84A98C] font-bold text-xs uppercase tracking-widest mb-2">{p.location}</span>
-                <h4 className="text-white text-3xl font-bold tracking-tight">{p.name}</h4>
+        <div className="md:col-span-2 grid sm:grid-cols-2 gap-8">
+          {services.map((s) => (
+            <div key={s.id} className="bg-white p-10 rounded-[2.5rem] shadow-sm hover:shadow-xl transition-all group border border-slate-100">
+              <div className="w-12 h-12 rounded-2xl bg-[#84A98C]/10 flex items-center justify-center text-[#84A98C] mb-8 group-hover:bg-[#84A98C] group-hover:text-white transition-all">
+                <Compass size={24} />
               </div>
+              <h3 className="text-2xl font-bold mb-4 text-slate-900 tracking-tight">{s.title}</h3>
+              <p className="text-slate-500 text-sm leading-relaxed">{s.description}</p>
             </div>
           ))}
         </div>
-      </section>
-
-      {/* Contact Section */}
-      <section id="contact" className="py-32 bg-slate-900 relative overflow-hidden">
-        <div className="absolute inset-0 opacity-10 bg-[url('https://www.transparenttextures.com/patterns/wood-pattern.png')]"></div>
-        <div className="max-w-7xl mx-auto px-6 grid lg:grid-cols-2 gap-24 relative z-10">
-          <div className="text-white">
-            <h2 className="text-6xl font-light leading-tight mb-12 tracking-tight">Your <span className="text-[#C5A059]">SANORA</span> legacy begins here.</h2>
-            <div className="space-y-12">
-              <div className="flex gap-8 items-start">
-                <div className="w-16 h-16 rounded-2xl bg-white/5 border border-white/10 flex items-center justify-center text-[#84A98C]"><Users size={24} /></div>
-                <div><h4 className="font-bold text-[#C5A059] uppercase tracking-widest text-xs mb-2">Visit Atelier</h4><p className="text-xl text-slate-300">Design District, Level 4, Studio 12</p></div>
-              </div>
-              <div className="flex gap-8 items-start">
-                <div className="w-16 h-16 rounded-2xl bg-white/5 border border-white/10 flex items-center justify-center text-[#84A98C]"><Leaf size={24} /></div>
-                <div><h4 className="font-bold text-[#C5A059] uppercase tracking-widest text-xs mb-2">Organic Consulting</h4><p className="text-xl text-slate-300">+91 98765 43210</p></div>
-              </div>
-            </div>
+      </div>
+    </section>
+  );
+});
+
+const ConceptSection = profiled('concept', function ConceptSection() {
+  return (
+    <section className="py-32 bg-white">
+      <div className="max-w-4xl mx-auto px-6 text-center">
+          <div className="inline-flex items-center gap-2 px-4 py-2 rounded-full bg-[#84A98C]/10 text-[#84A98C] text-[10px] font-bold uppercase tracking-widest mb-6">
+              <Sparkles size={14} /> New AI Concept Engine
           </div>
-          <div className="bg-white p-12 rounded-[3rem] shadow-2xl">
-            <LeadForm user={user} />
+          <h2 className="text-5xl font-light text-slate-900 mb-8 leading-tight">Can't describe your vision? <br/><span className="italic font-serif">Let us architect it.</span></h2>
+          <p className="text-slate-500 mb-12 leading-relaxed">Type a few words about your dream room—mood, materials, or even a feeling—and SANORA's Vision Architect will draft a professional interior concept for you.</p>
+          <AIConceptGenerator />
+      </div>
+    </section>
+  );
+});
+
+const GallerySection = profiled('gallery', function GallerySection({ projects }) {
+  const [query, setQuery] = useState('');
+  const [facet, setFacet] = useState(null);
+  const search = useProjectSearch(projects, query, facet);
+
+  return (
+    <section id="projects" className="py-32 bg-[#F9F7F2]">
+      <div className="max-w-7xl mx-auto px-6 mb-20 text-center">
+        <h2 className="text-5xl font-light text-slate-900 tracking-tight">Curation of <span className="font-serif italic">Natural Spaces</span></h2>
+      </div>
+      
+      <div className="max-w-7xl mx-auto px-6 mb-12">
+        <ProjectSearchBar search={search} query={query} onQuery={setQuery} facet={facet} onFacet={setFacet} />
+      </div>
+
+      <div className="max-w-[1600px] mx-auto px-6 grid grid-cols-1 md:grid-cols-12 gap-6">
+        {search.projects.map((p, i) => <GalleryTile key={p.id} project={p} index={i} />)}
+      </div>
+    </section>
+  );
+});
+
+const ContactSection = profiled('contact', function ContactSection() {
+  return (
+    <section id="contact" className="py-32 bg-slate-900 relative overflow-hidden">
+      <div className="absolute inset-0 opacity-10 bg-[url('https://www.transparenttextures.com/patterns/wood-pattern.png')]"></div>
+      <div className="max-w-7xl mx-auto px-6 grid lg:grid-cols-2 gap-24 relative z-10">
+        <div className="text-white">
+          <h2 className="text-6xl font-light leading-tight mb-12 tracking-tight">Your <span className="text-[#C5A059]">SANORA</span> legacy begins here.</h2>
+          <div className="space-y-12">
+            <div className="flex gap-8 items-start">
+              <div className="w-16 h-16 rounded-2xl bg-white/5 border border-white/10 flex items-center justify-center text-[#84A98C]"><Users size={24} /></div>
+              <div><h4 className="font-bold text-[#C5A059] uppercase tracking-widest text-xs mb-2">Visit Atelier</h4><p className="text-xl text-slate-300">Design District, Level 4, Studio 12</p></div>
+            </div>
+            <div className="flex gap-8 items-start">
+              <div className="w-16 h-16 rounded-2xl bg-white/5 border border-white/10 flex items-center justify-center text-[#84A98C]"><Leaf size={24} /></div>
+              <div><h4 className="font-bold text-[#C5A059] uppercase tracking-widest text-xs mb-2">Organic Consulting</h4><p className="text-xl text-slate-300">+91 98765 43210</p></div>
+            </div>
           </div>
         </div>
-      </section>
-
-      <footer className="py-20 bg-white text-center">
-        <SanoraLogo className="mx-auto mb-12" />
-        <div className="flex justify-center gap-12 text-[10px] font-bold uppercase tracking-[0.3em] text-slate-400">
-          <a href="#" className="hover:text-[#84A98C]">Instagram</a>
-          <a href="#" className="hover:text-[#84A98C]">LinkedIn</a>
-          <a href="#" className="hover:text-[#84A98C]">Privacy</a>
-          <button onClick={() => setView('admin')} className="hover:text-[#C5A059]">Admin</button>
+        <div className="bg-white p-12 rounded-[3rem] shadow-2xl">
+          <LeadForm />
         </div>
-        <p className="mt-12 text-[10px] text-slate-300 font-bold uppercase tracking-widest">© 2024 SANORA Interior Atelier.</p>
-      </footer>
+      </div>
+    </section>
+  );
+});
+
+const SiteFooter = profiled('footer', function SiteFooter({ onOpenPortal }) {
+  return (
+    <footer className="py-20 bg-white text-center">
+      <SanoraLogo className="mx-auto mb-12" />
+      <div className="flex justify-center gap-12 text-[10px] font-bold uppercase tracking-[0.3em] text-slate-400">
+        <a href="#" className="hover:text-[#84A98C]">Instagram</a>
+        <a href="#" className="hover:text-[#84A98C]">LinkedIn</a>
+        <a href="#" className="hover:text-[#84A98C]">Privacy</a>
+        <button onClick={onOpenPortal} className="hover:text-[#C5A059]">Admin</button>
+      </div>
+      <p className="mt-12 text-[10px] text-slate-300 font-bold uppercase tracking-widest">© 2024 SANORA Interior Atelier.</p>
+    </footer>
+  );
+});
+
+const GalleryTile = memo(function GalleryTile({ project: p, index: i }) {
+  return (
+    <div className={`relative group overflow-hidden rounded-[2rem] bg-slate-100 ${i === 0 ? 'md:col-span-7 aspect-video' : i === 1 ? 'md:col-span-5 aspect-[4/5]' : 'md:col-span-4 aspect-square'}`}>
+      <ResponsiveImage src={p.image} variants={p.variants} sizes={GALLERY_SIZES[Math.min(i, 2)]} placeholderColor={p.placeholderColor} placeholderImage={p.placeholderImage} className="w-full h-full object-cover group-hover:scale-105 transition-all duration-1000" alt={p.name} />
+      <div className="absolute inset-0 bg-gradient-to-t from-slate-900/60 to-transparent flex flex-col justify-end p-10 opacity-0 group-hover:opacity-100 transition-opacity">
+        <span className="text-[#84A98C] font-bold text-xs uppercase tracking-widest mb-2">{p.location}</span>
+        <h4 className="text-white text-3xl font-bold tracking-tight">{p.name}</h4>
+      </div>
+    </div>
+  );
+});
+
+export function ProjectSearchBar({ search, query, onQuery, facet, onFacet }) {
+  const cities = Object.entries(search.facets?.city || {}).sort((a, b) => b[1] - a[1]);
+
+  return (
+    <div className="space-y-4">
+      <input value={query} onChange={e => onQuery(e.target.value)} placeholder="Search by name, city, material..." className="w-full bg-white p-5 rounded-2xl outline-none border border-slate-100 text-sm text-slate-600" />
+      <div className="flex flex-wrap items-center gap-2">
+        {cities.map(([city, count]) => {
+          const active = facet?.field === 'city' && facet.value === city;
+          return (
+            <button key={city} onClick={() => onFacet(active ? null : { field: 'city', value: city })} className={`px-4 py-2 rounded-full text-[10px] font-bold uppercase tracking-widest transition-all ${active ? 'bg-[#84A98C] text-white' : 'bg-white text-slate-400 border border-slate-100 hover:text-[#84A98C]'}`}>
+              {city} · {count}
+            </button>
+          );
+        })}
+        {search.elapsed !== undefined && (query || facet) && (
+          <span className="ml-auto text-[9px] font-bold uppercase tracking-widest text-slate-300">
+            {search.projects.length} results · {search.elapsed.toFixed(1)} ms
+          </span>
+        )}
+      </div>
     </div>
   );
 }
@@ -286,27 +1698,91 @@ function AIConceptGenerator() {
     const [prompt, setPrompt] = useState("");
     const [result, setResult] = useState("");
     const [loading, setLoading] = useState(false);
+    const [ttft, setTtft] = useState(null);
+    const controllerRef = useRef(null);
+    const draftRef = useRef(null);
+    const concept = useMemo(() => readConcept(result), [result]);
+
+    const cancelStream = () => {
+        controllerRef.current?.abort();
+        controllerRef.current = null;
+        setLoading(false);
+    };
+
+    // Abort any in-flight generation or draft when the visitor leaves the page
+    useEffect(() => () => {
+        controllerRef.current?.abort();
+        discardConceptDraft(draftRef.current);
+    }, []);
+
+    // Speculatively draft the concept once the brief stops changing
+    useEffect(() => {
+        if (!PREFETCH_POLICY.enabled || prompt.trim().length < PREFETCH_POLICY.minLength || draftRef.current) return;
+        const timer = setTimeout(() => {
+            if (!controllerRef.current) draftRef.current = startConceptDraft(prompt);
+        }, PREFETCH_POLICY.idleMs);
+        return () => clearTimeout(timer);
+    }, [prompt]);
 
     const generate = async () => {
         if (!prompt) return;
+        cancelStream();
+        const draft = draftRef.current;
+        draftRef.current = null;
+        const controller = draft?.controller ?? new AbortController();
+        controllerRef.current = controller;
         setLoading(true);
+        setResult("");
+        setTtft(null);
         try {
-            const systemPrompt = "You are SANORA's lead interior architect. Based on the user's brief, provide a sophisticated design concept including: 1. A poetic name for the space. 2. A 3-sentence description of the atmosphere. 3. Suggested materials (mention wood types, antique finishes). 4. A specific biophilic color accent (like wasabi, olive, or sage). Keep it professional and architectural.";
-            const res = await callGemini(prompt, systemPrompt);
-            setResult(res);
+            // Adopt a matching draft (finished or still in flight) before paying for a full generation
+            if (draft) {
+                const started = performance.now();
+                const text = await draft.promise;
+                if (controller.signal.aborted) return;
+                if (readConcept(text).complete) {
+                    markConceptUsed();
+                    recordMetric('concept.prefetch.used');
+                    setTtft(Math.round(performance.now() - started));
+                    setResult(text);
+                    return;
+                }
+                recordMetric('concept.prefetch.wasted');
+            }
+            const stream = streamTemplate('concept', prompt, {
+                signal: controller.signal,
+                onFirstToken: (ms) => setTtft(Math.round(ms))
+            });
+            let text = "";
+            for await (const chunk of stream) {
+                if (controller.signal.aborted) break;
+                text += chunk;
+                setResult(prev => prev + chunk);
+            }
+            if (readConcept(text).complete) markConceptUsed();
         } catch (err) {
-            console.error(err);
+            if (err.name !== 'AbortError') reportError(err, 'concept-engine');
         } finally {
-            setLoading(false);
+            if (controllerRef.current === controller) {
+                controllerRef.current = null;
+                setLoading(false);
+            }
         }
     }
 
+    const handlePromptChange = (e) => {
+        if (controllerRef.current) cancelStream();
+        discardConceptDraft(draftRef.current);
+        draftRef.current = null;
+        setPrompt(e.target.value);
+    }
+
     return (
         <div className="bg-[#F9F7F2] p-8 rounded-[3rem] text-left border border-slate-100 shadow-inner">
             <div className="flex flex-col md:flex-row gap-4 mb-6">
                 <input 
                     value={prompt}
-                    onChange={(e) => setPrompt(e.target.value)}
+                    onChange={handlePromptChange}
                     placeholder="e.g. A sun-drenched library with a view of the forest..."
                     className="flex-1 bg-white p-5 rounded-2xl outline-none border border-slate-100 text-slate-600 italic"
                 />
@@ -321,179 +1797,66 @@ function AIConceptGenerator() {
             </div>
             {result && (
                 <div className="bg-white p-8 rounded-2xl border border-slate-100 animate-in fade-in slide-in-from-bottom-4">
-                    <div className="prose prose-slate prose-sm max-w-none whitespace-pre-wrap text-slate-600 leading-relaxed font-serif">
-                        {result}
-                    </div>
+                    {concept.name || concept.atmosphere ? (
+                        <div className="space-y-6 text-slate-600 leading-relaxed font-serif">
+                            {concept.name && <h3 className="text-3xl font-light text-slate-900 tracking-tight">{concept.name}</h3>}
+                            {concept.atmosphere && <p>{concept.atmosphere}</p>}
+                            {concept.materials.length > 0 && (
+                                <div className="flex flex-wrap gap-2">
+                                    {concept.materials.map((m, i) => (
+                                        <span key={i} className="px-4 py-2 rounded-full bg-[#F9F7F2] text-[10px] font-bold font-sans uppercase tracking-widest text-[#8B7355]">{m}</span>
+                                    ))}
+                                </div>
+                            )}
+                            {concept.accentColor && (
+                                <div className="flex items-center gap-3 text-[10px] font-bold font-sans uppercase tracking-widest text-slate-400">
+                                    <span className="w-6 h-6 rounded-full border border-slate-100" style={{ backgroundColor: /^#[0-9a-f]{6}$/i.test(concept.accentHex || '') ? concept.accentHex : undefined }}></span>
+                                    {concept.accentColor}
+                                </div>
+                            )}
+                        </div>
+                    ) : (
+                        <div className="prose prose-slate prose-sm max-w-none whitespace-pre-wrap text-slate-600 leading-relaxed font-serif">
+                            {result}
+                        </div>
+                    )}
+                    {ttft !== null && (
+                        <p className="mt-6 text-[9px] font-bold uppercase tracking-widest text-slate-300">First words in {ttft} ms</p>
+                    )}
                 </div>
             )}
         </div>
     )
 }
 
-function AdminDashboard({ user, projects, services, leads, onExit }) {
-  const [activeTab, setActiveTab] = useState('projects');
-  const [isAdding, setIsAdding] = useState(false);
-  const [formData, setFormData] = useState({});
-
-  const handleAddProject = async (e) => {
-    e.preventDefault();
-    if (!user) return;
-    try {
-      await addDoc(collection(db, 'artifacts', appId, 'public', 'data', 'projects'), { ...formData, createdAt: Date.now() });
-      setIsAdding(false);
-      setFormData({});
-    } catch (err) { console.error(err); }
-  };
-
-  const deleteItem = async (col, id) => {
-    if (!user) return;
-    try {
-      await deleteDoc(doc(db, 'artifacts', appId, 'public', 'data', col, id));
-    } catch (err) { console.error(err); }
-  };
-
-  return (
-    <div className="min-h-screen bg-[#F9F7F2] flex">
-      <aside className="w-72 bg-white p-10 border-r border-slate-100 hidden lg:flex flex-col">
-        <SanoraLogo className="mb-20" />
-        <nav className="space-y-4 flex-1">
-          {['projects', 'services', 'leads'].map(t => (
-            <button key={t} onClick={() => setActiveTab(t)} className={`w-full text-left p-4 rounded-2xl text-xs font-bold uppercase tracking-widest transition-all ${activeTab === t ? 'bg-[#84A98C] text-white shadow-lg shadow-[#84A98C]/20' : 'text-slate-400 hover:bg-slate-50'}`}>
-              {t}
-            </button>
-          ))}
-        </nav>
-        <button onClick={onExit} className="flex items-center gap-3 text-slate-400 hover:text-red-500 font-bold uppercase text-[10px] tracking-widest">
-          <LogOut size={14} /> Close Portal
-        </button>
-      </aside>
-
-      <main className="flex-1 p-12 overflow-y-auto h-screen">
-        <div className="flex justify-between items-center mb-12">
-          <h1 className="text-3xl font-light text-slate-900 tracking-tight uppercase tracking-[0.2em]">{activeTab}</h1>
-          {activeTab === 'projects' && (
-            <button onClick={() => setIsAdding(true)} className="bg-[#C5A059] text-white px-8 py-3 rounded-full text-[10px] font-bold uppercase tracking-widest">
-              Add Record
-            </button>
-          )}
-        </div>
-
-        {activeTab === 'projects' && (
-          <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">
-            {projects.map(p => (
-              <div key={p.id} className="bg-white rounded-[2rem] overflow-hidden border border-slate-100 shadow-sm group">
-                <div className="h-56 overflow-hidden"><img src={p.image} className="w-full h-full object-cover" /></div>
-                <div className="p-8">
-                  <div className="flex justify-between items-center mb-4">
-                    <div>
-                        <h4 className="font-bold text-slate-900">{p.name}</h4>
-                        <p className="text-[10px] font-bold text-[#84A98C] tracking-widest uppercase">{p.location}</p>
-                    </div>
-                    <button onClick={() => deleteItem('projects', p.id)} className="text-slate-200 hover:text-red-500"><Trash2 size={18} /></button>
-                  </div>
-                  <AIAssistant project={p} />
-                </div>
-              </div>
-            ))}
-          </div>
-        )}
-
-        {activeTab === 'leads' && (
-          <div className="bg-white rounded-[2rem] shadow-sm border border-slate-100 overflow-hidden">
-            <table className="w-full text-left">
-              <thead className="bg-[#F9F7F2]">
-                <tr>
-                  <th className="p-6 text-[10px] font-bold uppercase tracking-widest text-slate-400">Client</th>
-                  <th className="p-6 text-[10px] font-bold uppercase tracking-widest text-slate-400">Contact</th>
-                  <th className="p-6 text-[10px] font-bold uppercase tracking-widest text-slate-400 text-right">Action</th>
-                </tr>
-              </thead>
-              <tbody>
-                {leads.map(l => (
-                  <tr key={l.id} className="border-t border-slate-50">
-                    <td className="p-6 font-bold text-slate-900">{l.name}</td>
-                    <td className="p-6 text-sm text-slate-500">{l.email} / {l.phone}</td>
-                    <td className="p-6 text-right"><button onClick={() => deleteItem('leads', l.id)} className="text-red-500"><Trash2 size={16} /></button></td>
-                  </tr>
-                ))}
-              </tbody>
-            </table>
-          </div>
-        )}
-
-        {isAdding && (
-          <div className="fixed inset-0 bg-slate-950/60 backdrop-blur-sm z-[100] flex items-center justify-center p-6">
-            <div className="bg-white w-full max-w-md rounded-[3rem] p-12">
-              <h2 className="text-2xl font-light mb-8 text-slate-900 tracking-tight uppercase tracking-widest">New Entry</h2>
-              <form onSubmit={handleAddProject} className="space-y-6">
-                <input required type="text" placeholder="Project Title" onChange={e => setFormData({...formData, name: e.target.value})} className="w-full bg-[#F9F7F2] p-4 rounded-2xl outline-none" />
-                <input required type="text" placeholder="Region/City" onChange={e => setFormData({...formData, location: e.target.value})} className="w-full bg-[#F9F7F2] p-4 rounded-2xl outline-none" />
-                <input required type="url" placeholder="Visual URL" onChange={e => setFormData({...formData, image: e.target.value})} className="w-full bg-[#F9F7F2] p-4 rounded-2xl outline-none" />
-                <div className="flex gap-4 pt-4">
-                  <button type="button" onClick={() => setIsAdding(false)} className="flex-1 p-4 bg-slate-100 rounded-2xl font-bold text-[10px] uppercase">Cancel</button>
-                  <button type="submit" className="flex-1 p-4 bg-[#84A98C] text-white rounded-2xl font-bold text-[10px] uppercase">Publish</button>
-                </div>
-              </form>
-            </div>
-          </div>
-        )}
-      </main>
-    </div>
-  );
-}
-
-// AI Assistant for Admin to generate descriptions
-function AIAssistant({ project }) {
-    const [loading, setLoading] = useState(false);
-    const [suggestion, setSuggestion] = useState("");
-
-    const generateBlurb = async () => {
-        setLoading(true);
-        try {
-            const prompt = `Write a short, luxury-focused marketing blurb for a project named "${project.name}" located in "${project.location}". Focus on organic materials and high-end design.`;
-            const system = "You are a professional architectural copywriter. Write exactly two sentences. Be elegant and sophisticated.";
-            const res = await callGemini(prompt, system);
-            setSuggestion(res);
-        } catch (err) {
-            console.error(err);
-        } finally {
-            setLoading(false);
-        }
-    }
-
-    return (
-        <div className="mt-4 pt-4 border-t border-slate-50">
-            <button 
-                onClick={generateBlurb}
-                disabled={loading}
-                className="text-[9px] font-bold uppercase tracking-[0.2em] text-[#C5A059] flex items-center gap-2 hover:text-[#84A98C] transition-colors"
-            >
-                {loading ? <Loader2 className="animate-spin" size={10} /> : <Sparkles size={10} />}
-                ✨ Suggest Marketing Copy
-            </button>
-            {suggestion && (
-                <p className="mt-3 text-[11px] text-slate-400 italic leading-relaxed animate-in fade-in duration-500">
-                    "{suggestion}"
-                </p>
-            )}
-        </div>
-    )
-}
-
-function LeadForm({ user }) {
+function LeadForm() {
   const [sent, setSent] = useState(false);
   const [loading, setLoading] = useState(false);
+  const leadId = useRef(newClientId()); // idempotency key for this form fill
 
   const handleSubmit = async (e) => {
     e.preventDefault();
-    if (!user) return;
-    setLoading(true);
+    if (loading) return;
     const fd = new FormData(e.target);
     const data = Object.fromEntries(fd);
+    const lead = {
+      ...data,
+      nameLower: data.name.trim().toLowerCase(),
+      emailLower: data.email.trim().toLowerCase(),
+      usedConcept: sessionFlag(CONCEPT_SESSION_KEY) === true,
+      timestamp: Date.now()
+    };
     try {
-      await addDoc(collection(db, 'artifacts', appId, 'public', 'data', 'leads'), { ...data, timestamp: Date.now() });
+      enqueueLead(leadId.current, lead);
       setSent(true);
-    } catch (err) { console.error(err); } finally { setLoading(false); }
+    } catch (err) {
+      // No local storage to queue in; write straight through instead
+      setLoading(true);
+      try {
+        await commitLead({ id: leadId.current, data: lead });
+        setSent(true);
+      } catch (err) { reportError(err, 'lead-form'); } finally { setLoading(false); }
+    }
   };
 
   if (sent) return (
@@ -520,7 +1883,7 @@ function LeadForm({ user }) {
   );
 }
 
-const defaultProjects = [
+export const defaultProjects = [
   { id: 'dp1', name: 'The Oak Pavilion', location: 'Vancouver, BC', image: 'https://images.unsplash.com/photo-1600210492486-724fe5c67fb0?auto=format&fit=crop&q=80&w=1200' },
   { id: 'dp2', name: 'Wasabi Minimalist', location: 'Kyoto, JP', image: 'https://images.unsplash.com/photo-1588854337221-4cf9fa96059c?auto=format&fit=crop&q=80&w=800' },
   { id: 'dp3', name: 'Antique Brass Loft', location: 'London, UK', image: 'https://images.unsplash.com/photo-1560448204-e02f11c3d0e2?auto=format&fit=crop&q=80&w=800' },
@@ -0,0 +1,181 @@
+/**
+ * Headless driver for benchmark.jsx. Serves build/bench, seeds the Firebase
+ * emulators from one page, runs the scenarios in a fresh browser profile (so
+ * the landing load is cold) and compares the report with bench/baseline.json:
+ *
+ *   npm run build:bench
+ *   npm run bench           # starts the emulators, exits 1 on a regression
+ *   npm run bench:update    # records bench/baseline.json instead
+ *
+ * Run directly (node bench/run.mjs) when the emulators are already up.
+ * Options: --scenarios landing,leads  --seed projects=60,services=6,leads=1000
+ *          --throttle mobile|none  --tolerance 0.15  --timeout 300000
+ *          --out build/bench-report.json
+ *
+ * The measured run is throttled like a Lighthouse mobile run by default, so
+ * landing's TTFB, FCP and LCP are comparable to Lighthouse's. The page is
+ * bench/index.html, or build/bench/index.html when present: pre-render it
+ * with prerender.jsx to measure the hydrated landing page instead,
+ *
+ *   npm run build:prerender
+ *   FIREBASE_CONFIG='{"apiKey":"demo-key","projectId":"demo-sanora"}' node build/prerender.mjs \
+ *     bench/index.html projects.json services.json > build/bench/index.html
+ *
+ * Timings only compare on like hardware; record the baseline on the machine
+ * that runs the check.
+ */
+import { createServer } from 'node:http';
+import { readFile, writeFile, mkdir } from 'node:fs/promises';
+import { dirname, extname, join, normalize, resolve, sep } from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { parseArgs } from 'node:util';
+import puppeteer from 'puppeteer';
+
+const ROOT = fileURLToPath(new URL('..', import.meta.url));
+const { values: args } = parseArgs({
+  options: {
+    'update-baseline': { type: 'boolean', default: false },
+    scenarios: { type: 'string' },
+    seed: { type: 'string', default: 'projects=60,services=6,leads=1000' },
+    throttle: { type: 'string', default: 'mobile' },
+    tolerance: { type: 'string', default: '0.15' },
+    timeout: { type: 'string', default: '300000' },
+    bundle: { type: 'string', default: 'build/bench' },
+    baseline: { type: 'string', default: 'bench/baseline.json' },
+    out: { type: 'string', default: 'build/bench-report.json' }
+  }
+});
+
+// Ports come from firebase.json, so the page talks to the emulators `firebase emulators:exec` started
+const { emulators } = JSON.parse(await readFile(join(ROOT, 'firebase.json'), 'utf8'));
+const EMULATOR = { host: '127.0.0.1', authPort: emulators.auth.port, firestorePort: emulators.firestore.port };
+const FIREBASE_CONFIG = {
+  apiKey: 'demo-key',
+  authDomain: 'demo-sanora.firebaseapp.com',
+  projectId: 'demo-sanora',
+  storageBucket: 'demo-sanora.appspot.com'
+};
+
+// Lighthouse's simulated mobile profile as DevTools applies it: slow 4G and a 4x slower CPU
+const THROTTLING = {
+  none: null,
+  mobile: { latency: 562.5, download: 1474.56 * 1024 / 8, upload: 675 * 1024 / 8, cpu: 4 }
+};
+if (!(args.throttle in THROTTLING)) {
+  console.error(`--throttle must be one of ${Object.keys(THROTTLING).join(', ')}`);
+  process.exit(1);
+}
+
+const CONTENT_TYPES = { '.js': 'text/javascript', '.css': 'text/css', '.json': 'application/json', '.map': 'application/json' };
+
+// The page at / plus the files esbuild wrote to `dir`
+function serve(dir, page) {
+  const server = createServer(async (req, res) => {
+    const path = new URL(req.url, 'http://localhost').pathname;
+    if (path === '/') {
+      res.writeHead(200, { 'content-type': 'text/html; charset=utf-8' });
+      res.end(page);
+      return;
+    }
+    const file = normalize(join(dir, path));
+    if (!file.startsWith(dir + sep)) {
+      res.writeHead(403);
+      res.end();
+      return;
+    }
+    try {
+      const body = await readFile(file);
+      res.writeHead(200, { 'content-type': CONTENT_TYPES[extname(file)] ?? 'application/octet-stream' });
+      res.end(body);
+    } catch (err) {
+      res.writeHead(404);
+      res.end();
+    }
+  });
+  return new Promise(done => server.listen(0, '127.0.0.1', () => done(server)));
+}
+
+const parseSeed = (spec) => Object.fromEntries(spec.split(',').filter(Boolean).map(pair => {
+  const [col, count] = pair.split('=');
+  return [col.trim(), Number(count)];
+}));
+
+// One page load in its own browser context; resolves with window.__sanoraBenchmark
+async function runPage(browser, url, run, throttling = null) {
+  const context = await browser.createBrowserContext();
+  try {
+    const page = await context.newPage();
+    await page.setViewport({ width: 1440, height: 900 });
+    if (throttling) {
+      const { cpu, ...network } = throttling;
+      await page.emulateNetworkConditions(network);
+      await page.emulateCPUThrottling(cpu);
+    }
+    page.on('pageerror', err => console.error(`page error: ${err.message}`));
+    await page.evaluateOnNewDocument((globals) => Object.assign(window, globals), {
+      __firebase_config: JSON.stringify(FIREBASE_CONFIG),
+      __firebase_emulator: EMULATOR,
+      __gemini_mock: true,
+      __run_benchmarks: run
+    });
+    await page.goto(url);
+    // Polled on a timer rather than every frame, so the driver stays out of the frame timings
+    await page.waitForFunction(() => window.__sanoraBenchmark, { timeout: Number(args.timeout), polling: 500 });
+    const report = await page.evaluate(() => window.__sanoraBenchmark);
+    if (report.error) throw new Error(`Benchmark failed in the page: ${report.error}`);
+    return report;
+  } finally {
+    await context.close();
+  }
+}
+
+const percent = (ratio) => ratio === null ? 'new' : `${ratio >= 1 ? '+' : ''}${((ratio - 1) * 100).toFixed(1)}%`;
+
+const baselineFile = resolve(ROOT, args.baseline);
+const baseline = JSON.parse(await readFile(baselineFile, 'utf8'));
+const hasBaseline = Object.keys(baseline.scenarios ?? {}).length > 0;
+if (hasBaseline && !args['update-baseline'] && baseline.options?.throttle !== args.throttle) {
+  console.error(`${args.baseline} was recorded with --throttle ${baseline.options?.throttle}, not ${args.throttle}`);
+  process.exit(1);
+}
+
+const bundleDir = resolve(ROOT, args.bundle);
+const page = await readFile(join(bundleDir, 'index.html'), 'utf8').catch(() => readFile(join(ROOT, 'bench/index.html'), 'utf8'));
+const server = await serve(bundleDir, page);
+const url = `http://127.0.0.1:${server.address().port}/`;
+const browser = await puppeteer.launch();
+let report;
+try {
+  await runPage(browser, url, { scenarios: [], seed: parseSeed(args.seed) });
+  report = await runPage(browser, url, {
+    scenarios: args.scenarios?.split(','),
+    throttle: args.throttle,
+    tolerance: Number(args.tolerance),
+    baseline: hasBaseline && !args['update-baseline'] ? baseline : null
+  }, THROTTLING[args.throttle]);
+} finally {
+  await browser.close();
+  server.close();
+}
+
+const outFile = resolve(ROOT, args.out);
+await mkdir(dirname(outFile), { recursive: true });
+await writeFile(outFile, `${JSON.stringify(report, null, 2)}\n`);
+console.table(Object.fromEntries(Object.entries(report.scenarios).map(([name, { ms, reads, renders, bytes }]) =>
+  [name, { ms: Math.round(ms), reads, renders, bytes }])));
+
+if (args['update-baseline']) {
+  const { comparison, ...recorded } = report;
+  await writeFile(baselineFile, `${JSON.stringify(recorded, null, 2)}\n`);
+  console.log(`Baseline written to ${args.baseline}`);
+} else if (!report.comparison) {
+  console.warn(`${args.baseline} has no scenarios yet; record it with npm run bench:update`);
+} else {
+  const { regressions, changes, tolerance } = report.comparison;
+  console.table(changes.map(({ scenario, measure, baseline: base, value, ratio, regression }) =>
+    ({ scenario, measure, baseline: base, value, change: percent(ratio), regression })));
+  if (regressions.length) {
+    console.error(`${regressions.length} measurement(s) regressed by more than ${tolerance * 100}% against ${args.baseline}`);
+    process.exitCode = 1;
+  }
+}
@@ -0,0 +1,441 @@
+/**
+ * Benchmark entry for app.py: reproducible performance runs against the
+ * Firebase emulators and the stub Gemini from gemini-stub.mjs. Built on its
+ * own, so none of this ships with the public site, and driven headlessly by
+ * bench/run.mjs:
+ *
+ *   npm run build:bench   # esbuild benchmark.jsx ... --outdir=build/bench
+ *   npm run bench         # emulators + bench/run.mjs, compared with bench/baseline.json
+ *
+ * mountBenchmark() renders <App /> with the react-dom profiling build, so
+ * render commits are counted in the minified bundle too, and hydrates it as
+ * client.jsx does when the page was pre-rendered from bench/index.html.
+ * Configured by globals set before the bundle loads:
+ *   __firebase_emulator  { host, authPort, firestorePort, storagePort } or true
+ *   __gemini_mock        createStubGemini() options (latency, jitter, error rate) or true
+ *   __run_benchmarks     { scenarios, seed, baseline, ...options } or true: runs
+ *                        once signed in and publishes the report (or { error })
+ *                        on window.__sanoraBenchmark for the driver to collect
+ *
+ * seedBenchmarkData() fills the emulator, runBenchmarks() times the in-page
+ * scenarios and reports JSON with timings, render commits, Firestore reads and
+ * bytes, compared against the given baseline or else the one saved in this
+ * browser. Section render
+ * profiling is always on here; the typing and snapshotBurst scenarios fail if
+ * a section commits more often than its memoization allows.
+ */
+import React, { useEffect } from 'react';
+import { createRoot, hydrateRoot } from 'react-dom/profiling';
+import { getAuth, onAuthStateChanged, connectAuthEmulator } from 'firebase/auth';
+import {
+  getFirestore,
+  doc,
+  setDoc,
+  deleteDoc,
+  writeBatch,
+  connectFirestoreEmulator
+} from 'firebase/firestore';
+import { getStorage, connectStorageEmulator } from 'firebase/storage';
+import App, {
+  appId,
+  defaultProjects,
+  setGeminiFetch,
+  setMetricsSink,
+  setRenderProfiling,
+  createMemorySink,
+  getMetricSummaries,
+  reportError,
+  percentile,
+  runWithConcurrency,
+  enqueueLead,
+  flushLeadOutbox,
+  readOutbox,
+  streamTemplate,
+  readConcept
+} from './app.py';
+import { STUB_TEXT, createStubGemini } from './gemini-stub.mjs';
+
+const firebaseEmulator = typeof __firebase_emulator !== 'undefined' ? __firebase_emulator : null;
+const geminiMock = typeof __gemini_mock !== 'undefined' ? __gemini_mock : null;
+const benchmarkRun = typeof __run_benchmarks !== 'undefined' ? __run_benchmarks : null;
+const BENCHMARK_BASELINE_KEY = `sanora-benchmark-baseline:${appId}`;
+const SEED_MAX = 100000;
+const SEED_BATCH = 500;
+const SEED_CONCURRENCY = 4;
+const BENCHMARK_WAIT_MS = 30000;
+const SEED_CITIES = ['Vancouver, BC', 'Kyoto, JP', 'London, UK', 'Mumbai, IN', 'Lisbon, PT', 'Oslo, NO', 'Melbourne, AU', 'Austin, TX'];
+
+const seedDoc = {
+  projects: (i) => ({
+    name: `Bench Residence ${i}`,
+    location: SEED_CITIES[i % SEED_CITIES.length],
+    image: defaultProjects[i % defaultProjects.length].image,
+    createdAt: Date.now() - i * 1000
+  }),
+  services: (i) => ({ title: `Bench Service ${i}`, description: STUB_TEXT }),
+  leads: (i) => ({
+    name: `Bench Client ${i}`,
+    email: `client${i}@example.com`,
+    phone: `+1 555 ${String(i).padStart(7, '0')}`,
+    message: STUB_TEXT,
+    nameLower: `bench client ${i}`,
+    emailLower: `client${i}@example.com`,
+    timestamp: Date.now() - i * 60000
+  })
+};
+
+/**
+ * Writes `counts` synthetic projects, services and leads (up to 100k each)
+ * with fixed `bench-*` ids, so seeding again overwrites rather than grows.
+ * Only runs against the emulator.
+ */
+export async function seedBenchmarkData(counts, { onProgress } = {}) {
+  if (!firebaseEmulator) throw new Error('seedBenchmarkData only runs against the Firebase emulator');
+  const chunks = [];
+  Object.entries(counts).forEach(([col, count]) => {
+    if (!seedDoc[col]) throw new Error(`Unknown collection: ${col}`);
+    for (let start = 0; start < Math.min(count, SEED_MAX); start += SEED_BATCH) {
+      chunks.push({ col, start, end: Math.min(count, SEED_MAX, start + SEED_BATCH) });
+    }
+  });
+  let written = 0;
+  await runWithConcurrency(chunks, SEED_CONCURRENCY, async ({ col, start, end }) => {
+    const batch = writeBatch(getFirestore());
+    for (let i = start; i < end; i++) batch.set(doc(getFirestore(), 'artifacts', appId, 'public', 'data', col, `bench-${i}`), seedDoc[col](i));
+    await batch.commit();
+    onProgress?.(written += end - start);
+  });
+  return written;
+}
+
+const nextFrame = () => new Promise(resolve => requestAnimationFrame(resolve));
+
+// Resolves with the first truthy result of `check`, polled once a frame
+async function waitFor(check, what, timeout = BENCHMARK_WAIT_MS) {
+  const deadline = performance.now() + timeout;
+  for (;;) {
+    const value = check();
+    if (value) return value;
+    if (performance.now() > deadline) throw new Error(`Timed out waiting for ${what}`);
+    await nextFrame();
+  }
+}
+
+// Counts the render.<section> commits made while `action` runs
+async function countCommits(action) {
+  const commits = {};
+  const previous = setMetricsSink({
+    record: (event) => {
+      if (event.name.startsWith('render.')) {
+        const section = event.name.slice('render.'.length);
+        commits[section] = (commits[section] || 0) + 1;
+      }
+      previous.record(event);
+    },
+    flush: () => previous.flush()
+  });
+  try {
+    await action();
+  } finally {
+    setMetricsSink(previous);
+  }
+  return commits;
+}
+
+// Throws unless every section in `limits` committed at most its limit
+function assertCommits(scenario, commits, limits) {
+  const over = Object.entries(limits).filter(([section, max]) => (commits[section] || 0) > max);
+  if (over.length) {
+    throw new Error(`${scenario}: ${over.map(([section, max]) => `${section} committed ${commits[section]} times, expected at most ${max}`).join('; ')}`);
+  }
+}
+
+// Waits for the button as well, since the Studio Portal renders only once its chunk has loaded
+async function clickButton(label) {
+  const button = await waitFor(() => [...document.querySelectorAll('button')].find(b => b.textContent.trim() === label), `a "${label}" button`);
+  button.click();
+  await nextFrame();
+}
+
+const setInputValue = (input, value) => Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set.call(input, value);
+
+// One input event per character, a frame apart, as a person typing would send them
+async function typeInto(input, text) {
+  for (const char of text) {
+    setInputValue(input, input.value + char);
+    input.dispatchEvent(new Event('input', { bubbles: true }));
+    await nextFrame();
+  }
+}
+
+// The latest largest-contentful-paint candidate, which only an observer can read; null if there is none
+const largestContentfulPaint = () => new Promise(resolve => {
+  if (!PerformanceObserver.supportedEntryTypes?.includes('largest-contentful-paint')) return resolve(null);
+  const observer = new PerformanceObserver(list => {
+    observer.disconnect();
+    resolve(list.getEntries().at(-1).startTime);
+  });
+  observer.observe({ type: 'largest-contentful-paint', buffered: true });
+  setTimeout(() => {
+    observer.disconnect();
+    resolve(null);
+  }, 1000);
+});
+
+const HOME_SECTIONS = ['nav', 'hero', 'services', 'concept', 'contact', 'footer'];
+
+// Each scenario resolves with its own measurements; runBenchmarks adds elapsed time, reads, renders and bytes
+export const BENCHMARK_SCENARIOS = {
+  // The app's own load, from navigation until its first server snapshots of projects and services,
+  // with TTFB and LCP as Lighthouse reports them. Measures what already happened, so it reports its
+  // own ms, reads, renders and bytes. Cold when the browser profile is fresh, as bench/run.mjs makes it.
+  // Run it first: LCP stops updating at the first scroll or click
+  async landing() {
+    const firstRead = (col) => loadMetrics.events.find(e => e.name === `firestore.reads.${col}`);
+    const [projects, services] = await Promise.all(['projects', 'services'].map(col =>
+      waitFor(() => firstRead(col), `the app's first ${col} snapshot (is the emulator seeded?)`)));
+    const [nav] = performance.getEntriesByType('navigation');
+    const paint = performance.getEntriesByType('paint').find(entry => entry.name === 'first-contentful-paint');
+    const sinceNavigation = (event) => event.at - performance.timeOrigin;
+    const loaded = loadMetrics.events.filter(e => e.at <= Math.max(projects.at, services.at));
+    return {
+      ttfbMs: nav?.responseStart ?? null,
+      fcpMs: paint?.startTime ?? null,
+      lcpMs: await largestContentfulPaint(),
+      domContentLoadedMs: nav?.domContentLoadedEventEnd ?? null,
+      loadMs: nav?.loadEventEnd ?? null,
+      prerendered: !!globalThis.__SANORA_PRERENDER__,
+      projectsMs: sinceNavigation(projects),
+      servicesMs: sinceNavigation(services),
+      ms: Math.max(sinceNavigation(projects), sinceNavigation(services)),
+      reads: loaded.filter(e => e.name.startsWith('firestore.reads.')).reduce((sum, e) => sum + e.value, 0),
+      renders: loaded.filter(e => e.name.startsWith('render.')).length,
+      bytes: transferredBytes(0)
+    };
+  },
+
+  // Scrolls the page a quarter viewport per frame and measures frame gaps
+  async gallery() {
+    const frames = [];
+    const bottom = document.documentElement.scrollHeight - innerHeight;
+    let last = await nextFrame();
+    for (let y = 0; y <= bottom; y += innerHeight / 4) {
+      scrollTo(0, y);
+      const now = await nextFrame();
+      frames.push(now - last);
+      last = now;
+    }
+    scrollTo(0, 0);
+    const sorted = [...frames].sort((a, b) => a - b);
+    return { frames: frames.length, frameP50Ms: percentile(sorted, 0.5) ?? 0, frameP90Ms: percentile(sorted, 0.9) ?? 0, longFrames: frames.filter(ms => ms > 50).length };
+  },
+
+  // Opens the Studio Portal's leads tab and waits for its first page of rows; the first run includes loading the portal chunk
+  async leads() {
+    const started = performance.now();
+    await clickButton('Studio Portal');
+    const portalMs = performance.now() - started;
+    await clickButton('leads');
+    const rows = await waitFor(() => document.querySelectorAll('tbody input[type="checkbox"]').length, 'the first page of leads (is the emulator seeded?)');
+    const pageMs = performance.now() - started - portalMs;
+    await clickButton('Close Portal');
+    return { portalMs, pageMs, rows };
+  },
+
+  // Queues and flushes `iterations` leads through the outbox; writes real documents, so emulator only
+  // Ids are unique per run, since the rules refuse to count a lead id that already exists
+  async leadSubmit({ iterations = 10 } = {}) {
+    if (!firebaseEmulator) throw new Error('The leadSubmit scenario only runs against the Firebase emulator');
+    const run = Date.now().toString(36);
+    const started = performance.now(); // enqueueLead starts flushing straight away
+    for (let i = 0; i < iterations; i++) {
+      const email = `bench-submit-${run}-${i}@example.com`;
+      enqueueLead(`bench-submit-${run}-${i}`, { name: `Bench Submit ${i}`, email, phone: '', message: STUB_TEXT, nameLower: `bench submit ${i}`, emailLower: email, usedConcept: false, timestamp: Date.now() });
+    }
+    await flushLeadOutbox();
+    return { flushMs: performance.now() - started, leads: iterations, pending: readOutbox().length };
+  },
+
+  // Types into the Studio Portal's add-project form; only the modal may re-render, never the cards behind it
+  async typing({ keystrokes = 24 } = {}) {
+    await clickButton('Studio Portal');
+    await clickButton('Add Record');
+    const input = document.querySelector('input[placeholder="Project Title"]');
+    if (!input) throw new Error('The add-project form did not open');
+    const text = 'Quiet Courtyard Residence '.repeat(Math.ceil(keystrokes / 26)).slice(0, keystrokes);
+    const started = performance.now();
+    const commits = await countCommits(() => typeInto(input, text));
+    const typingMs = performance.now() - started;
+    await clickButton('Cancel');
+    await clickButton('Close Portal');
+    assertCommits('typing', commits, { 'admin-card': 0, 'admin-modal': keystrokes });
+    return { keystrokes, typingMs, modalCommits: commits['admin-modal'] || 0, cardCommits: commits['admin-card'] || 0 };
+  },
+
+  // Rewrites one project `updates` times in quick succession; only the gallery may re-render. Writes, so emulator only
+  async snapshotBurst({ updates = 20 } = {}) {
+    if (!firebaseEmulator) throw new Error('The snapshotBurst scenario only runs against the Firebase emulator');
+    const ref = doc(getFirestore(), 'artifacts', appId, 'public', 'data', 'projects', 'bench-burst');
+    const project = { name: 'Bench Burst', location: SEED_CITIES[0], image: defaultProjects[0].image, createdAt: Date.now() };
+    await setDoc(ref, project);
+    await nextFrame();
+    const started = performance.now();
+    const commits = await countCommits(async () => {
+      await Promise.all(Array.from({ length: updates }, (_, i) => setDoc(ref, { ...project, blurb: `${STUB_TEXT} (${i})` })));
+      await nextFrame();
+      await nextFrame();
+    });
+    const burstMs = performance.now() - started;
+    await deleteDoc(ref);
+    assertCommits('snapshotBurst', commits, { ...Object.fromEntries(HOME_SECTIONS.map(section => [section, 0])), gallery: updates });
+    return { updates, burstMs, galleryCommits: commits.gallery || 0 };
+  },
+
+  // Streams `iterations` uncached concepts and records time to first token and to completion
+  async concept({ iterations = 3 } = {}) {
+    const ttft = [];
+    const total = [];
+    for (let i = 0; i < iterations; i++) {
+      const started = performance.now();
+      let text = '';
+      for await (const chunk of streamTemplate('concept', `Benchmark brief ${Date.now()}-${i}: a calm reading room in oak`, {
+        onFirstToken: (ms) => ttft.push(ms)
+      })) text += chunk;
+      total.push(performance.now() - started);
+      if (!readConcept(text).complete) throw new Error('Concept did not parse');
+    }
+    const sorted = (samples) => [...samples].sort((a, b) => a - b);
+    return { ttftP50Ms: percentile(sorted(ttft), 0.5), totalP50Ms: percentile(sorted(total), 0.5), iterations };
+  }
+};
+
+const transferredBytes = (since) => performance.getEntriesByType('resource')
+  .filter(entry => entry.startTime >= since)
+  .reduce((sum, entry) => sum + (entry.transferSize || entry.encodedBodySize || 0), 0);
+
+/**
+ * Runs the named scenarios one after another and resolves with a JSON-ready
+ * report. Metric events are teed into a memory sink for the duration, so each
+ * scenario's Firestore reads and render commits are counted exactly.
+ */
+export async function runBenchmarks(names = Object.keys(BENCHMARK_SCENARIOS), { baseline, ...options } = {}) {
+  const memory = createMemorySink();
+  const previous = setMetricsSink({ record: (event) => { memory.record(event); previous.record(event); }, flush: () => previous.flush() });
+
+  const scenarios = {};
+  try {
+    for (const name of names) {
+      const first = memory.events.length;
+      const started = performance.now();
+      const result = await BENCHMARK_SCENARIOS[name](options);
+      const events = memory.events.slice(first);
+      scenarios[name] = {
+        ms: performance.now() - started,
+        reads: events.filter(e => e.name.startsWith('firestore.reads.')).reduce((sum, e) => sum + e.value, 0),
+        renders: events.filter(e => e.name.startsWith('render.')).length,
+        bytes: transferredBytes(started),
+        ...result
+      };
+    }
+  } finally {
+    setMetricsSink(previous);
+    recordingLoad = false;
+  }
+
+  const report = {
+    createdAt: new Date().toISOString(),
+    userAgent: navigator.userAgent,
+    emulator: !!firebaseEmulator,
+    gemini: geminiMock ? 'mock' : 'live',
+    options,
+    scenarios,
+    metrics: getMetricSummaries()
+  };
+  const against = baseline ?? loadBenchmarkBaseline();
+  if (against) report.comparison = compareBenchmarks(report, against, options);
+  return report;
+}
+
+export function saveBenchmarkBaseline(report) {
+  localStorage.setItem(BENCHMARK_BASELINE_KEY, JSON.stringify(report));
+}
+
+export function loadBenchmarkBaseline() {
+  try {
+    return JSON.parse(localStorage.getItem(BENCHMARK_BASELINE_KEY));
+  } catch (err) { return null; }
+}
+
+// Measurements where lower is better; anything else (doc counts, iterations) is context
+const isBenchmarkCost = (measure) => /Ms$/.test(measure) || ['ms', 'reads', 'renders', 'bytes', 'longFrames'].includes(measure);
+
+/**
+ * Compares the cost measurements present in both reports. Values more than
+ * `tolerance` (a fraction) above the baseline are regressions.
+ */
+export function compareBenchmarks(report, baseline, { tolerance = 0.15 } = {}) {
+  const changes = [];
+  Object.entries(report.scenarios).forEach(([scenario, current]) => {
+    const base = baseline.scenarios?.[scenario];
+    if (!base) return;
+    Object.entries(current).forEach(([measure, value]) => {
+      if (!isBenchmarkCost(measure) || typeof value !== 'number' || typeof base[measure] !== 'number') return;
+      const ratio = base[measure] ? value / base[measure] : null;
+      changes.push({ scenario, measure, baseline: base[measure], value, ratio, regression: ratio === null ? value > 0 : ratio > 1 + tolerance });
+    });
+  });
+  return { baselineCreatedAt: baseline.createdAt, tolerance, regressions: changes.filter(c => c.regression), changes };
+}
+
+// Module evaluation happens before <App /> first touches Auth, Firestore or
+// Storage, so the emulators can still be connected here.
+if (firebaseEmulator) {
+  const { host = '127.0.0.1', authPort = 9099, firestorePort = 8080, storagePort = 9199 } = firebaseEmulator === true ? {} : firebaseEmulator;
+  connectAuthEmulator(getAuth(), `http://${host}:${authPort}`, { disableWarnings: true });
+  connectFirestoreEmulator(getFirestore(), host, firestorePort);
+  connectStorageEmulator(getStorage(), host, storagePort);
+}
+if (geminiMock) setGeminiFetch(createStubGemini(geminiMock === true ? {} : geminiMock));
+setRenderProfiling(true);
+
+// Metric events from here until the first runBenchmarks() ends, for the landing scenario
+const loadMetrics = createMemorySink();
+let recordingLoad = true;
+const appSink = setMetricsSink({
+  record: (event) => {
+    if (recordingLoad) loadMetrics.record(event);
+    appSink.record(event);
+  },
+  flush: () => appSink.flush()
+});
+
+/** <App /> plus a single __run_benchmarks run once signed in. */
+export default function BenchmarkApp() {
+  useEffect(() => {
+    if (!benchmarkRun) return;
+    const unsubscribe = onAuthStateChanged(getAuth(), (user) => {
+      if (!user) return;
+      unsubscribe();
+      const { scenarios, ...options } = benchmarkRun === true ? {} : benchmarkRun;
+      (options.seed ? seedBenchmarkData(options.seed) : Promise.resolve())
+        .then(() => runBenchmarks(scenarios, options))
+        .then(report => {
+          window.__sanoraBenchmark = report;
+          console.info(JSON.stringify(report));
+        })
+        .catch(err => {
+          reportError(err, 'benchmark');
+          window.__sanoraBenchmark = { error: err.message };
+        });
+    });
+    return unsubscribe;
+  }, []);
+
+  return <App />;
+}
+
+// As client.jsx: hydrate pre-rendered markup, otherwise render from scratch
+export function mountBenchmark(container) {
+  if (container.firstElementChild) hydrateRoot(container, <BenchmarkApp />);
+  else createRoot(container).render(<BenchmarkApp />);
+}
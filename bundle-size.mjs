@@ -0,0 +1,37 @@
+/**
+ * Reports the size of an esbuild build from its metafile: every output chunk
+ * with raw and gzipped bytes, split into what the page loads up front (the
+ * entry and its static imports) and what is only fetched by dynamic import().
+ *
+ *   npm run build && node bundle-size.mjs build/meta.json
+ */
+import { readFileSync } from 'node:fs';
+import { gzipSync } from 'node:zlib';
+
+const metafile = process.argv[2];
+if (!metafile) {
+  console.error('usage: node bundle-size.mjs <meta.json>');
+  process.exit(1);
+}
+const { outputs } = JSON.parse(readFileSync(metafile, 'utf8'));
+const chunks = Object.keys(outputs).filter(file => file.endsWith('.js'));
+
+// Entry chunks and everything they reach through static imports
+const initial = new Set();
+const visit = (file) => {
+  if (initial.has(file)) return;
+  initial.add(file);
+  outputs[file].imports.filter(i => i.kind === 'import-statement').forEach(i => visit(i.path));
+};
+chunks.filter(file => outputs[file].entryPoint).forEach(visit);
+
+const rows = chunks.map(file => ({
+  file,
+  load: initial.has(file) ? 'initial' : 'lazy',
+  bytes: outputs[file].bytes,
+  gzip: gzipSync(readFileSync(file)).length
+}));
+const total = (load) => rows.filter(r => r.load === load).reduce((sum, r) => ({ bytes: sum.bytes + r.bytes, gzip: sum.gzip + r.gzip }), { bytes: 0, gzip: 0 });
+
+console.table(rows);
+console.log(JSON.stringify({ initial: total('initial'), lazy: total('lazy') }));
@@ -0,0 +1,18 @@
+/**
+ * Browser entry for app.py. Hydrates the HTML that prerender.jsx wrote into
+ * #root, so the pre-rendered landing page stays on screen while the bundle
+ * takes it over, and renders from scratch when the page was not pre-rendered:
+ *
+ *   npm run build   # esbuild client.jsx --bundle --splitting ... --outdir=build/app
+ *
+ * The page loads build/app/client.js as a module after <div id="root">.
+ */
+import React from 'react';
+import { createRoot, hydrateRoot } from 'react-dom/client';
+import App from './app.py';
+
+const container = document.getElementById('root');
+
+// prerender.jsx leaves markup in #root; an empty one means a plain client render
+if (container.firstElementChild) hydrateRoot(container, <App />);
+else createRoot(container).render(<App />);
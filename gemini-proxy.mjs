@@ -0,0 +1,335 @@
+/**
+ * Gemini proxy for app.py. It holds the API key and enforces the limits that
+ * only make sense across every visitor: a bounded worker pool in front of the
+ * upstream quota, a token bucket per signed-in user, and a response cache
+ * shared between users. The app reaches it at __gemini_proxy (default
+ * /api/gemini, rewritten here by Hosting or a reverse proxy) with the same
+ * `{model}:{method}` paths as the REST API:
+ *
+ *   GEMINI_API_KEY=... node gemini-proxy.mjs
+ *   GEMINI_STUB=1 node gemini-proxy.mjs     canned replies from gemini-stub.mjs, no key
+ *
+ * Requests carry the visitor's Firebase ID token (anonymous sessions
+ * included) as `Authorization: Bearer`; it is verified with firebase-admin,
+ * which honours FIREBASE_AUTH_EMULATOR_HOST for local runs. Cache hits are
+ * free and skip the bucket; a user out of tokens gets a 429 with Retry-After,
+ * and a full or stalled queue a 503, both of which the client retries.
+ *
+ * Environment:
+ *   PORT, PROXY_PREFIX, ALLOWED_ORIGIN      listener, path prefix, CORS origin
+ *   GEMINI_API_KEY, GEMINI_MODELS           upstream key, comma-separated model allowlist
+ *   GEMINI_STUB, STUB_LATENCY, STUB_ERROR_RATE
+ *   WORKERS, QUEUE_LIMIT, QUEUE_TIMEOUT     concurrent upstream calls, waiting requests, ms
+ *   UPSTREAM_TIMEOUT                        ms per upstream call
+ *   RATE_CAPACITY, RATE_PER_MINUTE          token bucket size and refill
+ *   CACHE_TTL, CACHE_MAX                    ms, entries
+ *   MAX_BODY_BYTES
+ */
+import http from 'node:http';
+import { createHash } from 'node:crypto';
+import { initializeApp } from 'firebase-admin/app';
+import { getAuth } from 'firebase-admin/auth';
+import { createStubGemini } from './gemini-stub.mjs';
+
+const env = process.env;
+const num = (name, fallback) => Number(env[name] ?? fallback);
+
+const config = {
+  port: num('PORT', 8787),
+  prefix: env.PROXY_PREFIX ?? '/api/gemini',
+  allowedOrigin: env.ALLOWED_ORIGIN ?? null,
+  apiKey: env.GEMINI_API_KEY ?? '',
+  models: new Set((env.GEMINI_MODELS ?? 'gemini-2.5-flash-preview-09-2025').split(',').map(m => m.trim())),
+  stub: Boolean(env.GEMINI_STUB),
+  workers: num('WORKERS', 4),
+  queueLimit: num('QUEUE_LIMIT', 100),
+  queueTimeout: num('QUEUE_TIMEOUT', 15000),
+  upstreamTimeout: num('UPSTREAM_TIMEOUT', 20000),
+  rateCapacity: num('RATE_CAPACITY', 10),
+  ratePerMinute: num('RATE_PER_MINUTE', 10),
+  cacheTtl: num('CACHE_TTL', 1000 * 60 * 30),
+  cacheMax: num('CACHE_MAX', 1000),
+  maxBodyBytes: num('MAX_BODY_BYTES', 32 * 1024)
+};
+const BUCKETS_MAX = 10000;
+const GEMINI_API = 'https://generativelanguage.googleapis.com/v1beta/models';
+const ROUTE = /^\/([\w.-]+):(generateContent|streamGenerateContent)$/;
+
+if (!config.stub && !config.apiKey) {
+  console.error('GEMINI_API_KEY is required unless GEMINI_STUB is set');
+  process.exit(1);
+}
+
+initializeApp();
+const auth = getAuth();
+const upstream = config.stub
+  ? createStubGemini({ latency: num('STUB_LATENCY', 400), errorRate: num('STUB_ERROR_RATE', 0) })
+  : fetch;
+
+const httpError = (status, message, headers = {}) => Object.assign(new Error(message), { status, headers });
+
+// --- Worker Pool ---
+// At most `workers` upstream calls run at once; the rest wait in FIFO order up
+// to `queueLimit` and `queueTimeout`.
+const pool = { active: 0, waiting: [] };
+
+function drainPool() {
+  while (pool.active < config.workers && pool.waiting.length) {
+    pool.active++;
+    pool.waiting.shift().grant();
+  }
+}
+
+function acquireWorker(signal) {
+  if (pool.active >= config.workers && pool.waiting.length >= config.queueLimit) {
+    return Promise.reject(httpError(503, 'Gemini queue is full', { 'Retry-After': '2' }));
+  }
+  return new Promise((resolve, reject) => {
+    const leave = (err) => {
+      clearTimeout(timer);
+      signal.removeEventListener('abort', onAbort);
+      pool.waiting = pool.waiting.filter(w => w !== waiter);
+      reject(err);
+    };
+    const onAbort = () => leave(signal.reason);
+    const timer = setTimeout(() => leave(httpError(503, 'Gemini queue timed out', { 'Retry-After': '2' })), config.queueTimeout);
+    const waiter = {
+      grant: () => {
+        clearTimeout(timer);
+        signal.removeEventListener('abort', onAbort);
+        let released = false;
+        resolve(() => {
+          if (released) return;
+          released = true;
+          pool.active--;
+          drainPool();
+        });
+      }
+    };
+    signal.addEventListener('abort', onAbort, { once: true });
+    pool.waiting.push(waiter);
+    drainPool();
+  });
+}
+
+// --- Per-User Token Buckets ---
+// Each uid holds up to rateCapacity tokens, refilled continuously at
+// ratePerMinute. Buckets are kept least-recently-used, so an evicted one only
+// ever belongs to an idle user and simply starts full again.
+const buckets = new Map();
+
+/** Takes a token for `uid`; returns 0, or the ms until one is available. */
+function takeToken(uid) {
+  const now = Date.now();
+  const bucket = buckets.get(uid) ?? { tokens: config.rateCapacity, updated: now };
+  bucket.tokens = Math.min(config.rateCapacity, bucket.tokens + (now - bucket.updated) * config.ratePerMinute / 60000);
+  bucket.updated = now;
+  buckets.delete(uid);
+  buckets.set(uid, bucket);
+  if (buckets.size > BUCKETS_MAX) buckets.delete(buckets.keys().next().value);
+  if (bucket.tokens < 1) return Math.ceil((1 - bucket.tokens) * 60000 / config.ratePerMinute);
+  bucket.tokens--;
+  return 0;
+}
+
+// --- Shared Response Cache ---
+// Generated text keyed on (model, request body), least-recently-used past
+// cacheMax and expiring after cacheTtl. Streamed and one-shot calls share
+// entries; identical one-shot calls in flight share one upstream request.
+const cache = { entries: new Map(), inFlight: new Map(), stats: { hits: 0, misses: 0, coalesced: 0 } };
+
+const cacheKey = (model, body) => createHash('sha256').update(`${model}\n${JSON.stringify(body)}`).digest('hex');
+
+function readCache(key) {
+  const entry = cache.entries.get(key);
+  if (!entry) return undefined;
+  cache.entries.delete(key);
+  if (entry.expires <= Date.now()) return undefined;
+  cache.entries.set(key, entry);
+  return entry.text;
+}
+
+function writeCache(key, text) {
+  cache.entries.delete(key);
+  cache.entries.set(key, { text, expires: Date.now() + config.cacheTtl });
+  while (cache.entries.size > config.cacheMax) cache.entries.delete(cache.entries.keys().next().value);
+}
+
+// --- Upstream ---
+const envelope = (text) => JSON.stringify({ candidates: [{ content: { parts: [{ text }] } }] });
+
+const parseSseEvent = (event) => event
+  .split(/\r?\n/)
+  .filter(line => line.startsWith('data:'))
+  .map(line => {
+    try {
+      return JSON.parse(line.slice(5)).candidates?.[0]?.content?.parts?.map(p => p.text || '').join('') || '';
+    } catch (err) { return ''; }
+  })
+  .join('');
+
+/** Calls Gemini on a pool worker; `use(response)` runs before the worker is released. */
+async function callUpstream(model, method, body, signal, use) {
+  const release = await acquireWorker(signal);
+  const controller = new AbortController();
+  const onAbort = () => controller.abort(signal.reason);
+  signal.addEventListener('abort', onAbort, { once: true });
+  const timeout = setTimeout(() => controller.abort(), config.upstreamTimeout);
+  try {
+    const response = await upstream(`${GEMINI_API}/${model}:${method}${method === 'streamGenerateContent' ? '?alt=sse' : ''}`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json', 'x-goog-api-key': config.apiKey },
+      body: JSON.stringify(body),
+      signal: controller.signal
+    });
+    if (!response.ok) {
+      const detail = await response.text().catch(() => '');
+      console.error(`gemini ${model}:${method} failed (${response.status}) ${detail.slice(0, 200)}`);
+      // The key or request is ours to fix, not the visitor's; anything else is passed on for the client's retry policy
+      const status = response.status === 401 || response.status === 403 ? 502 : response.status;
+      const retryAfter = response.headers.get('Retry-After');
+      throw httpError(status, `Gemini request failed (${response.status})`, retryAfter ? { 'Retry-After': retryAfter } : {});
+    }
+    return await use(response);
+  } catch (err) {
+    if (err.status) throw err;
+    throw httpError(controller.signal.aborted && !signal.aborted ? 504 : 502, 'Gemini is unreachable');
+  } finally {
+    clearTimeout(timeout);
+    signal.removeEventListener('abort', onAbort);
+    release();
+  }
+}
+
+function generate(key, model, body, signal) {
+  if (cache.inFlight.has(key)) {
+    cache.stats.coalesced++;
+    return cache.inFlight.get(key);
+  }
+  // Shared by every waiter, so it is not tied to the first caller's connection
+  const pending = callUpstream(model, 'generateContent', body, new AbortController().signal, async (response) => {
+    const data = await response.json();
+    const text = data.candidates?.[0]?.content?.parts?.map(p => p.text || '').join('') ?? '';
+    if (text) writeCache(key, text);
+    return text;
+  }).finally(() => cache.inFlight.delete(key));
+  cache.inFlight.set(key, pending);
+  return pending;
+}
+
+/** Pipes the SSE stream through to `res` as it arrives and caches the text once complete. */
+function stream(key, model, body, signal, res) {
+  return callUpstream(model, 'streamGenerateContent', body, signal, async (response) => {
+    res.writeHead(200, { 'Content-Type': 'text/event-stream', 'Cache-Control': 'no-store' });
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let text = '';
+    for await (const chunk of response.body) {
+      res.write(chunk);
+      buffer += decoder.decode(chunk, { stream: true });
+      const events = buffer.split(/\r?\n\r?\n/);
+      buffer = events.pop();
+      text += events.map(parseSseEvent).join('');
+    }
+    text += parseSseEvent(buffer + decoder.decode());
+    res.end();
+    if (text) writeCache(key, text);
+  });
+}
+
+// --- Server ---
+async function readBody(req) {
+  const chunks = [];
+  let size = 0;
+  for await (const chunk of req) {
+    size += chunk.length;
+    if (size > config.maxBodyBytes) throw httpError(413, 'Request body too large');
+    chunks.push(chunk);
+  }
+  try {
+    const body = JSON.parse(Buffer.concat(chunks).toString('utf8'));
+    if (!Array.isArray(body.contents)) throw new Error('contents must be an array');
+    return body;
+  } catch (err) {
+    throw httpError(400, `Invalid request body: ${err.message}`);
+  }
+}
+
+async function authenticate(req) {
+  const token = req.headers.authorization?.match(/^Bearer (.+)$/)?.[1];
+  if (!token) throw httpError(401, 'Sign-in required');
+  try {
+    return (await auth.verifyIdToken(token)).uid;
+  } catch (err) {
+    throw httpError(401, 'Invalid ID token');
+  }
+}
+
+function send(res, status, body, headers = {}) {
+  if (res.headersSent) return res.destroy();
+  res.writeHead(status, { 'Content-Type': 'application/json', 'Cache-Control': 'no-store', ...headers });
+  res.end(body);
+}
+
+async function handle(req, res, signal) {
+  const url = new URL(req.url, 'http://proxy');
+  if (req.method === 'GET' && url.pathname === `${config.prefix}/stats`) {
+    return send(res, 200, JSON.stringify({
+      cache: { ...cache.stats, size: cache.entries.size, inFlight: cache.inFlight.size },
+      pool: { active: pool.active, waiting: pool.waiting.length },
+      users: buckets.size
+    }));
+  }
+  const route = url.pathname.startsWith(`${config.prefix}/`) && url.pathname.slice(config.prefix.length).match(ROUTE);
+  if (!route) throw httpError(404, 'Not found');
+  if (req.method !== 'POST') throw httpError(405, 'Method not allowed', { Allow: 'POST' });
+  const [, model, method] = route;
+  if (!config.models.has(model)) throw httpError(404, `Model ${model} is not available`);
+
+  const uid = await authenticate(req);
+  const body = await readBody(req);
+  const key = cacheKey(model, body);
+  const isStream = method === 'streamGenerateContent';
+
+  const cached = readCache(key);
+  if (cached !== undefined) {
+    cache.stats.hits++;
+    return isStream
+      ? send(res, 200, `data: ${envelope(cached)}\n\n`, { 'Content-Type': 'text/event-stream' })
+      : send(res, 200, envelope(cached));
+  }
+  if (isStream || !cache.inFlight.has(key)) {
+    const wait = takeToken(uid);
+    if (wait) throw httpError(429, 'Too many Gemini requests', { 'Retry-After': String(Math.ceil(wait / 1000)) });
+    cache.stats.misses++;
+  }
+  if (isStream) return stream(key, model, body, signal, res);
+  send(res, 200, envelope(await generate(key, model, body, signal)));
+}
+
+const server = http.createServer((req, res) => {
+  if (config.allowedOrigin) {
+    res.setHeader('Access-Control-Allow-Origin', config.allowedOrigin);
+    res.setHeader('Vary', 'Origin');
+    if (req.method === 'OPTIONS') {
+      res.writeHead(204, {
+        'Access-Control-Allow-Methods': 'POST',
+        'Access-Control-Allow-Headers': 'Authorization, Content-Type',
+        'Access-Control-Max-Age': '600'
+      });
+      return res.end();
+    }
+  }
+  // Aborts the queued or upstream call when the visitor goes away
+  const controller = new AbortController();
+  res.on('close', () => { if (!res.writableFinished) controller.abort(); });
+  handle(req, res, controller.signal).catch((err) => {
+    if (controller.signal.aborted) return;
+    if (!err.status) console.error(err);
+    send(res, err.status ?? 500, JSON.stringify({ error: { code: err.status ?? 500, message: err.status ? err.message : 'Internal error' } }), err.headers);
+  });
+});
+
+server.listen(config.port, () => {
+  console.log(`gemini proxy on :${config.port}${config.prefix}${config.stub ? ' (stub model)' : ''}`);
+});
@@ -0,0 +1,66 @@
+/**
+ * A stand-in for the Gemini REST API, shared by the benchmark entry (in-page,
+ * through setGeminiFetch) and by gemini-proxy.mjs in stub mode, so both answer
+ * with the same canned text. Replies follow the request's responseSchema,
+ * keeping any ids from a JSON array at the end of the prompt, which is enough
+ * for the blurb batches and the concept card to parse.
+ */
+export const STUB_TEXT = 'Warm oak and aged brass settle into a quiet, light-filled room.';
+
+const sleep = (ms, signal) => new Promise((resolve, reject) => {
+  if (signal?.aborted) return reject(signal.reason);
+  const timer = setTimeout(resolve, ms);
+  signal?.addEventListener('abort', () => { clearTimeout(timer); reject(signal.reason); }, { once: true });
+});
+
+function stubValue(schema, source = {}) {
+  switch (schema?.type) {
+    case 'OBJECT':
+      return Object.fromEntries(Object.entries(schema.properties).map(([key, s]) => [key, key in source ? source[key] : stubValue(s)]));
+    case 'ARRAY':
+      return (Array.isArray(source) ? source : [{}, {}, {}]).map(item => stubValue(schema.items, item));
+    default:
+      return STUB_TEXT;
+  }
+}
+
+/** The reply text for a generateContent request body. */
+export function stubReply(body) {
+  const schema = body.generationConfig?.responseSchema;
+  if (!schema) return STUB_TEXT;
+  let inputs = {};
+  try {
+    inputs = JSON.parse(body.contents[0].parts[0].text.match(/\[[\s\S]*\]$/)?.[0] ?? '{}');
+  } catch (err) { /* no structured input */ }
+  return JSON.stringify(stubValue(schema, inputs));
+}
+
+/**
+ * A fetch-compatible Gemini stand-in. Each call waits `latency` ms (plus or
+ * minus `jitter` as a fraction), fails with a 503 at `errorRate`, and streams
+ * its reply as `chunks` SSE events `chunkDelay` ms apart.
+ */
+export function createStubGemini({ latency = 400, jitter = 0.25, errorRate = 0, chunks = 6, chunkDelay = 40 } = {}) {
+  const envelope = (text) => JSON.stringify({ candidates: [{ content: { parts: [{ text }] } }] });
+  return async (url, { body, signal } = {}) => {
+    await sleep(latency * (1 + (Math.random() * 2 - 1) * jitter), signal);
+    if (Math.random() < errorRate) return new Response('{"error":{"code":503}}', { status: 503 });
+    const reply = stubReply(JSON.parse(body));
+    if (!url.includes('streamGenerateContent')) {
+      return new Response(envelope(reply), { headers: { 'Content-Type': 'application/json' } });
+    }
+    const size = Math.ceil(reply.length / chunks);
+    const encoder = new TextEncoder();
+    return new Response(new ReadableStream({
+      async start(controller) {
+        try {
+          for (let i = 0; i < reply.length; i += size) {
+            if (i) await sleep(chunkDelay, signal);
+            controller.enqueue(encoder.encode(`data: ${envelope(reply.slice(i, i + size))}\n\n`));
+          }
+          controller.close();
+        } catch (err) { controller.error(err); }
+      }
+    }), { headers: { 'Content-Type': 'text/event-stream' } });
+  };
+}
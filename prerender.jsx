@@ -0,0 +1,43 @@
+/**
+ * Static pre-render entry for app.py. Renders <App /> to HTML from exported
+ * projects and services (JSON arrays, e.g. the Studio Portal's JSON export)
+ * and inlines the same data so client.jsx hydrates against identical state.
+ *
+ *   npx esbuild prerender.jsx --bundle --platform=node --format=esm \
+ *     --loader:.py=jsx --outfile=build/prerender.mjs
+ *   FIREBASE_CONFIG='{"apiKey":"…","projectId":"…"}' APP_ID=sanora-interior-organic \
+ *     node build/prerender.mjs index.html projects.json services.json > dist/index.html
+ *
+ * The template must contain an empty <div id="root"></div>, followed by the
+ * module script that loads build/app/client.js.
+ */
+import { readFileSync } from 'node:fs';
+import React from 'react';
+import { renderToString } from 'react-dom/server';
+
+const [templateFile, projectsFile, servicesFile] = process.argv.slice(2);
+if (!templateFile || !process.env.FIREBASE_CONFIG) {
+  console.error('usage: FIREBASE_CONFIG=<json> [APP_ID=<id>] node prerender.mjs <template.html> [projects.json] [services.json]');
+  process.exit(1);
+}
+
+const readRows = (file) => file ? JSON.parse(readFileSync(file, 'utf8')) : [];
+const data = { projects: readRows(projectsFile), services: readRows(servicesFile) };
+
+// app.py reads these when it is evaluated, so they must exist before the import below
+globalThis.__SANORA_PRERENDER__ = data;
+globalThis.__firebase_config = process.env.FIREBASE_CONFIG;
+if (process.env.APP_ID) globalThis.__app_id = process.env.APP_ID;
+
+const { default: App, prerenderScript } = await import('./app.py');
+
+const ROOT = '<div id="root"></div>';
+const template = readFileSync(templateFile, 'utf8');
+if (!template.includes(ROOT)) {
+  console.error(`${templateFile} has no ${ROOT}`);
+  process.exit(1);
+}
+
+process.stdout.write(template
+  .replace(ROOT, `<div id="root">${renderToString(<App />)}</div>`)
+  .replace('</head>', `${prerenderScript(data)}</head>`));
@@ -0,0 +1,141 @@
+// Emulator tests for the lead analytics rules in firestore.rules. Run with
+//   npm run test:rules
+// which starts the Firestore emulator through `firebase emulators:exec`.
+import { readFileSync } from 'node:fs';
+import { after, before, beforeEach, describe, test } from 'node:test';
+import assert from 'node:assert/strict';
+import { initializeTestEnvironment, assertFails, assertSucceeds } from '@firebase/rules-unit-testing';
+import { doc, getDoc, setDoc, deleteDoc, writeBatch, runTransaction, increment } from 'firebase/firestore';
+
+const APP_ID = 'sanora-interior-organic';
+const NOW = Date.now();
+const TODAY = new Date(NOW).toISOString().slice(0, 10);
+const LAST_WEEK = new Date(NOW - 7 * 24 * 60 * 60 * 1000).toISOString().slice(0, 10);
+
+let env;
+
+const dataDoc = (db, col, id) => doc(db, 'artifacts', APP_ID, 'public', 'data', col, id);
+const visitor = () => env.authenticatedContext('visitor').firestore();
+const staff = () => env.authenticatedContext('staff', { admin: true }).firestore();
+
+const lead = (overrides = {}) => ({
+  name: 'Ada',
+  email: 'ada@example.com',
+  phone: '',
+  message: '',
+  nameLower: 'ada',
+  emailLower: 'ada@example.com',
+  usedConcept: false,
+  timestamp: NOW,
+  ...overrides
+});
+
+// The batch commitLead() in app.py sends: the lead plus +1 on shard 0 of the totals and of its day
+function submitLead(db, id, data, counts = { leads: 1, withConcept: data.usedConcept ? 1 : 0 }, day = TODAY) {
+  const increments = Object.fromEntries(Object.entries(counts).filter(([, n]) => n).map(([field, n]) => [field, increment(n)]));
+  const batch = writeBatch(db);
+  batch.set(dataDoc(db, 'leads', id), data);
+  batch.set(dataDoc(db, 'leadStatsDaily', `${day}_0`), { ...increments, lastLead: id, date: day }, { merge: true });
+  batch.set(dataDoc(db, 'leadStats', '0'), { ...increments, lastLead: id }, { merge: true });
+  return batch.commit();
+}
+
+async function stats(path) {
+  let data;
+  await env.withSecurityRulesDisabled(async (context) => {
+    data = (await getDoc(dataDoc(context.firestore(), ...path))).data();
+  });
+  return data ?? {};
+}
+
+before(async () => {
+  env = await initializeTestEnvironment({
+    projectId: 'demo-sanora',
+    firestore: { rules: readFileSync(new URL('../firestore.rules', import.meta.url), 'utf8') }
+  });
+});
+
+beforeEach(() => env.clearFirestore());
+
+after(() => env.cleanup());
+
+describe('lead counters', () => {
+  test('a new lead counts once', async () => {
+    await assertSucceeds(submitLead(visitor(), 'lead-1', lead({ usedConcept: true })));
+    assert.deepEqual(await stats(['leadStats', '0']), { leads: 1, withConcept: 1, lastLead: 'lead-1' });
+    assert.equal((await stats(['leadStatsDaily', `${TODAY}_0`])).leads, 1);
+  });
+
+  test('a replayed lead is refused', async () => {
+    await assertSucceeds(submitLead(visitor(), 'lead-1', lead()));
+    await assertFails(submitLead(visitor(), 'lead-1', lead()));
+    assert.equal((await stats(['leadStats', '0'])).leads, 1);
+  });
+
+  test('a visit counts exactly +1', async () => {
+    const db = visitor();
+    await assertSucceeds(setDoc(dataDoc(db, 'leadStats', '3'), { visits: increment(1) }, { merge: true }));
+    await assertSucceeds(setDoc(dataDoc(db, 'leadStatsDaily', `${TODAY}_3`), { visits: increment(1), date: TODAY }, { merge: true }));
+    await assertFails(setDoc(dataDoc(db, 'leadStats', '3'), { visits: increment(2) }, { merge: true }));
+    await assertFails(setDoc(dataDoc(db, 'leadStatsDaily', `${LAST_WEEK}_3`), { visits: increment(1), date: LAST_WEEK }, { merge: true }));
+    assert.equal((await stats(['leadStats', '3'])).visits, 1);
+  });
+
+  test('forged deltas are rejected', async () => {
+    const db = visitor();
+    // more than the lead is worth
+    await assertFails(submitLead(db, 'lead-1', lead(), { leads: 2 }));
+    // a concept-assisted count for a lead that did not use the concept
+    await assertFails(submitLead(db, 'lead-2', lead(), { leads: 1, withConcept: 1 }));
+    // the lead counted on a day other than its own
+    await assertFails(submitLead(db, 'lead-3', lead(), undefined, LAST_WEEK));
+    // an increment naming a lead that the batch does not write
+    await assertFails(setDoc(dataDoc(db, 'leadStats', '0'), { leads: increment(1), lastLead: 'nobody' }, { merge: true }));
+    // a shard outside STATS_SHARDS
+    await assertFails(setDoc(dataDoc(db, 'leadStats', '9'), { visits: increment(1) }, { merge: true }));
+    assert.deepEqual(await stats(['leadStats', '0']), {});
+  });
+
+  test('removing a lead through the portal takes exactly it off the counters', async () => {
+    await assertSucceeds(submitLead(visitor(), 'lead-1', lead({ usedConcept: true })));
+    const db = visitor();
+    const remove = (counts) => runTransaction(db, async (tx) => {
+      tx.delete(dataDoc(db, 'leads', 'lead-1'));
+      tx.set(dataDoc(db, 'leadStats', '5'), { ...counts, lastLead: 'lead-1' }, { merge: true });
+    });
+    await assertFails(remove({ leads: increment(-2), withConcept: increment(-1) }));
+    await assertSucceeds(remove({ leads: increment(-1), withConcept: increment(-1) }));
+  });
+
+  test('replacing a lead moves only the changed counts', async () => {
+    await assertSucceeds(submitLead(visitor(), 'lead-1', lead()));
+    const db = visitor();
+    const replace = (counts) => runTransaction(db, async (tx) => {
+      tx.set(dataDoc(db, 'leads', 'lead-1'), lead({ usedConcept: true }));
+      tx.set(dataDoc(db, 'leadStats', '2'), { ...counts, lastLead: 'lead-1' }, { merge: true });
+    });
+    await assertFails(replace({ leads: increment(1), withConcept: increment(1) }));
+    await assertSucceeds(replace({ withConcept: increment(1) }));
+  });
+
+  test('staff may repair the counters directly', async () => {
+    await assertSucceeds(setDoc(dataDoc(staff(), 'leadStats', '0'), { leads: 42 }));
+  });
+});
+
+describe('Studio Portal access', () => {
+  test('any signed-in session manages projects and leads', async () => {
+    const db = visitor();
+    await assertSucceeds(setDoc(dataDoc(db, 'projects', 'p1'), { name: 'Loft', location: 'Oslo, NO' }));
+    await assertSucceeds(submitLead(db, 'lead-1', lead()));
+    await assertSucceeds(getDoc(dataDoc(db, 'leads', 'lead-1')));
+    await assertSucceeds(deleteDoc(dataDoc(db, 'projects', 'p1')));
+  });
+
+  test('signed-out requests can only read the public collections', async () => {
+    const db = env.unauthenticatedContext().firestore();
+    await assertSucceeds(getDoc(dataDoc(db, 'projects', 'p1')));
+    await assertFails(setDoc(dataDoc(db, 'projects', 'p1'), { name: 'Loft' }));
+    await assertFails(getDoc(dataDoc(db, 'leads', 'lead-1')));
+  });
+});